@@ -1,148 +1,99 @@
 """
 Performance benchmarking for hypergeometric product formula.
 
-Compares complexity and timing of the product formula vs alternatives.
+Runs the scaling sweeps of su2_3nj_closedform.benchmark (edge count, spin
+magnitude, precision), appends the run to a versioned JSON history and
+compares it against the previous run. Exits with status 1 if any point
+regressed, so the script can gate CI.
 """
 
-import time
+import argparse
 import json
 import os
+import sys
 from pathlib import Path
-import mpmath as mp
-from su2_3nj_closedform import calculate_3nj, build_rhos
-
-
-def benchmark_configuration(j, rhos, precision=50, num_trials=5):
-    """
-    Benchmark a single spin configuration.
-    
-    Returns:
-        dict with timing statistics
-    """
-    mp.mp.dps = precision
-    
-    times = []
-    for _ in range(num_trials):
-        start = time.perf_counter()
-        result = calculate_3nj(j, rhos, precision)
-        elapsed = time.perf_counter() - start
-        times.append(elapsed)
-    
-    return {
-        "mean_time_ms": sum(times) / len(times) * 1000,
-        "min_time_ms": min(times) * 1000,
-        "max_time_ms": max(times) * 1000,
-        "num_trials": num_trials,
-    }
-
-
-def complexity_analysis():
-    """
-    Analyze computational complexity by varying problem size.
-    """
-    results = {
-        "metadata": {
-            "precision": 50,
-            "num_trials_per_config": 5,
-            "description": "Timing analysis for varying edge counts and spin magnitudes"
-        },
-        "edge_count_scaling": [],
-        "spin_magnitude_scaling": []
-    }
-    
-    print("Analyzing complexity scaling...")
-    print("=" * 60)
-    
-    # Test 1: Vary edge count (problem size)
-    print("\n1. Edge Count Scaling (uniform j=1)")
-    for edge_count in [3, 5, 7, 9, 11]:
-        j = [1] * edge_count
-        rhos = build_rhos(edge_count)
-        
-        bench = benchmark_configuration(j, rhos)
-        results["edge_count_scaling"].append({
-            "edge_count": edge_count,
-            "j": j,
-            **bench
-        })
-        print(f"  Edge count {edge_count:2d}: {bench['mean_time_ms']:.2f} ms")
-    
-    # Test 2: Vary spin magnitude (fixed edge count)
-    print("\n2. Spin Magnitude Scaling (edge_count=7)")
-    edge_count = 7
-    rhos = build_rhos(edge_count)
-    
-    for max_j in [1, 2, 5, 10, 15]:
-        j = [max_j] * edge_count
-        
-        bench = benchmark_configuration(j, rhos)
-        results["spin_magnitude_scaling"].append({
-            "max_j": max_j,
-            "j": j,
-            **bench
-        })
-        print(f"  Max j = {max_j:2d}: {bench['mean_time_ms']:.2f} ms")
-    
-    print("\n" + "=" * 60)
-    
-    return results
-
-
-def save_benchmark_results(results, output_path):
-    """Save benchmark results to JSON."""
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w') as f:
-        json.dump(results, f, indent=2)
-    print(f"\nBenchmark results saved to: {output_path}")
+from su2_3nj_closedform.benchmark import append_history, compare_runs, load_history, run_suite
 
 
-def print_complexity_summary(results):
-    """Print summary of complexity analysis."""
+def print_summary(results):
+    """Print per-point medians and fitted exponents."""
     print("\n" + "=" * 60)
     print("COMPLEXITY SUMMARY")
     print("=" * 60)
-    
-    # Edge count scaling
-    edge_data = results["edge_count_scaling"]
-    if len(edge_data) >= 2:
-        ratio = edge_data[-1]["mean_time_ms"] / edge_data[0]["mean_time_ms"]
-        size_ratio = edge_data[-1]["edge_count"] / edge_data[0]["edge_count"]
-        print(f"\nEdge Count Scaling:")
-        print(f"  {edge_data[-1]['edge_count']}/{edge_data[0]['edge_count']}x size → {ratio:.1f}x time")
-        print(f"  Approximate complexity: O(n^{(ratio**.5):.1f}) or better")
-    
-    # Spin magnitude scaling
-    spin_data = results["spin_magnitude_scaling"]
-    if len(spin_data) >= 2:
-        ratio = spin_data[-1]["mean_time_ms"] / spin_data[0]["mean_time_ms"]
-        mag_ratio = spin_data[-1]["max_j"] / spin_data[0]["max_j"]
-        print(f"\nSpin Magnitude Scaling:")
-        print(f"  {spin_data[-1]['max_j']}/{spin_data[0]['max_j']}x spin → {ratio:.1f}x time")
-        print(f"  Hypergeometric evaluation dominates (mpmath complexity)")
-    
-    print("\nNote: Hypergeometric product formula is efficient for")
-    print("      moderate spins. For very large spins, asymptotic")
-    print("      methods may be preferred.")
+
+    for sweep in results["sweeps"]:
+        print(f"\n{sweep['name']} (time ~ {sweep['parameter']}^{sweep['exponent']:.2f}):")
+        for point in sweep["points"]:
+            print(
+                f"  {sweep['parameter']} = {point[sweep['parameter']]:>4}: "
+                f"median {point['median'] * 1e3:8.3f} ms, "
+                f"IQR {(point['q3'] - point['q1']) * 1e3:7.3f} ms "
+                f"({point['samples']} x {point['loops']})"
+            )
     print("=" * 60)
 
 
+def print_regressions(regressions, threshold):
+    """Print the comparator's findings."""
+    if not regressions:
+        print(f"\nNo regressions beyond {threshold:.0%} against the previous run.")
+        return
+    print(f"\n{len(regressions)} regression(s) beyond {threshold:.0%}:")
+    for r in regressions:
+        print(
+            f"  {r['sweep']}: {r['parameter']} = {r['value']}: "
+            f"{r['baseline'] * 1e3:.3f} ms -> {r['current'] * 1e3:.3f} ms ({r['ratio']:.2f}x)"
+        )
+
+
 def main():
     """Run complete performance benchmark suite."""
     base_dir = Path(__file__).parent.parent
-    output_path = base_dir / "data" / "benchmarks" / "performance_analysis.json"
-    
+    bench_dir = base_dir / "data" / "benchmarks"
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--history", default=str(bench_dir / "history.json"),
+                        help="JSON history the run is appended to")
+    parser.add_argument("--output", default=str(bench_dir / "performance_analysis.json"),
+                        help="file receiving the latest run on its own")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="relative median slowdown reported as a regression")
+    parser.add_argument("--budget", type=float, default=0.2,
+                        help="seconds of sampling per benchmark point")
+    parser.add_argument("--quick", action="store_true",
+                        help="short sweeps for smoke testing")
+    parser.add_argument("--no-record", action="store_true",
+                        help="compare against the history without appending to it")
+    args = parser.parse_args()
+
     print("SU(2) 3nj Hypergeometric Product Formula")
     print("Performance Benchmark Suite")
-    
-    # Run complexity analysis
-    results = complexity_analysis()
-    
-    # Save results
-    save_benchmark_results(results, output_path)
-    
-    # Print summary
-    print_complexity_summary(results)
+
+    sweeps = {}
+    if args.quick:
+        sweeps = {"edge_counts": (3, 7, 11), "spins": (1, 5, 10), "precisions": (15, 50, 100)}
+    results = run_suite(budget=args.budget, **sweeps)
+    print_summary(results)
+
+    if args.no_record:
+        history = load_history(args.history)
+        history["runs"].append(results)
+    else:
+        history = append_history(args.history, results)
+        os.makedirs(os.path.dirname(args.output), exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBenchmark results saved to: {args.output}")
+        print(f"History ({len(history['runs'])} runs): {args.history}")
+
+    if len(history["runs"]) < 2:
+        print("\nNo baseline run to compare against yet.")
+        return 0
+
+    regressions = compare_runs(history["runs"][-2], results, args.threshold)
+    print_regressions(regressions, args.threshold)
+    return 1 if regressions else 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
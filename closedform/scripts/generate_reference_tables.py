@@ -5,6 +5,8 @@ This script produces versioned datasets of 3nj symbol values that can be
 used in the LaTeX paper and for regression testing.
 """
 
+import argparse
+import itertools
 import json
 import os
 from pathlib import Path
@@ -86,7 +88,7 @@ def generate_symmetry_table(output_path, edge_count=7, precision=50):
         edge_count: Number of edges
         precision: Decimal precision
     """
-    from su2_3nj_closedform import check_reflection_symmetry
+    from su2_3nj_closedform import FactorCache, check_reflection_symmetry
     
     test_cases = [
         [0, 1, 2, 3, 4, 5, 6],
@@ -106,8 +108,11 @@ def generate_symmetry_table(output_path, edge_count=7, precision=50):
         "symmetry_checks": []
     }
     
+    # Each check evaluates j and its reverse, which share every factor;
+    # palindromes are settled without evaluating anything.
+    cache = FactorCache()
     for j in test_cases:
-        is_symmetric, diff = check_reflection_symmetry(j, precision=precision)
+        is_symmetric, diff = check_reflection_symmetry(j, precision=precision, cache=cache)
         
         results["symmetry_checks"].append({
             "j": j,
@@ -127,11 +132,111 @@ def generate_symmetry_table(output_path, edge_count=7, precision=50):
     return results
 
 
+def _spin_grid(max_spin):
+    """Spins 0, 1/2, ..., max_spin."""
+    return [n / 2 for n in range(int(2 * max_spin) + 1)]
+
+
+def generate_reference_sweep(output_path, max_spin, edge_count=7, precision=50, chunk_size=256):
+    """
+    Stream 3nj values over the full spin grid to a resumable JSON Lines table.
+    
+    Rerunning after an interruption continues from the last checkpoint.
+    
+    Parameters:
+        output_path: Path of the JSON Lines file
+        max_spin: Largest spin on each edge (grid step 1/2)
+        edge_count: Number of edges
+        precision: Decimal precision for calculations
+        chunk_size: Rows written between checkpoints
+    """
+    from su2_3nj_closedform import FactorCache
+    from su2_3nj_closedform.streaming import stream_table
+    
+    rhos = build_rhos(edge_count)
+    spins = _spin_grid(max_spin)
+    cache = FactorCache()
+    
+    def evaluate(j):
+        value = calculate_3nj(list(j), rhos, precision, cache=cache)
+        return {"j": list(j), "value": str(value), "value_float": float(value)}
+    
+    metadata = {
+        "edge_count": edge_count,
+        "precision": precision,
+        "rhos": [float(r) for r in rhos],
+        "max_spin": max_spin,
+        "version": "1.0",
+        "generator": "su2_3nj_closedform.generate_reference_sweep"
+    }
+    total = stream_table(
+        str(output_path), itertools.product(spins, repeat=edge_count), evaluate,
+        metadata=metadata, chunk_size=chunk_size,
+    )
+    
+    print(f"Generated reference sweep: {output_path}")
+    print(f"  {total} entries")
+    return total
+
+
+def generate_symmetry_sweep(output_path, max_spin, edge_count=7, precision=50, chunk_size=256):
+    """
+    Stream reflection-symmetry checks over the spin grid to a resumable table.
+    
+    One row is written per reflection class {j, reverse(j)}.
+    
+    Parameters:
+        output_path: Path of the JSON Lines file
+        max_spin: Largest spin on each edge (grid step 1/2)
+        edge_count: Number of edges
+        precision: Decimal precision
+        chunk_size: Rows written between checkpoints
+    """
+    from su2_3nj_closedform import FactorCache, check_reflection_symmetry, iter_reflection_classes
+    from su2_3nj_closedform.streaming import stream_table
+    
+    cache = FactorCache()
+    
+    def evaluate(j):
+        j = list(j)
+        is_symmetric, diff = check_reflection_symmetry(j, precision=precision, cache=cache)
+        return {
+            "j": j,
+            "is_symmetric": bool(is_symmetric),
+            "difference": str(diff),
+            "difference_float": float(diff),
+            "is_palindromic": j == j[::-1]
+        }
+    
+    metadata = {
+        "edge_count": edge_count,
+        "precision": precision,
+        "tolerance": 1e-8,
+        "max_spin": max_spin,
+        "version": "1.0"
+    }
+    total = stream_table(
+        str(output_path), iter_reflection_classes(_spin_grid(max_spin), edge_count), evaluate,
+        metadata=metadata, chunk_size=chunk_size,
+    )
+    
+    print(f"Generated symmetry sweep: {output_path}")
+    print(f"  {total} reflection classes")
+    return total
+
+
 def main():
     """Generate all reference tables for paper inclusion."""
     base_dir = Path(__file__).parent.parent
     data_dir = base_dir / "data" / "reference"
     
+    parser = argparse.ArgumentParser(description="Generate 3nj reference tables.")
+    parser.add_argument("--sweep-max-spin", type=float, default=None,
+                        help="also stream full-grid sweeps up to this spin (resumable)")
+    parser.add_argument("--chunk-size", type=int, default=256,
+                        help="rows written between checkpoints in sweeps")
+    args = parser.parse_args()
+    
     print("Generating deterministic reference tables...")
     print("=" * 60)
     
@@ -145,6 +250,16 @@ def main():
     sym_path = data_dir / "reflection_symmetry_table.json"
     generate_symmetry_table(sym_path, edge_count=7, precision=50)
     
+    if args.sweep_max_spin is not None:
+        print()
+        generate_reference_sweep(
+            data_dir / "3nj_reference_sweep.jsonl", args.sweep_max_spin, chunk_size=args.chunk_size
+        )
+        print()
+        generate_symmetry_sweep(
+            data_dir / "reflection_symmetry_sweep.jsonl", args.sweep_max_spin, chunk_size=args.chunk_size
+        )
+    
     print()
     print("=" * 60)
     print("All tables generated successfully!")
@@ -4,11 +4,57 @@ Closed-form hypergeometric product formula for SU(2) 3nj recoupling coefficients
 
 __version__ = "0.1.0"
 
-from .coefficient_calculator import calculate_3nj, build_rhos
-from .symmetry import check_reflection_symmetry
+from .coefficient_calculator import (
+    calculate_3nj,
+    build_rhos,
+    edge_factor,
+    edge_factor_asymptotic,
+    edge_factor_exact,
+    get_context,
+    log_calculate_3nj,
+)
+from .symmetry import (
+    SymmetryScan,
+    check_reflection_symmetry,
+    iter_reflection_classes,
+    scan_reflection_symmetry,
+)
+from .cache import CacheInfo, FactorCache
+from .tabulate import tabulate_factors
+from .evaluator import ChainEvaluator
+from .batch import BatchResult, calculate_3nj_batch, calculate_3nj_threaded
+from .graphs import relabel_graph_key, graph_rhos, matching_count
+from .grid import evaluate_grid, grid_point, grid_size
+from .tensor import FactorizedGrid
+from .streaming import read_table, read_table_metadata, stream_table
 
 __all__ = [
     "calculate_3nj",
     "build_rhos",
+    "edge_factor",
+    "edge_factor_asymptotic",
+    "edge_factor_exact",
+    "get_context",
+    "log_calculate_3nj",
     "check_reflection_symmetry",
+    "SymmetryScan",
+    "iter_reflection_classes",
+    "scan_reflection_symmetry",
+    "tabulate_factors",
+    "CacheInfo",
+    "FactorCache",
+    "ChainEvaluator",
+    "BatchResult",
+    "calculate_3nj_batch",
+    "calculate_3nj_threaded",
+    "relabel_graph_key",
+    "graph_rhos",
+    "matching_count",
+    "evaluate_grid",
+    "grid_point",
+    "grid_size",
+    "FactorizedGrid",
+    "stream_table",
+    "read_table",
+    "read_table_metadata",
 ]
@@ -0,0 +1,76 @@
+"""
+Large-spin asymptotic expansion of the edge factor 2F1(-n, 1/2; 1; -rho) / n!.
+
+For rho > 0 the Laplace-type integral
+
+    F_n = (1 + rho)^n / pi * int_0^1 (1 - c t)^n t^(-1/2) (1 - t)^(-1/2) dt,
+    c = rho / (1 + rho),
+
+is expanded with (1 - t)^(-1/2) = sum_k a_k t^k, a_k = C(2k, k) / 4^k.
+Integrating term by term over [0, 1/c] gives
+
+    F_n / n! ~ (1 + rho)^n / pi * sum_{k<K} a_k c^(-k-1/2) Gamma(k+1/2) / Gamma(n+k+3/2),
+
+whose terms shrink roughly like k! / (n c)^k, so a fixed number of terms
+reaches a given precision independently of n.
+
+Rigorous bound on the error of the integral I_n (with n! factored out in
+the code), using 0 <= a_{K+m} <= a_m and (1 - ct)^n <= exp(-n c t):
+
+  * extending each term from [0, 1] to [0, 1/c] adds at most
+    a_k c^(-k-1) (1 - c)^(n+1) / (n+1);
+  * the series remainder is at most t^K (1 - t)^(-1/2); on [0, 1/2] it
+    contributes at most sqrt(2) Gamma(K+1/2) / (n c)^(K+1/2), on [1/2, 1]
+    at most 2 (1 - c/2)^n.
+"""
+
+
+def asymptotic_series(ctx, n, rho, rtol, max_terms=200):
+    """
+    Evaluate the asymptotic expansion of 2F1(-n, 1/2; 1; -rho) / n!.
+
+    Parameters:
+        ctx: mpmath context carrying the working precision
+        n: Twice-spin 2j (positive integer)
+        rho: Positive rho parameter (ctx.mpf)
+        rtol: Target relative error
+        max_terms: Largest number of series terms to try
+
+    Returns:
+        Tuple (value, relative_error_bound), or None if the bound cannot
+        reach rtol (rho not positive, or n c too small for the expansion)
+    """
+    if n <= 0 or not rho > 0:
+        return None
+
+    c = rho / (1 + rho)
+    nc = n * c
+    sqrt2 = ctx.sqrt(2)
+
+    # term_k = a_k c^(-k-1/2) Gamma(k+1/2) / Gamma(n+k+3/2)
+    term = ctx.sqrt(ctx.pi / c) * ctx.rgamma(n + ctx.mpf(3) / 2)
+    # tail_k = a_k c^(-k-1) (1-c)^(n+1) / (n+1) / n!, shares the a_k c^-k factor
+    tail_scale = ctx.power(1 - c, n + 1) / (c * (n + 1)) * ctx.rgamma(n + 1)
+    a_over_ck = ctx.mpf(1)
+    # remainder_K = sqrt(2) Gamma(K+1/2) / (n c)^(K+1/2) / n!, starting at K = 1
+    remainder = sqrt2 * ctx.gamma(ctx.mpf(3) / 2) / ctx.power(nc, ctx.mpf(3) / 2) * ctx.rgamma(n + 1)
+    floor = 2 * ctx.power(1 - c / 2, n) * ctx.rgamma(n + 1)
+
+    total = ctx.mpf(0)
+    tail = ctx.mpf(0)
+    for k in range(max_terms):
+        total += term
+        tail += a_over_ck * tail_scale
+        bound = (tail + remainder + floor) / (total - tail - remainder - floor)
+        if 0 < bound <= rtol:
+            return ctx.power(1 + rho, n) * total / ctx.pi, bound
+
+        # Past k ~ n c the remainder grows again: the expansion cannot do better.
+        kk = k + 1
+        if kk + ctx.mpf(1) / 2 > nc:
+            return None
+        ratio = ctx.mpf((2 * kk - 1) ** 2) / (4 * kk)
+        term *= ratio / (c * (n + kk + ctx.mpf(1) / 2))
+        a_over_ck *= ctx.mpf(2 * kk - 1) / (2 * kk) / c
+        remainder *= (kk + ctx.mpf(1) / 2) / nc
+    return None
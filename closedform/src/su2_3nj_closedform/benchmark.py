@@ -0,0 +1,254 @@
+"""
+Statistical benchmark harness for the chain product formula.
+
+Timings are taken after a warm-up, with the inner loop count calibrated so
+each sample is well above timer resolution and the number of samples
+adapted to a time budget. Samples are summarised by median and
+interquartile range, which are robust to scheduler noise. Scaling sweeps
+over edge count, spin magnitude and precision are fitted to power laws.
+Runs are appended to a versioned JSON history so that a new run can be
+compared against a baseline to flag regressions automatically.
+"""
+
+import json
+import os
+import platform
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+
+import mpmath as mp
+import numpy as np
+
+from .coefficient_calculator import build_rhos, calculate_3nj
+
+
+HISTORY_SCHEMA = 1
+
+
+@dataclass(frozen=True)
+class TimingStats:
+    """
+    Summary of repeated timings of one call, in seconds per call.
+
+    Attributes:
+        median: Median time per call
+        q1: First quartile
+        q3: Third quartile
+        samples: Number of samples taken
+        loops: Calls per sample
+    """
+
+    median: float
+    q1: float
+    q3: float
+    samples: int
+    loops: int
+
+    @property
+    def iqr(self):
+        """Interquartile range q3 - q1."""
+        return self.q3 - self.q1
+
+
+def time_call(fn, *args, warmup=2, min_sample_time=1e-3, budget=0.2, min_samples=5, max_samples=200, **kwargs):
+    """
+    Time fn(*args, **kwargs) with warm-up and adaptive repeat counts.
+
+    Parameters:
+        fn: Callable to time
+        warmup: Untimed calls made first
+        min_sample_time: Each sample loops fn until it lasts at least this long
+        budget: Stop sampling once this many seconds have been spent
+            (after min_samples samples)
+        min_samples: Minimum number of samples
+        max_samples: Maximum number of samples
+
+    Returns:
+        TimingStats
+    """
+    for _ in range(warmup):
+        fn(*args, **kwargs)
+
+    # Calibrate the loop count by doubling until one sample is long enough.
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_sample_time or loops >= 1 << 20:
+            break
+        loops *= 2
+
+    samples = [elapsed / loops]
+    spent = elapsed
+    while len(samples) < max_samples and (len(samples) < min_samples or spent < budget):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        samples.append(elapsed / loops)
+        spent += elapsed
+
+    q1, median, q3 = np.percentile(samples, [25, 50, 75])
+    return TimingStats(float(median), float(q1), float(q3), len(samples), loops)
+
+
+def fit_exponent(sizes, times):
+    """
+    Fit times ~ C * sizes**p by least squares in log-log space.
+
+    Parameters:
+        sizes: Problem sizes (positive)
+        times: Corresponding times (positive)
+
+    Returns:
+        Tuple (p, C)
+    """
+    if len(sizes) != len(times):
+        raise ValueError(f"Length mismatch: sizes has {len(sizes)} elements, times has {len(times)}")
+    if len(sizes) < 2:
+        raise ValueError("At least two points are needed to fit an exponent")
+    slope, intercept = np.polyfit(np.log(sizes), np.log(times), 1)
+    return float(slope), float(np.exp(intercept))
+
+
+def _sweep(name, parameter, points, make_call, **timing):
+    """Time make_call(x) for each x in points and fit the scaling exponent."""
+    rows = []
+    for x in points:
+        fn, args, kwargs = make_call(x)
+        stats = time_call(fn, *args, **timing, **kwargs)
+        rows.append({parameter: x, **asdict(stats)})
+    exponent, prefactor = fit_exponent([r[parameter] for r in rows], [r["median"] for r in rows])
+    return {
+        "name": name,
+        "parameter": parameter,
+        "points": rows,
+        "exponent": exponent,
+        "prefactor": prefactor,
+    }
+
+
+def run_suite(
+    edge_counts=(3, 5, 7, 9, 11, 15),
+    spins=(1, 2, 5, 10, 15, 20),
+    precisions=(15, 30, 50, 100, 200),
+    **timing,
+):
+    """
+    Run the standard scaling sweeps for calculate_3nj.
+
+    Parameters:
+        edge_counts: Edge counts for the edge sweep (uniform j = 1, 50 digits)
+        spins: Uniform spins for the spin sweep (7 edges, 50 digits)
+        precisions: Decimal precisions for the precision sweep (7 edges, j = 5)
+        **timing: Keyword arguments forwarded to time_call
+
+    Returns:
+        dict with "metadata" and a "sweeps" list, one entry per sweep
+    """
+    rhos7 = build_rhos(7)
+
+    def edge_call(n):
+        return calculate_3nj, ([1] * n, build_rhos(n), 50), {}
+
+    def spin_call(j):
+        return calculate_3nj, ([j] * 7, rhos7, 50), {}
+
+    def precision_call(p):
+        return calculate_3nj, ([5] * 7, rhos7, p), {}
+
+    sweeps = [
+        _sweep("edge_count", "edge_count", list(edge_counts), edge_call, **timing),
+        _sweep("spin_magnitude", "j", list(spins), spin_call, **timing),
+        _sweep("precision", "precision", list(precisions), precision_call, **timing),
+    ]
+    return {"metadata": _metadata(), "sweeps": sweeps}
+
+
+def _metadata():
+    from . import __version__
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "package_version": __version__,
+        "python": platform.python_version(),
+        "mpmath": mp.__version__,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "node": platform.node(),
+    }
+
+
+def load_history(path):
+    """
+    Load a benchmark history file.
+
+    Returns:
+        dict with "schema" and "runs"; an empty history if path is missing
+    """
+    if not os.path.exists(path):
+        return {"schema": HISTORY_SCHEMA, "runs": []}
+    with open(path) as f:
+        history = json.load(f)
+    if history.get("schema") != HISTORY_SCHEMA:
+        raise ValueError(f"Unsupported benchmark history schema: {history.get('schema')}")
+    return history
+
+
+def append_history(path, run):
+    """Append a run from run_suite to the history file at path, creating it if needed."""
+    history = load_history(path)
+    history["runs"].append(run)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(history, f, indent=2)
+    os.replace(tmp, path)
+    return history
+
+
+def compare_runs(baseline, current, threshold=0.25):
+    """
+    Compare two runs point by point and report slowdowns.
+
+    A point regresses when its median grows by more than `threshold`
+    (relative) and the two interquartile ranges do not overlap, so that a
+    noisy measurement alone does not trigger a report.
+
+    Parameters:
+        baseline: Run dict from run_suite (e.g. history["runs"][-2])
+        current: Run dict to check
+        threshold: Allowed relative slowdown of the median
+
+    Returns:
+        List of dicts (sweep, parameter, value, baseline, current, ratio),
+        one per regressed point
+    """
+    base_points = {}
+    for sweep in baseline["sweeps"]:
+        for point in sweep["points"]:
+            base_points[(sweep["name"], point[sweep["parameter"]])] = point
+
+    regressions = []
+    for sweep in current["sweeps"]:
+        for point in sweep["points"]:
+            key = (sweep["name"], point[sweep["parameter"]])
+            base = base_points.get(key)
+            if base is None:
+                continue
+            ratio = point["median"] / base["median"]
+            if ratio > 1 + threshold and point["q1"] > base["q3"]:
+                regressions.append({
+                    "sweep": sweep["name"],
+                    "parameter": sweep["parameter"],
+                    "value": key[1],
+                    "baseline": base["median"],
+                    "current": point["median"],
+                    "ratio": ratio,
+                })
+    return regressions
@@ -0,0 +1,125 @@
+"""
+Bounded LRU cache for the per-edge factors of the product formula.
+
+Each factor 2F1(-2j, 1/2; 1; -rho) / (2j)! depends only on the twice-spin,
+the edge's rho and the working precision, so sweeps over a spin grid reuse
+a small set of factors. Passing a FactorCache to calculate_3nj reduces each
+edge to one cache lookup and one multiplication after warm-up.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+
+from .coefficient_calculator import edge_factor, edge_factor_exact
+from .tabulate import tabulate_factors
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class FactorCache:
+    """
+    LRU cache of edge factors keyed on (2j, rho, precision).
+
+    The cache is safe to share between threads.
+
+    Parameters:
+        maxsize: Maximum number of factors kept before the least recently
+            used entry is evicted
+    """
+
+    def __init__(self, maxsize=4096):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def factor(self, twoj, rho, precision=50):
+        """
+        Return the edge factor for (2j, rho, precision), computing it on a miss.
+
+        Parameters:
+            twoj: Twice the edge spin, 2j
+            rho: Rho parameter of the edge
+            precision: Decimal precision for mpmath calculations, or None
+                for the exact rational factor
+
+        Returns:
+            mpmath.mpf value of the factor (fractions.Fraction if precision
+            is None)
+        """
+        key = (twoj, rho, precision)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+            self._misses += 1
+
+        if precision is None:
+            value = edge_factor_exact(twoj, rho)
+        else:
+            value = edge_factor(twoj, rho, precision)
+
+        self._store(key, value)
+        return value
+
+    def _store(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def prefill(self, rhos, twoj_max, precision=50):
+        """
+        Fill the cache with a dense per-edge table for 2j = 0..twoj_max.
+
+        Floating-point rows are produced by one O(twoj_max) contiguous
+        recurrence sweep per distinct rho (see tabulate_factors), checked
+        against direct evaluation.
+
+        Parameters:
+            rhos: Rho parameters, one per edge
+            twoj_max: Largest twice-spin to tabulate
+            precision: Decimal precision for mpmath calculations
+
+        Returns:
+            List of per-edge lists, table[e][n] being the factor for 2j = n
+        """
+        distinct = len(set(rhos)) * (twoj_max + 1)
+        if distinct > self.maxsize:
+            raise ValueError(
+                f"Table needs {distinct} entries but cache maxsize is {self.maxsize}"
+            )
+        rows = {}
+        for rho in rhos:
+            if rho in rows:
+                continue
+            if precision is None:
+                row = [edge_factor_exact(twoj, rho) for twoj in range(twoj_max + 1)]
+            else:
+                row = tabulate_factors(rho, twoj_max, backend="mpmath", precision=precision, check=True)
+            for twoj, value in enumerate(row):
+                self._store((twoj, rho, precision), value)
+            rows[rho] = row
+        return [list(rows[rho]) for rho in rhos]
+
+    def info(self):
+        """Return hit/miss statistics as a CacheInfo named tuple."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        """Drop all cached factors and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self):
+        return len(self._entries)
@@ -2,34 +2,251 @@
 Coefficient calculator for 3nj symbols using hypergeometric product formula.
 """
 
+import threading
+from fractions import Fraction
+from functools import lru_cache
+from math import factorial, lgamma
+
 import mpmath as mp
+import numpy as np
+
+from .asymptotic import asymptotic_series
+
+
+_local = threading.local()
+
+# edge_factor tries the large-spin expansion first from this twice-spin on.
+ASYMPTOTIC_THRESHOLD = 2000
+
+
+def get_context(precision=50):
+    """
+    Return an mpmath context working at the given decimal precision.
+    
+    Contexts are private to the calling thread and cached per precision, so
+    concurrent evaluations at different precisions never touch the shared
+    global mp.mp context.
+    
+    Parameters:
+        precision: Decimal precision of the context
+        
+    Returns:
+        mpmath.MPContext with dps set to `precision`
+    """
+    contexts = getattr(_local, "contexts", None)
+    if contexts is None:
+        contexts = _local.contexts = {}
+    
+    ctx = contexts.get(precision)
+    if ctx is None:
+        ctx = mp.MPContext()
+        ctx.dps = precision
+        contexts[precision] = ctx
+    return ctx
+
+
+def to_mpf(ctx, x):
+    """Convert x to an mpf of ctx, accepting fractions.Fraction exactly."""
+    if isinstance(x, Fraction):
+        return ctx.mpf(x.numerator) / x.denominator
+    return ctx.mpf(x)
+
+
+def _fib_pair(n):
+    """Return (F_n, F_{n+1}) by fast doubling."""
+    if n == 0:
+        return 0, 1
+    a, b = _fib_pair(n >> 1)
+    c = a * (2 * b - a)
+    d = a * a + b * b
+    if n & 1:
+        return d, c + d
+    return c, d
 
 
 def fib(n):
-    """Compute nth Fibonacci number."""
-    a, b = 0, 1
-    for _ in range(n):
+    """Compute nth Fibonacci number (fast doubling, O(log n) multiplications)."""
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    return _fib_pair(n)[0]
+
+
+@lru_cache(maxsize=None)
+def _fib_ratio_limit():
+    """
+    Return (K, r) such that float(F_k / F_{k+1}) == r for every k >= K.
+    
+    The ratios F_k / F_{k+1} (k >= 1) alternate around 1/phi with shrinking
+    distance, so once two consecutive ratios round to the same float every
+    later ratio, lying between them, rounds to that float as well.
+    """
+    k, a, b = 1, 1, 1
+    prev = a / b
+    while True:
+        a, b = b, a + b
+        k += 1
+        curr = a / b
+        if curr == prev:
+            return k - 1, curr
+        prev = curr
+
+
+def fib_ratio(k, exact=False):
+    """
+    Return the Fibonacci ratio F_k / F_{k+1}.
+    
+    Parameters:
+        k: Non-negative index
+        exact: If True, return a fractions.Fraction
+        
+    Returns:
+        Correctly rounded float (O(1) once the ratio has converged in
+        float64), or the exact Fraction
+    """
+    if exact:
+        a, b = _fib_pair(k)
+        return Fraction(a, b)
+    
+    limit_k, limit = _fib_ratio_limit()
+    if k >= limit_k:
+        return limit
+    a, b = _fib_pair(k)
+    return a / b
+
+
+@lru_cache(maxsize=16)
+def _chain_rhos(edge_count, exact):
+    """Memoized Fibonacci rho sequence F_{n+2-e} / F_{n+3-e}, e = 1..n."""
+    if not exact:
+        return tuple(fib_ratio(edge_count + 2 - e) for e in range(1, edge_count + 1))
+    
+    # Walk F_2, F_3, ... once instead of recomputing each pair.
+    rhos = []
+    a, b = 1, 2
+    for _ in range(edge_count):
+        rhos.append(Fraction(a, b))
         a, b = b, a + b
-    return a
+    return tuple(reversed(rhos))
 
 
-def build_rhos(edge_count=7):
+def build_rhos(edge_count=7, exact=False):
     """
     Build rho ratios for the edge chain.
     
+    The sequences are memoized per (edge_count, exact); building the float
+    rhos of a 10^5-edge chain takes milliseconds.
+    
     Parameters:
         edge_count: Number of edges in the graph
+        exact: If True, return the ratios as fractions.Fraction
         
     Returns:
         List of rho values (Fibonacci ratios)
     """
-    return [
-        fib(edge_count + 2 - e) / fib(edge_count + 3 - e) 
-        for e in range(1, edge_count + 1)
-    ]
+    return list(_chain_rhos(edge_count, exact))
+
+
+def _twice_spin(j_e):
+    """Return 2j as an int, rejecting spins that are not half-integers."""
+    twoj = 2 * Fraction(j_e)
+    if twoj.denominator != 1 or twoj < 0:
+        raise ValueError(f"Spin {j_e} is not a non-negative integer or half-integer")
+    return int(twoj)
+
+
+def edge_factor_asymptotic(twoj, rho, precision=50):
+    """
+    Evaluate an edge factor from its large-spin asymptotic expansion.
+    
+    The cost does not grow with 2j; see the asymptotic module for the
+    expansion and its rigorous error bound.
+    
+    Parameters:
+        twoj: Twice the edge spin, 2j
+        rho: Positive rho parameter of the edge
+        precision: Decimal precision for mpmath calculations
+        
+    Returns:
+        Tuple (value, relative_error_bound) of mpmath.mpf, the bound being
+        at most 10^-precision
+        
+    Raises:
+        ArithmeticError: If the expansion cannot reach the requested
+            precision (rho not positive or 2j * rho / (1 + rho) too small)
+    """
+    work = get_context(precision + 10)
+    result = asymptotic_series(work, twoj, to_mpf(work, rho), work.mpf(10) ** -precision)
+    if result is None:
+        raise ArithmeticError(
+            f"Asymptotic expansion cannot reach {precision} digits for 2j={twoj}, rho={rho}"
+        )
+    ctx = get_context(precision)
+    return ctx.mpf(result[0]), ctx.mpf(result[1])
 
 
-def calculate_3nj(j, rhos=None, precision=50):
+def edge_factor(twoj, rho, precision=50):
+    """
+    Evaluate a single edge factor 2F1(-2j, 1/2; 1; -rho) / (2j)!.
+    
+    From 2j = ASYMPTOTIC_THRESHOLD on, positive rhos are first tried with
+    the large-spin expansion (edge_factor_asymptotic), which is used when its
+    error bound meets the requested precision.
+    
+    Parameters:
+        twoj: Twice the edge spin, 2j
+        rho: Rho parameter of the edge (Fractions are converted exactly at
+            the working precision)
+        precision: Decimal precision for mpmath calculations
+        
+    Returns:
+        mpmath.mpf value of the factor
+    """
+    ctx = get_context(precision)
+    if twoj >= ASYMPTOTIC_THRESHOLD and rho > 0:
+        work = get_context(precision + 10)
+        result = asymptotic_series(work, twoj, to_mpf(work, rho), work.mpf(10) ** -precision)
+        if result is not None:
+            return ctx.mpf(result[0])
+    if isinstance(rho, Fraction):
+        rho = to_mpf(ctx, rho)
+    return ctx.hyper([-twoj, 0.5], [1], -rho) / ctx.factorial(twoj)
+
+
+def edge_factor_exact(twoj, rho):
+    """
+    Evaluate 2F1(-2j, 1/2; 1; -rho) / (2j)! exactly for rational rho.
+    
+    With n = 2j and rho = p/q the terminating series is
+    sum_k C(n,k) C(2k,k) p^k (4q)^(n-k) / ((4q)^n n!), so the numerator is
+    accumulated in Python integers by Horner's rule and divided once.
+    
+    Parameters:
+        twoj: Twice the edge spin, 2j (non-negative integer)
+        rho: Rho parameter; anything fractions.Fraction accepts. Floats are
+            converted exactly, so pass Fractions for true rational rhos.
+        
+    Returns:
+        fractions.Fraction value of the factor
+    """
+    n = int(twoj)
+    rho = Fraction(rho)
+    p, q = rho.numerator, 4 * rho.denominator
+    
+    # coeffs[k] = C(n, k) * C(2k, k)
+    coeffs = [1] * (n + 1)
+    for k in range(n):
+        coeffs[k + 1] = coeffs[k] * 2 * (n - k) * (2 * k + 1) // ((k + 1) ** 2)
+    
+    num = 0
+    qpow = 1
+    for k in range(n, -1, -1):
+        num = num * p + coeffs[k] * qpow
+        qpow *= q
+    
+    return Fraction(num, (qpow // q) * factorial(n))
+
+
+def calculate_3nj(j, rhos=None, precision=50, cache=None, exact=False):
     """
     Calculate 3nj symbol using hypergeometric product formula.
     
@@ -37,25 +254,167 @@ def calculate_3nj(j, rhos=None, precision=50):
         j: List of spin values for each edge
         rhos: Optional list of rho parameters. If None, uses Fibonacci ratios.
         precision: Decimal precision for mpmath calculations
+        cache: Optional FactorCache supplying the per-edge factors
+        exact: If True, evaluate in exact rational arithmetic; precision is
+            then ignored and the default rhos are exact Fibonacci ratios
         
     Returns:
-        mpmath.mpf value of the 3nj symbol
+        mpmath.mpf value of the 3nj symbol, or fractions.Fraction if exact
+        
+    The evaluation runs in a thread-local context from get_context(), so the
+    global mp.mp precision is left untouched and concurrent calls at
+    different precisions are safe.
     """
-    # Set precision
-    mp.mp.dps = precision
-    
     if rhos is None:
-        rhos = build_rhos(len(j))
+        rhos = build_rhos(len(j), exact=exact)
     
     if len(j) != len(rhos):
         raise ValueError(f"Length mismatch: j has {len(j)} elements, rhos has {len(rhos)}")
     
-    res = mp.mpf(1)
+    if exact:
+        res = Fraction(1)
+        for j_e, rho in zip(j, rhos):
+            twoj = _twice_spin(j_e)
+            if cache is not None:
+                res *= cache.factor(twoj, rho, None)
+            else:
+                res *= edge_factor_exact(twoj, rho)
+        return res
+    
+    ctx = get_context(precision)
+    res = ctx.mpf(1)
     for idx, j_e in enumerate(j):
         twoj = 2 * j_e
         rho = rhos[idx]
         # Hypergeometric 2F1([-2j, 1/2], [1], -rho) / (2j)!
-        term = mp.hyper([-twoj, 0.5], [1], -rho) / mp.factorial(twoj)
+        if cache is not None:
+            term = cache.factor(twoj, rho, precision)
+        else:
+            term = edge_factor(twoj, rho, precision)
         res *= term
     
     return res
+
+
+def _factor_sweep(rho, n_max, lengths=None):
+    """
+    Forward recurrence for F_n = 2F1(-n, 1/2; 1; -rho), n = 0..n_max.
+    
+    F_n obeys the three-term recurrence
+    (n + 1) F_{n+1} = (2n + 1)(1 + rho/2) F_n - n (1 + rho) F_{n-1}
+    (F_n / (1 + rho)^(n/2) is a Legendre polynomial), which is run in
+    float64 for an array of rhos at once. The pair (F_{n-1}, F_n) is
+    rescaled whenever it grows large, with the scale kept in log form, so
+    neither overflow nor a zero factor can break the iteration.
+    
+    Parameters:
+        rho: Float array of rho values
+        n_max: Last n to yield
+        lengths: Optional int array, in decreasing order, of the last n
+            needed for each rho; rhos past their length stop recurring
+        
+    Yields:
+        Tuples (n, value, log_scale) of float64 arrays with
+        F_n = value * exp(log_scale), covering the rhos with lengths >= n.
+        The arrays are views that the next step overwrites.
+    """
+    rho = np.asarray(rho, dtype=np.float64)
+    prev = np.ones_like(rho)
+    curr = 1.0 + rho / 2.0
+    log_scale = np.zeros_like(rho)
+    
+    yield 0, np.ones_like(rho), log_scale
+    if n_max < 1:
+        return
+    yield 1, curr, log_scale
+    
+    k = rho.size
+    for m in range(1, n_max):
+        if lengths is not None:
+            k = np.count_nonzero(lengths > m)
+        r = rho[:k]
+        nxt = ((2 * m + 1) * (1.0 + r / 2.0) * curr[:k] - m * (1.0 + r) * prev[:k]) / (m + 1)
+        prev[:k] = curr[:k]
+        curr[:k] = nxt
+        big = np.abs(nxt) > 2.0 ** 500
+        if big.any():
+            scale = np.where(big, np.abs(nxt), 1.0)
+            prev[:k] /= scale
+            curr[:k] /= scale
+            log_scale[:k] += np.log(scale)
+        yield m + 1, curr[:k], log_scale[:k]
+
+
+def _log_edge_factors(twoj, rhos):
+    """
+    Elementwise sign and log-magnitude of 2F1(-n, 1/2; 1; -rho) / n!.
+    
+    One _factor_sweep covers all distinct (n, rho) pairs; each pair's
+    factor is read off at its own n.
+    
+    Parameters:
+        twoj: Integer array of twice-spins n
+        rhos: Float array of rho values, same shape as twoj
+        
+    Returns:
+        Tuple (sign, log_abs) of float64 arrays
+    """
+    pairs = np.stack([np.asarray(twoj, dtype=np.float64), np.asarray(rhos, dtype=np.float64)])
+    unique, inverse = np.unique(pairs.reshape(2, -1), axis=1, return_inverse=True)
+    
+    # Sort by decreasing n so the pairs still recurring form a prefix.
+    order = np.argsort(-unique[0], kind="stable")
+    n = unique[0][order].astype(np.int64)
+    rho = unique[1][order]
+    
+    value = np.empty_like(rho)
+    log_scale = np.empty_like(rho)
+    n_max = int(n[0]) if n.size else 0
+    for m, v, s in _factor_sweep(rho, n_max, lengths=n):
+        done = slice(np.count_nonzero(n > m), np.count_nonzero(n >= m))
+        value[done] = v[done]
+        log_scale[done] = s[done]
+    
+    log_fact = np.array([lgamma(k + 1) for k in n.tolist()])
+    sign = np.sign(value)
+    with np.errstate(divide="ignore"):
+        log_abs = np.log(np.abs(value)) + log_scale - log_fact
+    
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    shape = np.shape(twoj)
+    return sign[rank[inverse]].reshape(shape), log_abs[rank[inverse]].reshape(shape)
+
+
+def log_calculate_3nj(j, rhos=None):
+    """
+    Calculate the 3nj product formula in the log domain.
+    
+    Per-edge log factors are summed in float64, so long chains and large
+    spins neither overflow nor underflow and no extended precision is needed.
+    
+    Parameters:
+        j: List of spin values for each edge
+        rhos: Optional list of rho parameters. If None, uses Fibonacci ratios.
+        
+    Returns:
+        Tuple (sign, log_abs) with the 3nj value equal to sign * exp(log_abs);
+        a zero value is reported as (0.0, -inf)
+    """
+    if rhos is None:
+        rhos = build_rhos(len(j))
+    
+    if len(j) != len(rhos):
+        raise ValueError(f"Length mismatch: j has {len(j)} elements, rhos has {len(rhos)}")
+    
+    twoj = 2 * np.asarray(j, dtype=np.float64)
+    if np.any(twoj != np.round(twoj)) or np.any(twoj < 0):
+        raise ValueError("Spins must be non-negative integers or half-integers")
+    
+    if twoj.size == 0:
+        return 1.0, 0.0
+    
+    signs, logs = _log_edge_factors(twoj.astype(np.int64), rhos)
+    if np.any(signs == 0):
+        return 0.0, float("-inf")
+    return float(np.prod(signs)), float(np.sum(logs))
@@ -0,0 +1,320 @@
+"""
+Matching-polynomial rho parameters for arbitrary coupling graphs.
+
+For the chain, the Fibonacci ratios of build_rhos are ratios of matching
+counts: the path on m vertices has F_{m+1} matchings. Writing m(H) for the
+number of matchings of a graph H, the edge (u, v) of G gets
+
+    rho_(u,v) = m(G - u) / (m(G - u) + m(G - u - v)),
+
+which reproduces build_rhos on the chain edges [(0, 1), (1, 2), ...] and
+extends it to any simple graph.
+
+On a forest, m(G - u) is a product over the components of G - u, so one
+bottom-up and one top-down pass give every m(G - u) and m(G - u - v) in a
+linear number of big-integer operations. A graph with a few independent
+cycles is reduced to forests by splitting on an edge e = (a, b) that closes
+a cycle, m(G) = m(G - e) + m(G - a - b), which costs 2^k forest passes for
+cyclomatic number k. Denser graphs fall back to a memoized deletion
+recursion over vertex bitmasks. The resulting rhos are cached per
+relabelled edge list, so evaluating many spin assignments on the same
+topology pays the graph cost once.
+"""
+
+import math
+from fractions import Fraction
+from functools import lru_cache
+
+# Largest cyclomatic number reduced to forests by edge splitting; beyond
+# it the 2^k forest passes cost more than the bitmask recursion.
+MAX_SPLIT_CYCLES = 12
+
+
+def relabel_graph_key(edges):
+    """
+    Memo key of an edge list with vertices renumbered by first appearance.
+
+    This is not a canonical form: edge lists that differ only in vertex
+    labels share a key, but isomorphic graphs whose edges are listed in a
+    different order or orientation do not. Edge order and orientation are
+    kept on purpose, because the rhos are returned per edge in that order.
+
+    Parameters:
+        edges: Sequence of (u, v) pairs of hashable vertex labels
+
+    Returns:
+        Tuple of (u, v) integer pairs
+    """
+    labels = {}
+    key = []
+    for u, v in edges:
+        for w in (u, v):
+            if w not in labels:
+                labels[w] = len(labels)
+        key.append((labels[u], labels[v]))
+    return tuple(key)
+
+
+def _check_simple(key):
+    seen = set()
+    for u, v in key:
+        if u == v:
+            raise ValueError(f"Self-loop on vertex {u} is not allowed")
+        pair = (min(u, v), max(u, v))
+        if pair in seen:
+            raise ValueError(f"Duplicate edge ({u}, {v})")
+        seen.add(pair)
+
+
+def _adjacency(n, edges):
+    adj = [[] for _ in range(n)]
+    for u, v in edges:
+        adj[u].append(v)
+        adj[v].append(u)
+    return adj
+
+
+def _excluding(items, combine, unit):
+    """For each i, combine all items except items[i] (prefix/suffix products)."""
+    prefix = [unit]
+    for item in items:
+        prefix.append(combine(prefix[-1], item))
+    out = [None] * len(items)
+    suffix = unit
+    for i in range(len(items) - 1, -1, -1):
+        out[i] = combine(prefix[i], suffix)
+        suffix = combine(items[i], suffix)
+    return out
+
+
+def _pair_product(a, b):
+    # (T, S): T = prod total_c, S = sum_c free_c prod_{c' != c} total_c'
+    return a[0] * b[0], a[1] * b[0] + a[0] * b[1]
+
+
+def _forest_counts(n, vertices, edges):
+    """
+    Matching counts of a forest on the given vertices.
+
+    Rooting each tree, free[x] = m(subtree(x) - x) and total[x] =
+    m(subtree(x)) follow bottom-up; out[x] = m(tree - subtree(x)) and
+    cut[x] = m(tree - subtree(x) - parent(x)) follow top-down. Components
+    other than the one containing a vertex contribute the product of their
+    totals.
+
+    Returns:
+        (m(F), {x: m(F - x)}, [m(F - u - v) for (u, v) in edges])
+    """
+    adj = _adjacency(n, edges)
+    parent = [-1] * n
+    seen = [False] * n
+    order, roots = [], []
+    for r in vertices:
+        if seen[r]:
+            continue
+        seen[r] = True
+        roots.append(r)
+        head = len(order)
+        order.append(r)
+        while head < len(order):
+            x = order[head]
+            head += 1
+            for y in adj[x]:
+                if not seen[y]:
+                    seen[y] = True
+                    parent[y] = x
+                    order.append(y)
+
+    children = [[] for _ in range(n)]
+    for x in order:
+        if parent[x] >= 0:
+            children[parent[x]].append(x)
+
+    free = [1] * n
+    total = [1] * n
+    for x in reversed(order):
+        t, f = 1, 0
+        for c in children[x]:
+            t, f = _pair_product((t, f), (total[c], free[c]))
+        free[x] = t
+        total[x] = t + f
+
+    out = [1] * n
+    cut = [0] * n
+    siblings = [1] * n
+    for x in order:
+        kids = children[x]
+        rest = _excluding([(total[c], free[c]) for c in kids], _pair_product, (1, 0))
+        for c, (t, f) in zip(kids, rest):
+            siblings[c] = t
+            cut[c] = t * out[x]
+            out[c] = t * (out[x] + cut[x]) + f * out[x]
+
+    comp = [0] * n
+    for k, r in enumerate(roots):
+        comp[r] = k
+    for x in order:
+        if parent[x] >= 0:
+            comp[x] = comp[parent[x]]
+    others = _excluding([total[r] for r in roots], lambda a, b: a * b, 1)
+
+    without_vertex = {x: free[x] * out[x] * others[comp[x]] for x in order}
+    without_edge = []
+    for u, v in edges:
+        child = v if parent[v] == u else u
+        without_edge.append(free[child] * siblings[child] * out[parent[child]] * others[comp[child]])
+    return math.prod(total[r] for r in roots), without_vertex, without_edge
+
+
+def _cycle_edge(n, edges):
+    """Index of the first edge closing a cycle (union-find), or None for a forest."""
+    root = list(range(n))
+
+    def find(x):
+        while root[x] != x:
+            root[x] = root[root[x]]
+            x = root[x]
+        return x
+
+    for i, (u, v) in enumerate(edges):
+        ru, rv = find(u), find(v)
+        if ru == rv:
+            return i
+        root[ru] = rv
+    return None
+
+
+def _split_counts(n, vertices, edges):
+    """
+    As _forest_counts for any graph, splitting on cycle-closing edges:
+    m(G - X) = m(G - e - X) + m(G - a - b - X) for e = (a, b) and X not
+    meeting e; if X meets e the second term is absent.
+    """
+    # Recursion depth is at most the cyclomatic number.
+    i = _cycle_edge(n, edges)
+    if i is None:
+        return _forest_counts(n, vertices, edges)
+    a, b = edges[i]
+    kept = [e for k, e in enumerate(edges) if k != i]
+    total1, vertex1, edge1 = _split_counts(n, vertices, kept)
+
+    keep2 = [k for k, (u, v) in enumerate(edges) if k != i and a not in (u, v) and b not in (u, v)]
+    vertices2 = [x for x in vertices if x != a and x != b]
+    total2, vertex2, edge2 = _split_counts(n, vertices2, [edges[k] for k in keep2])
+
+    without_vertex = {x: c + vertex2.get(x, 0) for x, c in vertex1.items()}
+    without_edge = [None] * len(edges)
+    for k, c in zip((k for k in range(len(edges)) if k != i), edge1):
+        without_edge[k] = c
+    for k, c in zip(keep2, edge2):
+        without_edge[k] += c
+    # m(G - a - b) does not see e at all.
+    without_edge[i] = total2
+    return total1 + total2, without_vertex, without_edge
+
+
+def _matching_counter(adj):
+    """Return m(S) for vertex subsets S, given as int bitmasks, of the graph adj."""
+    neighbours = [sum(1 << w for w in a) for a in adj]
+    memo = {0: 1}
+
+    def count(mask):
+        # Explicit stack: the deletion recursion is as deep as the graph is large.
+        stack = [mask]
+        while stack:
+            vertices = stack[-1]
+            if vertices in memo:
+                stack.pop()
+                continue
+            # Expand on the lowest vertex: v is unmatched or matched to a neighbour.
+            v = (vertices & -vertices).bit_length() - 1
+            rest = vertices ^ (1 << v)
+            subsets = [rest]
+            partners = neighbours[v] & rest
+            while partners:
+                w = partners & -partners
+                subsets.append(rest ^ w)
+                partners ^= w
+            missing = [sub for sub in subsets if sub not in memo]
+            if missing:
+                stack.extend(missing)
+                continue
+            memo[vertices] = sum(memo[sub] for sub in subsets)
+            stack.pop()
+        return memo[mask]
+
+    return count
+
+
+def _cyclomatic_number(n, key):
+    root = list(range(n))
+
+    def find(x):
+        while root[x] != x:
+            root[x] = root[root[x]]
+            x = root[x]
+        return x
+
+    components = n
+    for u, v in key:
+        ru, rv = find(u), find(v)
+        if ru != rv:
+            root[ru] = rv
+            components -= 1
+    return len(key) - n + components
+
+
+def _graph_counts(key):
+    """(m(G), [(m(G - u), m(G - u - v)) for (u, v) in key]) of a relabelled key."""
+    _check_simple(key)
+    n = 1 + max((max(e) for e in key), default=-1)
+    if _cyclomatic_number(n, key) <= MAX_SPLIT_CYCLES:
+        total, without_vertex, without_edge = _split_counts(n, list(range(n)), list(key))
+        return total, [(without_vertex[u], c) for (u, _), c in zip(key, without_edge)]
+
+    count = _matching_counter(_adjacency(n, key))
+    everything = (1 << n) - 1
+    return count(everything), [
+        (count(everything ^ (1 << u)), count(everything ^ (1 << u) ^ (1 << v))) for u, v in key
+    ]
+
+
+def matching_count(edges):
+    """
+    Number of matchings (including the empty one) of a simple graph.
+
+    Parameters:
+        edges: Sequence of (u, v) pairs
+
+    Returns:
+        int
+    """
+    return _graph_counts(relabel_graph_key(edges))[0]
+
+
+@lru_cache(maxsize=256)
+def _graph_rhos(key, exact):
+    rhos = []
+    for without_u, without_uv in _graph_counts(key)[1]:
+        if exact:
+            rhos.append(Fraction(without_u, without_u + without_uv))
+        else:
+            rhos.append(without_u / (without_u + without_uv))
+    return tuple(rhos)
+
+
+def graph_rhos(edges, exact=False):
+    """
+    Build rho parameters for an arbitrary coupling graph.
+
+    Results are memoized per relabel_graph_key(edges) and exactness.
+
+    Parameters:
+        edges: Sequence of (u, v) pairs, one per edge of the 3nj graph; the
+            edge is oriented from u to v
+        exact: If True, return the ratios as fractions.Fraction
+
+    Returns:
+        List of rho values, one per edge, in the order given
+    """
+    return list(_graph_rhos(relabel_graph_key(edges), exact))
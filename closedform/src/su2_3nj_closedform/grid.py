@@ -0,0 +1,256 @@
+"""
+Process-pool evaluation of the chain product formula over spin grids.
+
+Grid points are numbered in mixed radix (last edge fastest) over the sorted,
+de-duplicated spin values, so any index range [start, stop) names a fixed
+set of configurations whatever order the values were given in. A range is
+split into fixed-size chunks that are evaluated in a process pool and
+merged back in index order; the output therefore does not depend on the
+number of workers, and several machines can share a grid by taking
+disjoint ranges. Only a few chunks per worker are in flight at a time, so
+memory stays flat however large the range is.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+
+from .cache import FactorCache
+from .coefficient_calculator import _twice_spin, build_rhos, calculate_3nj, get_context
+
+
+_worker_cache = None
+
+# Chunks submitted per worker ahead of the one being yielded.
+_CHUNKS_IN_FLIGHT = 2
+
+
+def _grid_values(spin_values):
+    """The spin values in grid order: sorted and without duplicates."""
+    return sorted(set(spin_values), key=Fraction)
+
+
+def grid_size(spin_values, edge_count):
+    """Number of points in the Cartesian grid of the distinct spin_values."""
+    return len(_grid_values(spin_values)) ** edge_count
+
+
+def grid_point(index, spin_values, edge_count):
+    """
+    Return the configuration at a grid index.
+
+    Parameters:
+        index: Index in [0, grid_size(spin_values, edge_count))
+        spin_values: Allowed spin values on every edge; they are sorted and
+            de-duplicated as in evaluate_grid
+        edge_count: Number of edges
+
+    Returns:
+        List of spins
+    """
+    return _grid_point(index, _grid_values(spin_values), edge_count)
+
+
+def _grid_point(index, spin_values, edge_count):
+    """grid_point for spin values already in grid order."""
+    base = len(spin_values)
+    if not 0 <= index < base ** edge_count:
+        raise IndexError(f"Grid index {index} out of range")
+    j = [None] * edge_count
+    for e in range(edge_count - 1, -1, -1):
+        index, digit = divmod(index, base)
+        j[e] = spin_values[digit]
+    return j
+
+
+def _admissible(j, max_total, integer_total):
+    """Apply the optional grid constraints to one configuration."""
+    if max_total is not None and sum(j) > max_total:
+        return False
+    if integer_total and sum(_twice_spin(v) for v in j) % 2:
+        return False
+    return True
+
+
+def _evaluate_chunk(task):
+    """Evaluate one index range; values travel as raw mpf tuples."""
+    global _worker_cache
+    if _worker_cache is None:
+        _worker_cache = FactorCache()
+
+    start, stop, spin_values, edge_count, rhos, precision, max_total, integer_total = task
+    rows = []
+    for index in range(start, stop):
+        j = _grid_point(index, spin_values, edge_count)
+        if not _admissible(j, max_total, integer_total):
+            continue
+        value = calculate_3nj(j, rhos, precision, cache=_worker_cache)
+        rows.append((index, j, value._mpf_))
+    return rows
+
+
+def evaluate_grid(
+    spin_values,
+    edge_count,
+    rhos=None,
+    precision=50,
+    start=0,
+    stop=None,
+    max_total=None,
+    integer_total=False,
+    chunk_size=1024,
+    max_workers=None,
+):
+    """
+    Evaluate calculate_3nj over a range of a spin grid.
+
+    Parameters:
+        spin_values: Allowed spin values on every edge; they are sorted and
+            de-duplicated before indexing
+        edge_count: Number of edges
+        rhos: Optional rho parameters. If None, uses Fibonacci ratios.
+        precision: Decimal precision for mpmath calculations
+        start: First grid index (inclusive)
+        stop: Last grid index (exclusive); defaults to the end of the grid
+        max_total: If given, skip configurations whose spins sum above it
+        integer_total: If True, skip configurations with half-integer total spin
+        chunk_size: Grid indices per task
+        max_workers: Process pool size; 1 evaluates in this process
+
+    Yields:
+        Tuples (index, j, value) in increasing index order
+    """
+    spin_values = _grid_values(spin_values)
+    size = len(spin_values) ** edge_count
+    stop = size if stop is None else min(stop, size)
+    if not 0 <= start <= stop:
+        raise ValueError(f"Invalid index range [{start}, {stop}) for a grid of {size} points")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    if rhos is None:
+        rhos = build_rhos(edge_count)
+    if len(rhos) != edge_count:
+        raise ValueError(f"Length mismatch: edge_count is {edge_count}, rhos has {len(rhos)}")
+
+    tasks = (
+        (lo, min(lo + chunk_size, stop), spin_values, edge_count, list(rhos), precision, max_total, integer_total)
+        for lo in range(start, stop, chunk_size)
+    )
+    ctx = get_context(precision)
+
+    if max_workers == 1:
+        chunks = map(_evaluate_chunk, tasks)
+        for rows in chunks:
+            for index, j, raw in rows:
+                yield index, j, ctx.make_mpf(raw)
+        return
+
+    # Executor.map would submit every chunk up front; keep a bounded window
+    # of futures instead and yield them in submission order.
+    window = _CHUNKS_IN_FLIGHT * (max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(_evaluate_chunk, task))
+            if len(pending) < window:
+                continue
+            for index, j, raw in pending.popleft().result():
+                yield index, j, ctx.make_mpf(raw)
+        while pending:
+            for index, j, raw in pending.popleft().result():
+                yield index, j, ctx.make_mpf(raw)
+
+
+def _parse_spin(text):
+    return Fraction(text)
+
+
+def _build_parser():
+    parser = argparse.ArgumentParser(
+        prog="su2-3nj-grid",
+        description="Evaluate the chain 3nj product formula over a spin grid.",
+    )
+    parser.add_argument("--edges", type=int, default=7, help="number of edges (default 7)")
+    parser.add_argument("--max-spin", type=_parse_spin, default=Fraction(2),
+                        help="largest spin on each edge (default 2)")
+    parser.add_argument("--min-spin", type=_parse_spin, default=Fraction(0),
+                        help="smallest spin on each edge (default 0)")
+    parser.add_argument("--step", type=_parse_spin, default=Fraction(1, 2),
+                        help="spin step, 1/2 or 1 (default 1/2)")
+    parser.add_argument("--max-total", type=_parse_spin, default=None,
+                        help="skip configurations whose spins sum above this")
+    parser.add_argument("--integer-total", action="store_true",
+                        help="skip configurations with half-integer total spin")
+    parser.add_argument("--precision", type=int, default=50, help="decimal precision (default 50)")
+    parser.add_argument("--start", type=int, default=0, help="first grid index of this shard")
+    parser.add_argument("--stop", type=int, default=None, help="end grid index of this shard (exclusive)")
+    parser.add_argument("--shard", type=str, default=None,
+                        help="K/N: evaluate the K-th of N equal index ranges (overrides --start/--stop)")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size")
+    parser.add_argument("--chunk-size", type=int, default=1024, help="grid indices per task")
+    parser.add_argument("--output", "-o", default="-", help="JSON Lines output file (default stdout)")
+    parser.add_argument("--size", action="store_true", help="print the grid size and exit")
+    return parser
+
+
+def main(argv=None):
+    """Command-line entry point (su2-3nj-grid)."""
+    args = _build_parser().parse_args(argv)
+
+    if args.step not in (Fraction(1, 2), Fraction(1)):
+        raise SystemExit("--step must be 1/2 or 1")
+    spin_values = []
+    s = args.min_spin
+    while s <= args.max_spin:
+        spin_values.append(float(s))
+        s += args.step
+    if not spin_values:
+        raise SystemExit("empty spin range")
+
+    size = grid_size(spin_values, args.edges)
+    if args.size:
+        print(size)
+        return 0
+
+    start, stop = args.start, args.stop
+    if args.shard is not None:
+        k, n = (int(x) for x in args.shard.split("/"))
+        if not 0 <= k < n:
+            raise SystemExit("--shard must be K/N with 0 <= K < N")
+        start, stop = size * k // n, size * (k + 1) // n
+
+    max_total = None if args.max_total is None else float(args.max_total)
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    began = time.perf_counter()
+    count = 0
+    try:
+        for index, j, value in evaluate_grid(
+            spin_values, args.edges, precision=args.precision, start=start, stop=stop,
+            max_total=max_total, integer_total=args.integer_total,
+            chunk_size=args.chunk_size, max_workers=args.workers,
+        ):
+            out.write(json.dumps({"index": index, "j": j, "value": str(value)}) + "\n")
+            count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - began
+    rate = count / elapsed if elapsed > 0 else float("inf")
+    stop = size if stop is None else min(stop, size)
+    print(
+        f"{count} configurations (indices {start}..{stop} of {size}) in {elapsed:.2f} s "
+        f"({rate:.1f} configurations/s)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
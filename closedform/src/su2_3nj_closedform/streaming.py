@@ -0,0 +1,128 @@
+"""
+Streaming, resumable writer for large reference tables.
+
+Rows are appended to a JSON Lines file in chunks. The first line holds the
+table metadata; every other line is one row. After each chunk the data file
+is flushed to disk and a small checkpoint next to it records how many rows
+are complete and the byte offset where they end. A rerun with the same
+metadata truncates anything written after the last checkpoint and skips
+the rows already done, so an interrupted sweep resumes where it stopped
+and memory use does not grow with the table.
+"""
+
+import itertools
+import json
+import os
+
+
+def _checkpoint_path(path):
+    return f"{path}.checkpoint"
+
+
+def _normalize(metadata):
+    """Round-trip through JSON so tuples and lists compare equal."""
+    return json.loads(json.dumps(metadata))
+
+
+def _write_checkpoint(path, completed, offset, metadata):
+    tmp = f"{_checkpoint_path(path)}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"completed": completed, "offset": offset, "metadata": metadata}, f)
+    os.replace(tmp, _checkpoint_path(path))
+
+
+def _read_checkpoint(path):
+    try:
+        with open(_checkpoint_path(path)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def stream_table(path, configs, evaluate, metadata=None, chunk_size=256, progress=None):
+    """
+    Evaluate a sequence of configurations and stream the rows to disk.
+
+    Parameters:
+        path: Output JSON Lines file
+        configs: Iterable of configurations, in a deterministic order (a
+            resumed run skips as many leading items as are complete)
+        evaluate: Callable mapping one configuration to a JSON-serializable row
+        metadata: JSON-serializable description of the table; a resumed run
+            must pass the same metadata
+        chunk_size: Rows written between checkpoints
+        progress: Optional callable progress(completed) called after each chunk
+
+    Returns:
+        Total number of rows in the table
+
+    Raises:
+        ValueError: If an existing checkpoint was written with different metadata
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    metadata = _normalize(metadata or {})
+    checkpoint = _read_checkpoint(path)
+
+    if checkpoint is not None and os.path.exists(path):
+        if checkpoint["metadata"] != metadata:
+            raise ValueError(
+                f"Checkpoint for {path} was written with different metadata; "
+                "remove it or use another output path"
+            )
+        completed = checkpoint["completed"]
+        f = open(path, "r+b")
+        # Drop rows written after the last checkpoint; they are recomputed.
+        f.truncate(checkpoint["offset"])
+        f.seek(checkpoint["offset"])
+    else:
+        completed = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        f = open(path, "wb")
+        f.write((json.dumps({"metadata": metadata}) + "\n").encode())
+
+    with f:
+        remaining = itertools.islice(configs, completed, None)
+        while True:
+            chunk = list(itertools.islice(remaining, chunk_size))
+            if not chunk:
+                break
+            lines = [json.dumps(evaluate(config)) + "\n" for config in chunk]
+            f.write("".join(lines).encode())
+            f.flush()
+            os.fsync(f.fileno())
+            completed += len(chunk)
+            _write_checkpoint(path, completed, f.tell(), metadata)
+            if progress is not None:
+                progress(completed)
+
+        if completed == 0:
+            _write_checkpoint(path, 0, f.tell(), metadata)
+
+    return completed
+
+
+def read_table_metadata(path):
+    """Return the metadata line of a table written by stream_table."""
+    with open(path) as f:
+        return json.loads(f.readline())["metadata"]
+
+
+def read_table(path):
+    """
+    Iterate over the complete rows of a table written by stream_table.
+
+    Rows past the last checkpoint (from an interrupted run) are not yielded.
+
+    Yields:
+        Row objects in the order they were written
+    """
+    checkpoint = _read_checkpoint(path)
+    limit = None if checkpoint is None else checkpoint["completed"]
+    with open(path) as f:
+        f.readline()
+        for line in itertools.islice(f, limit):
+            yield json.loads(line)
@@ -2,31 +2,203 @@
 Symmetry checking utilities for 3nj symbols.
 """
 
-import mpmath as mp
-from .coefficient_calculator import calculate_3nj
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 
+from .coefficient_calculator import _twice_spin, build_rhos, calculate_3nj, get_context
+from .tabulate import tabulate_factors
 
-def check_reflection_symmetry(j, rhos=None, tolerance=1e-8, precision=50):
+
+def check_reflection_symmetry(j, rhos=None, tolerance=1e-8, precision=50, cache=None):
     """
     Check if f(j) = f(reverse(j)) for reflection symmetry.
-    
+
     Parameters:
         j: List of spin values
         rhos: Optional rho parameters
         tolerance: Numerical tolerance for equality check
         precision: Decimal precision for calculations
-        
+        cache: Optional FactorCache shared across checks
+
     Returns:
         Tuple (is_symmetric, difference) where:
             is_symmetric: bool indicating if symmetry holds within tolerance
             difference: absolute difference between f(j) and f(reverse(j))
     """
-    mp.mp.dps = precision
-    
-    orig = calculate_3nj(j, rhos, precision)
-    rev = calculate_3nj(j[::-1], rhos, precision)
+    ctx = get_context(precision)
+
+    # A palindrome is its own reflection; skip the second product.
+    if list(j) == list(j[::-1]):
+        return True, ctx.mpf(0)
+
+    orig = calculate_3nj(j, rhos, precision, cache=cache)
+    rev = calculate_3nj(j[::-1], rhos, precision, cache=cache)
     diff = abs(orig - rev)
-    
-    is_symmetric = diff < mp.mpf(tolerance)
-    
+
+    is_symmetric = diff < ctx.mpf(tolerance)
+
     return is_symmetric, diff
+
+
+@dataclass
+class SymmetryScan:
+    """
+    Result of scan_reflection_symmetry.
+
+    Attributes:
+        checked: Number of reflection classes covered, palindromes
+            included (they need no evaluation); with an early stop, the
+            classes up to and including the first violation
+        max_difference: Largest |f(j) - f(reverse(j))| seen
+        violations: (j, difference) pairs exceeding the tolerance, ordered by
+            position in the grid
+        stopped_early: True if the scan stopped at a violation before
+            covering the whole grid
+    """
+
+    checked: int = 0
+    max_difference: object = 0
+    violations: list = field(default_factory=list)
+    stopped_early: bool = False
+
+
+def iter_reflection_classes(spin_values, edge_count):
+    """
+    Yield one representative per reflection class of a spin grid.
+
+    A configuration and its reverse form one class; the lexicographically
+    smaller of the two is yielded, so palindromes appear once and every
+    other pair is represented by a single tuple.
+
+    Parameters:
+        spin_values: Allowed spin values on every edge
+        edge_count: Number of edges
+
+    Yields:
+        Tuples of spins
+    """
+    values = sorted(set(spin_values))
+    for j in itertools.product(values, repeat=edge_count):
+        if j <= j[::-1]:
+            yield j
+
+
+def _scan_shard(spin_values, edge_count, rhos, tolerance, precision, shard, shards, stop_early):
+    """
+    Scan the reflection classes with index % shards == shard.
+
+    Returns (checked, records, violations, stopped). records holds
+    (index, difference) each time the shard's running maximum grows, so the
+    maximum up to any grid index can be recovered after merging shards.
+    Differences are returned as raw mpf tuples, since the per-precision
+    context types do not pickle across processes.
+    """
+    ctx = get_context(precision)
+    tol = ctx.mpf(tolerance)
+
+    # Per-edge factor tables indexed by 2j, filled once by the recurrence.
+    twoj_max = max(_twice_spin(v) for v in spin_values)
+    tables = {}
+    for rho in rhos:
+        if rho not in tables:
+            tables[rho] = tabulate_factors(rho, twoj_max, backend="mpmath", precision=precision)
+    columns = [tables[rho] for rho in rhos]
+
+    checked = 0
+    max_diff = ctx.mpf(0)
+    records = []
+    violations = []
+    stopped = False
+    classes = iter_reflection_classes(spin_values, edge_count)
+    for index, j in enumerate(itertools.islice(classes, shard, None, shards)):
+        checked += 1
+        twoj = [_twice_spin(v) for v in j]
+        if twoj == twoj[::-1]:
+            continue
+
+        orig = ctx.mpf(1)
+        rev = ctx.mpf(1)
+        for column, n, m in zip(columns, twoj, reversed(twoj)):
+            orig *= column[n]
+            rev *= column[m]
+        diff = abs(orig - rev)
+
+        position = index * shards + shard
+        if diff > max_diff:
+            max_diff = diff
+            records.append((position, diff._mpf_))
+        if not diff < tol:
+            violations.append((position, list(j), diff._mpf_))
+            if stop_early:
+                stopped = True
+                break
+    return checked, records, violations, stopped
+
+
+def scan_reflection_symmetry(
+    spin_values,
+    edge_count,
+    rhos=None,
+    tolerance=1e-8,
+    precision=50,
+    stop_early=True,
+    shards=1,
+    max_workers=None,
+):
+    """
+    Check reflection symmetry over a full spin grid.
+
+    Each reflection class {j, reverse(j)} is evaluated once, both products
+    reuse per-edge factor tables built by a single recurrence sweep, and
+    palindromes cost nothing, so a grid scan takes about half the work of
+    calling check_reflection_symmetry on every configuration.
+
+    Parameters:
+        spin_values: Allowed spin values on every edge
+        edge_count: Number of edges
+        rhos: Optional rho parameters. If None, uses Fibonacci ratios.
+        tolerance: Numerical tolerance for equality check
+        precision: Decimal precision for calculations
+        stop_early: Stop at the first violation found
+        shards: Number of interleaved shards the grid is split into
+        max_workers: If shards > 1, size of the process pool running them
+            (ProcessPoolExecutor default if None)
+
+    Returns:
+        SymmetryScan summarising the scan
+    """
+    if rhos is None:
+        rhos = build_rhos(edge_count)
+
+    if len(rhos) != edge_count:
+        raise ValueError(f"Length mismatch: edge_count is {edge_count}, rhos has {len(rhos)}")
+
+    args = (list(spin_values), edge_count, list(rhos), tolerance, precision)
+    if shards == 1:
+        parts = [_scan_shard(*args, 0, 1, stop_early)]
+    else:
+        # Every shard stops at its own first violation, so waiting for all
+        # of them is bounded; the earliest one in grid order is only known
+        # once they have all reported.
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_scan_shard, *args, s, shards, stop_early) for s in range(shards)]
+            parts = [f.result() for f in futures]
+
+    ctx = get_context(precision)
+    violations = sorted((v for part in parts for v in part[2]), key=lambda v: v[0])
+    records = [r for part in parts for r in part[1]]
+    result = SymmetryScan(max_difference=ctx.mpf(0))
+    if stop_early and violations:
+        # Report exactly what a serial scan stopping at the first violation sees.
+        first = violations[0][0]
+        result.checked = first + 1
+        records = [r for r in records if r[0] <= first]
+        violations = violations[:1]
+        result.stopped_early = True
+    else:
+        result.checked = sum(part[0] for part in parts)
+    for _, diff in records:
+        result.max_difference = max(result.max_difference, ctx.make_mpf(diff))
+    result.violations = [(j, ctx.make_mpf(diff)) for _, j, diff in violations]
+    return result
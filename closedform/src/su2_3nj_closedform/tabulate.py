@@ -0,0 +1,108 @@
+"""
+O(N) tabulation of the edge factors 2F1(-n, 1/2; 1; -rho) / n!.
+
+F_n = 2F1(-n, 1/2; 1; -rho) satisfies the contiguous relation in n
+
+    (n + 1) F_{n+1} = (2n + 1)(1 + rho/2) F_n - n (1 + rho) F_{n-1},
+
+with F_0 = 1 and F_1 = 1 + rho/2 (F_n / (1 + rho)^(n/2) is the Legendre
+polynomial P_n at (2 + rho) / (2 sqrt(1 + rho))). For rho > -1 the forward
+direction follows the dominant solution and is stable, so one sweep yields
+every factor up to n = N instead of N separate mp.hyper calls.
+"""
+
+from math import lgamma
+
+import numpy as np
+
+from .coefficient_calculator import _factor_sweep, edge_factor, get_context, to_mpf
+
+
+def _tabulate_float(rho, n_max):
+    """Float64 sweep for an array of rhos; returns shape (len(rho), n_max + 1)."""
+    rho = np.asarray(rho, dtype=np.float64)
+    # Columns hold F_n rescaled by exp(-log_scale); the scale is folded back
+    # in together with 1/n! once the sweep is done.
+    table = np.empty((rho.size, n_max + 1))
+    scales = np.empty((rho.size, n_max + 1))
+    for n, value, log_scale in _factor_sweep(rho, n_max):
+        table[:, n] = value
+        scales[:, n] = log_scale
+
+    log_fact = np.array([lgamma(n + 1) for n in range(n_max + 1)])
+    with np.errstate(under="ignore", over="ignore"):
+        return table * np.exp(scales - log_fact)
+
+
+def _tabulate_mpmath(rho, n_max, precision):
+    """mpmath sweep for a single rho, carried out with ten guard digits."""
+    work = get_context(precision + 10)
+    out = get_context(precision)
+
+    rho = to_mpf(work, rho)
+    half = 1 + rho / 2
+    one_plus = 1 + rho
+
+    # f_n = F_n / n! directly: f_{n+1} = ((2n+1)(1+rho/2) f_n - (1+rho) f_{n-1}) / (n+1)^2
+    values = [work.mpf(1), half]
+    for n in range(1, n_max):
+        values.append(((2 * n + 1) * half * values[n] - one_plus * values[n - 1]) / (n + 1) ** 2)
+    return [out.mpf(v) for v in values[:n_max + 1]]
+
+
+def _check_table(table, rho, n_max, precision, rtol, skip_underflow=False):
+    """Compare sampled entries of a tabulated row against edge_factor."""
+    samples = sorted({n_max, n_max // 2, n_max // 4, min(n_max, 2)})
+    ref = get_context(precision + 10)
+    for n in samples:
+        direct = edge_factor(n, rho, precision + 10)
+        if skip_underflow and abs(direct) < 1e-290:
+            continue
+        err = abs(ref.mpf(table[n]) - direct)
+        if err > rtol * abs(direct):
+            raise ArithmeticError(
+                f"Recurrence for rho={rho} drifted from direct evaluation at 2j={n}: "
+                f"relative error {float(err / abs(direct)):.3e} > {rtol:.1e}"
+            )
+
+
+def tabulate_factors(rho, n_max, backend="float", precision=50, check=False, rtol=None):
+    """
+    Tabulate 2F1(-n, 1/2; 1; -rho) / n! for n = 0..n_max in one O(n_max) sweep.
+
+    Parameters:
+        rho: Rho parameter, or (float backend only) a 1-D sequence of rhos
+        n_max: Largest twice-spin 2j to tabulate
+        backend: "float" for NumPy float64, "mpmath" for arbitrary precision
+        precision: Decimal precision for the mpmath backend
+        check: If True, compare a few entries against direct evaluation and
+            raise ArithmeticError if they disagree by more than rtol
+        rtol: Relative tolerance for the check (1e-12 for float, 10^-(precision-5)
+            for mpmath by default)
+
+    Returns:
+        float backend: float64 array of shape (n_max + 1,), or
+        (len(rho), n_max + 1) for a sequence of rhos. Entries below the
+        float64 range underflow to zero.
+        mpmath backend: list of n_max + 1 mpmath.mpf values
+    """
+    if n_max < 0:
+        raise ValueError("n_max must be non-negative")
+
+    if backend == "float":
+        scalar = np.ndim(rho) == 0
+        table = _tabulate_float(np.atleast_1d(rho), n_max)
+        if check:
+            tol = 1e-12 if rtol is None else rtol
+            for row, r in zip(table, np.atleast_1d(rho)):
+                _check_table(row, float(r), n_max, 15, tol, skip_underflow=True)
+        return table[0] if scalar else table
+
+    if backend == "mpmath":
+        table = _tabulate_mpmath(rho, n_max, precision)
+        if check:
+            tol = 10.0 ** -(precision - 5) if rtol is None else rtol
+            _check_table(table, rho, n_max, precision, tol)
+        return table
+
+    raise ValueError(f"Unknown backend: {backend}")
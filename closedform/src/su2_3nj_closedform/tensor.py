@@ -0,0 +1,216 @@
+"""
+Lazy factorized view of chain 3nj values over a spin grid.
+
+On a Cartesian spin grid the product formula is an outer product of one
+factor vector per edge, T[k_1, ..., k_E] = v_1[k_1] * ... * v_E[k_E]. Sums,
+marginals, norms and the largest entries of T all follow from the E vectors
+of length J, so grid statistics cost O(E * J) instead of J^E. Vectors are
+held as sign and log-magnitude (from the same float64 evaluation as
+log_calculate_3nj), and every reduction has a log-domain form for grids
+whose totals leave the float64 range.
+"""
+
+import heapq
+import math
+
+import numpy as np
+
+from .coefficient_calculator import _log_edge_factors, _twice_spin, build_rhos
+
+
+def _log_sum_signed(sign, log_abs):
+    """Return (sign, log|sum|) of sum(sign * exp(log_abs)) without overflow."""
+    mask = sign != 0
+    if not mask.any():
+        return 0.0, -math.inf
+    top = log_abs[mask].max()
+    total = float(np.sum(sign[mask] * np.exp(log_abs[mask] - top)))
+    if total == 0.0:
+        return 0.0, -math.inf
+    return math.copysign(1.0, total), top + math.log(abs(total))
+
+
+def _exp_signed(sign, log_abs):
+    if sign == 0:
+        return 0.0
+    try:
+        return sign * math.exp(log_abs)
+    except OverflowError:
+        return sign * math.inf
+
+
+class FactorizedGrid:
+    """
+    Chain 3nj values on spin_values ** edge_count, stored as per-edge factors.
+
+    Parameters:
+        spin_values: Allowed spin values on every edge
+        edge_count: Number of edges
+        rhos: Optional list of rho parameters. If None, uses Fibonacci ratios.
+    """
+
+    def __init__(self, spin_values, edge_count, rhos=None):
+        if rhos is None:
+            rhos = build_rhos(edge_count)
+
+        if len(rhos) != edge_count:
+            raise ValueError(f"Length mismatch: edge_count is {edge_count}, rhos has {len(rhos)}")
+        if len(spin_values) == 0:
+            raise ValueError("spin_values must not be empty")
+
+        self.spin_values = list(spin_values)
+        self.rhos = [float(r) for r in rhos]
+        self._index = {_twice_spin(v): k for k, v in enumerate(self.spin_values)}
+
+        twoj = np.array([_twice_spin(v) for v in self.spin_values])
+        n = np.tile(twoj, edge_count)
+        rho = np.repeat(self.rhos, len(twoj))
+        sign, log_abs = _log_edge_factors(n, rho)
+        self._sign = sign.reshape(edge_count, len(twoj))
+        self._log = np.where(self._sign != 0, log_abs.reshape(edge_count, len(twoj)), -np.inf)
+
+    @property
+    def shape(self):
+        """Shape of the (virtual) dense tensor."""
+        return self._sign.shape[0] * (self._sign.shape[1],)
+
+    @property
+    def size(self):
+        """Number of grid points."""
+        return self._sign.shape[1] ** self._sign.shape[0]
+
+    def factors(self):
+        """Per-edge factor vectors as a float array of shape (edge_count, len(spin_values))."""
+        with np.errstate(over="ignore", under="ignore"):
+            return self._sign * np.exp(self._log)
+
+    def _indices(self, j):
+        if len(j) != self._sign.shape[0]:
+            raise ValueError(f"Length mismatch: j has {len(j)} elements, grid has {self._sign.shape[0]} edges")
+        try:
+            return [self._index[_twice_spin(v)] for v in j]
+        except KeyError as exc:
+            raise KeyError(f"Spin {exc.args[0] / 2} is not on the grid") from None
+
+    def log_value(self, j):
+        """Return (sign, log|value|) at configuration j."""
+        idx = self._indices(j)
+        rows = range(len(idx))
+        sign = float(np.prod(self._sign[rows, idx]))
+        if sign == 0:
+            return 0.0, -math.inf
+        return sign, math.fsum(self._log[rows, idx])
+
+    def value(self, j):
+        """Return the float value at configuration j."""
+        return _exp_signed(*self.log_value(j))
+
+    def log_sum(self):
+        """Return (sign, log|sum|) of the sum over the whole grid."""
+        sign, log_abs = 1.0, 0.0
+        for s, l in zip(self._sign, self._log):
+            es, el = _log_sum_signed(s, l)
+            if es == 0:
+                return 0.0, -math.inf
+            sign *= es
+            log_abs += el
+        return sign, log_abs
+
+    def sum(self):
+        """Sum of all grid values."""
+        return _exp_signed(*self.log_sum())
+
+    def marginal(self, keep):
+        """
+        Sum over every edge not in `keep`.
+
+        Parameters:
+            keep: Edge indices to keep, in the order of the output axes
+
+        Returns:
+            Dense float array of shape (len(spin_values),) * len(keep)
+        """
+        keep = list(keep)
+        if len(set(keep)) != len(keep):
+            raise ValueError("keep must not repeat an edge")
+        sign, log_abs = 1.0, 0.0
+        for e in range(self._sign.shape[0]):
+            if e not in keep:
+                es, el = _log_sum_signed(self._sign[e], self._log[e])
+                sign *= es
+                log_abs += el
+        if sign == 0:
+            return np.zeros(len(keep) * (self._sign.shape[1],))
+
+        out_sign = np.array(sign)
+        out_log = np.array(log_abs)
+        for e in keep:
+            out_sign = np.multiply.outer(out_sign, self._sign[e])
+            out_log = np.add.outer(out_log, self._log[e])
+        with np.errstate(over="ignore", under="ignore"):
+            return np.where(out_sign != 0, out_sign * np.exp(out_log), 0.0)
+
+    def log_norm(self, p=2):
+        """
+        Return log of the entrywise p-norm of the grid tensor.
+
+        The p-norm of an outer product is the product of the vector p-norms;
+        p = inf gives the largest magnitude.
+        """
+        if p == math.inf:
+            return float(np.sum(self._log.max(axis=1)))
+        if p <= 0:
+            raise ValueError("p must be positive")
+        total = 0.0
+        for s, l in zip(self._sign, self._log):
+            _, el = _log_sum_signed(np.abs(s), p * l)
+            total += el / p
+        return total
+
+    def norm(self, p=2):
+        """Entrywise p-norm of the grid tensor."""
+        return _exp_signed(1.0, self.log_norm(p))
+
+    def top_k(self, k):
+        """
+        Return the k entries of largest magnitude.
+
+        Each edge's factors are sorted by magnitude and the grid is searched
+        best-first from the all-largest corner with a heap, touching
+        O(k * edge_count) index tuples. Zero entries are not reported, so
+        fewer than k entries come back when the grid has fewer nonzeros.
+
+        Returns:
+            List of (j, sign, log_abs) tuples in decreasing magnitude
+        """
+        edge_count = self._sign.shape[0]
+        order = np.argsort(-self._log, axis=1, kind="stable")
+        logs = np.take_along_axis(self._log, order, axis=1)
+        width = self._sign.shape[1]
+
+        start = (0,) * edge_count
+        start_log = float(np.sum(logs[:, 0]))
+        if start_log == -math.inf:
+            # Some edge has only zero factors, so every entry is zero.
+            return []
+        heap = [(-start_log, start)]
+        seen = {start}
+        out = []
+        while heap and len(out) < k:
+            neg_log, pos = heapq.heappop(heap)
+            idx = [int(order[e, p]) for e, p in enumerate(pos)]
+            sign = float(np.prod([self._sign[e, i] for e, i in enumerate(idx)]))
+            out.append(([self.spin_values[i] for i in idx], sign, -neg_log))
+            for e in range(edge_count):
+                if pos[e] + 1 < width:
+                    nxt = pos[:e] + (pos[e] + 1,) + pos[e + 1:]
+                    if nxt not in seen:
+                        seen.add(nxt)
+                        nxt_log = logs[e, pos[e] + 1]
+                        # Zero factors sort last and are never reported; the
+                        # popped entry is nonzero, so the step is finite.
+                        if nxt_log == -math.inf:
+                            continue
+                        step = nxt_log - logs[e, pos[e]]
+                        heapq.heappush(heap, (neg_log - step, nxt))
+        return out
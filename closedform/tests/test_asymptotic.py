@@ -0,0 +1,66 @@
+"""
+Test suite for the large-spin asymptotic edge factor.
+"""
+
+import pytest
+from su2_3nj_closedform import calculate_3nj, edge_factor, edge_factor_asymptotic, get_context
+from su2_3nj_closedform.coefficient_calculator import ASYMPTOTIC_THRESHOLD
+
+
+def _hyper(twoj, rho, precision):
+    ctx = get_context(precision)
+    return ctx.hyper([-twoj, 0.5], [1], -ctx.mpf(rho)) / ctx.factorial(twoj)
+
+
+class TestAsymptoticExpansion:
+    """Accuracy and error bound of the expansion."""
+
+    @pytest.mark.parametrize("twoj,rho,precision", [
+        (1000, 0.618, 50),
+        (4000, 0.5, 50),
+        (3000, 2.0, 100),
+        (20000, 0.3, 30),
+    ])
+    def test_bound_holds(self, twoj, rho, precision):
+        value, bound = edge_factor_asymptotic(twoj, rho, precision)
+        ref = _hyper(twoj, rho, precision + 20)
+        assert bound <= 10.0 ** -precision
+        assert abs(value - ref) <= bound * ref
+
+    def test_huge_spin(self):
+        """Cost does not grow with 2j; the value stays consistent with the leading order."""
+        ctx = get_context(30)
+        value, _ = edge_factor_asymptotic(10 ** 9, 0.5, 30)
+        # Leading order F_n ~ (1 + rho)^(n + 1/2) / sqrt(pi n rho)
+        n, rho = 10 ** 9, ctx.mpf(0.5)
+        leading = ctx.power(1 + rho, n + 0.5) / ctx.sqrt(ctx.pi * n * rho) / ctx.factorial(n)
+        assert abs(value / leading - 1) < 1e-8
+
+    def test_unreachable_precision_raises(self):
+        with pytest.raises(ArithmeticError, match="cannot reach"):
+            edge_factor_asymptotic(1000, 0.05, 50)
+
+    def test_non_positive_rho_raises(self):
+        with pytest.raises(ArithmeticError):
+            edge_factor_asymptotic(5000, -0.5, 30)
+
+
+class TestDispatch:
+    """edge_factor switches to the expansion above the threshold."""
+
+    def test_uses_expansion_above_threshold(self):
+        twoj = ASYMPTOTIC_THRESHOLD + 1
+        value, _ = edge_factor_asymptotic(twoj, 0.618, 50)
+        assert edge_factor(twoj, 0.618, 50) == value
+
+    def test_falls_back_for_small_rho(self):
+        twoj = ASYMPTOTIC_THRESHOLD
+        assert edge_factor(twoj, 0.01, 40) == _hyper(twoj, 0.01, 40)
+
+    def test_chain_value_agrees(self):
+        j = [1500, 1200, 1100]
+        rhos = [0.6, 0.5, 0.4]
+        value = calculate_3nj(j, rhos, precision=40)
+        ctx = get_context(60)
+        expected = ctx.fprod(_hyper(2 * s, r, 60) for s, r in zip(j, rhos))
+        assert abs(value - expected) <= 1e-38 * expected
@@ -0,0 +1,91 @@
+"""
+Test suite for vectorized batch evaluation.
+"""
+
+import numpy as np
+import pytest
+import mpmath as mp
+from su2_3nj_closedform import (
+    calculate_3nj,
+    calculate_3nj_batch,
+    calculate_3nj_threaded,
+    build_rhos,
+)
+
+
+class TestBatchAgreement:
+    """Batch values should match the scalar product formula."""
+
+    def test_matches_scalar(self):
+        """Every row should agree with calculate_3nj."""
+        rng = np.random.default_rng(1234)
+        twoj = rng.integers(0, 12, size=(40, 7))
+        result = calculate_3nj_batch(twoj)
+        rhos = build_rhos(7)
+        for row, value in zip(twoj, result.values):
+            expected = calculate_3nj([n / 2 for n in row], rhos)
+            assert abs(value - float(expected)) <= 1e-12 * abs(float(expected))
+
+    def test_all_zeros_gives_one(self):
+        """All-zero spins should give exactly 1."""
+        result = calculate_3nj_batch(np.zeros((3, 7), dtype=int))
+        assert np.all(result.values == 1.0)
+        assert len(result.escalated) == 0
+
+    def test_custom_rhos(self):
+        """Custom rhos should be used for every row."""
+        rhos = [0.5, 0.4, 0.3]
+        twoj = np.array([[2, 2, 2], [1, 3, 5]])
+        result = calculate_3nj_batch(twoj, rhos)
+        for row, value in zip(twoj, result.values):
+            expected = calculate_3nj([n / 2 for n in row], rhos)
+            assert abs(value - float(expected)) <= 1e-12 * abs(float(expected))
+
+
+class TestEscalation:
+    """Rows outside float64 reach should be recomputed with mpmath."""
+
+    def test_underflow_rows_escalated(self):
+        """Rows that underflow float64 fall back to mpmath."""
+        twoj = np.array([[2, 2, 2], [400, 400, 400]])
+        result = calculate_3nj_batch(twoj)
+        assert list(result.escalated) == [1]
+        expected = calculate_3nj([200, 200, 200])
+        assert result.escalated_values[0] == expected
+        assert result.values[0] > 0
+
+    def test_cancelling_rhos_escalated(self):
+        """Ill-conditioned factors from negative rhos should escalate."""
+        twoj = np.array([[60]])
+        result = calculate_3nj_batch(twoj, rhos=[-1.9], rtol=1e-12)
+        assert list(result.escalated) == [0]
+        assert mp.isfinite(result.escalated_values[0])
+
+
+class TestBatchValidation:
+    """Input validation for the batch entry point."""
+
+    def test_rejects_non_integer(self):
+        with pytest.raises(ValueError, match="twice-spins"):
+            calculate_3nj_batch(np.array([[0.5, 1.0]]))
+
+    def test_rejects_wrong_shape(self):
+        with pytest.raises(ValueError, match="shape"):
+            calculate_3nj_batch(np.array([1, 2, 3]))
+
+    def test_length_mismatch_raises(self):
+        with pytest.raises(ValueError, match="Length mismatch"):
+            calculate_3nj_batch(np.ones((2, 3), dtype=int), rhos=[0.5, 0.3])
+
+    def test_empty_batch(self):
+        result = calculate_3nj_batch(np.zeros((0, 7), dtype=int))
+        assert result.values.shape == (0,)
+
+
+class TestThreadedDriver:
+    """Thread-pool driver over calculate_3nj."""
+
+    def test_matches_serial_in_order(self):
+        configs = [[0, 1, 2, 3, 4, 5, 6], [1] * 7, [2, 3, 1, 4, 2, 1, 3]]
+        values = calculate_3nj_threaded(configs, precision=40, max_workers=3)
+        assert values == [calculate_3nj(j, precision=40) for j in configs]
@@ -0,0 +1,91 @@
+"""
+Test suite for the benchmark harness.
+"""
+
+import pytest
+from su2_3nj_closedform.benchmark import (
+    TimingStats,
+    append_history,
+    compare_runs,
+    fit_exponent,
+    load_history,
+    run_suite,
+    time_call,
+)
+
+
+def _run(medians, spread=0.0):
+    """Build a one-sweep run dict with the given medians."""
+    points = [
+        {"n": n, "median": m, "q1": m - spread, "q3": m + spread, "samples": 5, "loops": 1}
+        for n, m in medians.items()
+    ]
+    return {"metadata": {}, "sweeps": [{"name": "s", "parameter": "n", "points": points}]}
+
+
+class TestTiming:
+    """Timing primitives."""
+
+    def test_time_call_statistics(self):
+        calls = []
+        stats = time_call(calls.append, 1, warmup=3, budget=0.0, min_samples=4, min_sample_time=0.0)
+        assert isinstance(stats, TimingStats)
+        assert stats.samples == 4
+        assert stats.q1 <= stats.median <= stats.q3
+        assert stats.iqr >= 0
+        # warm-up, calibration and samples all call the function
+        assert len(calls) == 3 + stats.loops * 4
+
+    def test_loops_calibrated_for_fast_calls(self):
+        stats = time_call(lambda: None, budget=0.0, min_samples=2, min_sample_time=1e-4)
+        assert stats.loops > 1
+
+    def test_fit_exponent_recovers_power_law(self):
+        sizes = [2, 4, 8, 16]
+        p, c = fit_exponent(sizes, [3.0 * n ** 1.5 for n in sizes])
+        assert p == pytest.approx(1.5)
+        assert c == pytest.approx(3.0)
+
+    def test_fit_exponent_needs_two_points(self):
+        with pytest.raises(ValueError):
+            fit_exponent([1], [1.0])
+
+    def test_run_suite_structure(self):
+        run = run_suite(edge_counts=(3, 5), spins=(1, 2), precisions=(15, 30),
+                        budget=0.0, min_samples=2, min_sample_time=0.0, warmup=0)
+        assert [s["name"] for s in run["sweeps"]] == ["edge_count", "spin_magnitude", "precision"]
+        for sweep in run["sweeps"]:
+            assert len(sweep["points"]) == 2
+            assert "exponent" in sweep
+        assert "package_version" in run["metadata"]
+
+
+class TestHistory:
+    """Versioned history and regression comparison."""
+
+    def test_append_and_load(self, tmp_path):
+        path = str(tmp_path / "bench" / "history.json")
+        assert load_history(path)["runs"] == []
+        append_history(path, _run({1: 1.0}))
+        history = append_history(path, _run({1: 2.0}))
+        assert len(history["runs"]) == 2
+        assert load_history(path) == history
+
+    def test_rejects_unknown_schema(self, tmp_path):
+        path = tmp_path / "history.json"
+        path.write_text('{"schema": 999, "runs": []}')
+        with pytest.raises(ValueError, match="schema"):
+            load_history(str(path))
+
+    def test_detects_regression(self):
+        regressions = compare_runs(_run({1: 1.0, 2: 2.0}), _run({1: 1.0, 2: 3.0}))
+        assert len(regressions) == 1
+        assert regressions[0]["value"] == 2
+        assert regressions[0]["ratio"] == pytest.approx(1.5)
+
+    def test_overlapping_iqr_not_reported(self):
+        """A slower median within the noise band is not a regression."""
+        assert compare_runs(_run({1: 1.0}, spread=0.5), _run({1: 1.4}, spread=0.5)) == []
+
+    def test_new_points_ignored(self):
+        assert compare_runs(_run({1: 1.0}), _run({1: 1.0, 2: 10.0})) == []
@@ -0,0 +1,82 @@
+"""
+Test suite for the edge factor cache.
+"""
+
+import pytest
+from su2_3nj_closedform import FactorCache, build_rhos, calculate_3nj, edge_factor
+
+
+class TestFactorCache:
+    """LRU behaviour and statistics."""
+
+    def test_hits_and_misses(self):
+        cache = FactorCache()
+        cache.factor(2, 0.5)
+        cache.factor(2, 0.5)
+        cache.factor(3, 0.5)
+        info = cache.info()
+        assert info.hits == 1
+        assert info.misses == 2
+        assert info.currsize == 2
+
+    def test_precision_is_part_of_key(self):
+        cache = FactorCache()
+        low = cache.factor(4, 0.5, precision=15)
+        high = cache.factor(4, 0.5, precision=50)
+        assert cache.info().misses == 2
+        assert low.context.dps == 15
+        assert high.context.dps == 50
+
+    def test_lru_eviction(self):
+        cache = FactorCache(maxsize=2)
+        cache.factor(0, 0.5)
+        cache.factor(1, 0.5)
+        cache.factor(0, 0.5)  # refresh 2j=0
+        cache.factor(2, 0.5)  # evicts 2j=1
+        assert len(cache) == 2
+        cache.factor(0, 0.5)
+        assert cache.info().hits == 2
+        cache.factor(1, 0.5)
+        assert cache.info().misses == 4
+
+    def test_clear_resets(self):
+        cache = FactorCache()
+        cache.factor(2, 0.5)
+        cache.clear()
+        assert cache.info() == (0, 0, cache.maxsize, 0)
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            FactorCache(maxsize=0)
+
+
+class TestCachedCalculation:
+    """Cached factors must reproduce the uncached product."""
+
+    def test_matches_uncached(self):
+        cache = FactorCache()
+        for j in ([0, 1, 2, 3, 4, 5, 6], [2, 3, 1, 4, 2, 1, 3], [0.5, 1.5, 2.5, 1.5, 0.5, 0, 0]):
+            assert calculate_3nj(j, cache=cache) == calculate_3nj(j)
+
+    def test_grid_sweep_hits_after_warmup(self):
+        cache = FactorCache()
+        rhos = build_rhos(3)
+        cache.prefill(rhos, 4)
+        warm = cache.info().misses
+        for a in range(3):
+            for b in range(3):
+                calculate_3nj([a, b, 1], rhos, cache=cache)
+        assert cache.info().misses == warm
+
+    def test_prefill_table(self):
+        cache = FactorCache()
+        rhos = [0.5, 0.25]
+        table = cache.prefill(rhos, 3)
+        assert len(table) == 2 and len(table[0]) == 4
+        assert abs(table[1][3] - edge_factor(3, 0.25)) < 1e-45
+        assert cache.factor(3, 0.25) is table[1][3]
+
+    def test_prefill_too_large(self):
+        cache = FactorCache(maxsize=4)
+        with pytest.raises(ValueError, match="maxsize"):
+            cache.prefill([0.5, 0.25], 3)
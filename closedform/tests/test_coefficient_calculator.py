@@ -4,7 +4,9 @@ Test suite for coefficient calculator.
 
 import pytest
 import mpmath as mp
-from su2_3nj_closedform import calculate_3nj, build_rhos
+from fractions import Fraction
+from su2_3nj_closedform import calculate_3nj, build_rhos, edge_factor_exact, log_calculate_3nj
+from su2_3nj_closedform.coefficient_calculator import fib, fib_ratio
 
 
 class TestFibonacciRhos:
@@ -26,6 +28,32 @@ class TestFibonacciRhos:
         rhos = build_rhos(7)
         for r in rhos:
             assert 0 < r < 1
+    
+    def test_fib_fast_doubling(self):
+        """fib should match the iterative definition."""
+        a, b = 0, 1
+        for n in range(200):
+            assert fib(n) == a
+            a, b = b, a + b
+    
+    def test_rhos_match_exact_ratios(self):
+        """Float rhos should be the correctly rounded Fibonacci ratios."""
+        for edge_count in [1, 7, 40, 60, 120]:
+            exact = build_rhos(edge_count, exact=True)
+            assert build_rhos(edge_count) == [float(r) for r in exact]
+    
+    def test_fib_ratio(self):
+        """fib_ratio(k) is F_k / F_{k+1}."""
+        assert fib_ratio(0) == 0.0
+        assert fib_ratio(5, exact=True) == Fraction(5, 8)
+        assert fib_ratio(1000) == float(fib_ratio(1000, exact=True))
+    
+    def test_long_chain_rhos(self):
+        """Very long chains should build quickly and stay consistent."""
+        rhos = build_rhos(100000)
+        assert len(rhos) == 100000
+        assert rhos[-1] == 0.5
+        assert rhos[0] == fib_ratio(100001)
 
 
 class TestCoefficientCalculator:
@@ -128,3 +156,125 @@ class TestNumericalProperties:
             # For our hypergeometric product formula with positive rhos,
             # results should be real
             assert abs(mp.im(result)) < 1e-10
+
+
+class TestPrecisionContext:
+    """Precision should be scoped to the call, not the global context."""
+    
+    def test_global_precision_untouched(self):
+        """calculate_3nj should not modify mp.mp.dps."""
+        old = mp.mp.dps
+        try:
+            mp.mp.dps = 20
+            calculate_3nj([1, 2, 3], precision=80)
+            assert mp.mp.dps == 20
+        finally:
+            mp.mp.dps = old
+    
+    def test_result_carries_requested_precision(self):
+        """Results should be computed at the requested precision."""
+        result = calculate_3nj([1, 2, 3], precision=60)
+        assert result.context.dps == 60
+    
+    def test_threads_at_mixed_precision(self):
+        """Concurrent workers at different precisions should not interfere."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        j = [2, 3, 1, 4, 2, 1, 3]
+        expected = {p: calculate_3nj(j, precision=p) for p in (15, 30, 60)}
+        tasks = [15, 30, 60] * 20
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(pool.map(lambda p: (p, calculate_3nj(j, precision=p)), tasks))
+        for p, value in results:
+            assert value == expected[p]
+
+
+class TestExactMode:
+    """Exact rational evaluation of the product formula."""
+    
+    def test_exact_rhos_are_fractions(self):
+        """exact=True should give Fibonacci ratios as Fractions."""
+        rhos = build_rhos(7, exact=True)
+        assert rhos[0] == Fraction(21, 34)
+        assert rhos[-1] == Fraction(1, 2)
+        assert [float(r) for r in rhos] == build_rhos(7)
+    
+    def test_exact_returns_fraction(self):
+        """Exact mode should return a Fraction."""
+        result = calculate_3nj([1, 2, 3], exact=True)
+        assert isinstance(result, Fraction)
+    
+    def test_exact_matches_mpmath(self):
+        """Exact values should agree with high-precision mpmath."""
+        j = [2, 3, 1, 4, 2, 1, 3]
+        exact = calculate_3nj(j, exact=True)
+        ctx = mp.MPContext()
+        ctx.dps = 80
+        rhos = [ctx.mpf(r.numerator) / r.denominator for r in build_rhos(7, exact=True)]
+        approx = calculate_3nj(j, rhos, precision=80)
+        assert abs(ctx.mpf(exact.numerator) / exact.denominator - approx) < ctx.mpf(10) ** -70
+    
+    def test_exact_small_factors(self):
+        """Check hand-computed factors 1 + rho/2 and (1 + rho + 3 rho^2 / 8) / 2."""
+        rho = Fraction(1, 3)
+        assert edge_factor_exact(0, rho) == 1
+        assert edge_factor_exact(1, rho) == 1 + rho / 2
+        assert edge_factor_exact(2, rho) == (1 + rho + 3 * rho ** 2 / 8) / 2
+    
+    def test_exact_half_integers(self):
+        """Half-integer spins should be accepted in exact mode."""
+        result = calculate_3nj([0.5, 1.5, 2.5], exact=True)
+        assert result > 0
+    
+    def test_exact_rejects_invalid_spin(self):
+        """Non half-integer spins should raise in exact mode."""
+        with pytest.raises(ValueError, match="half-integer"):
+            calculate_3nj([0.3, 1, 1], exact=True)
+    
+    def test_exact_with_cache(self):
+        """Exact factors should be cacheable."""
+        from su2_3nj_closedform import FactorCache
+        cache = FactorCache()
+        j = [1, 2, 3]
+        assert calculate_3nj(j, exact=True, cache=cache) == calculate_3nj(j, exact=True)
+        assert cache.info().misses == 3
+
+
+class TestLogDomain:
+    """Log-domain evaluation of the product formula."""
+    
+    @pytest.mark.parametrize("j", [
+        [0, 0, 0, 0, 0, 0, 0],
+        [0, 1, 2, 3, 4, 5, 6],
+        [0.5, 1.5, 2.5, 1.5, 0.5, 0, 0],
+        [5, 6, 7, 8, 9, 10, 11],
+    ])
+    def test_matches_mpmath(self, j):
+        """log|C| should agree with the mpmath product."""
+        sign, log_abs = log_calculate_3nj(j)
+        expected = calculate_3nj(j)
+        assert sign == 1.0
+        assert abs(log_abs - float(mp.log(expected))) < 1e-12 * max(1.0, abs(log_abs))
+    
+    def test_negative_factor_sign(self):
+        """Signs should follow negative factors for rho < -1."""
+        sign, log_abs = log_calculate_3nj([0.5, 1], [-4.0, 0.5])
+        expected = calculate_3nj([0.5, 1], [-4.0, 0.5])
+        assert sign == -1.0
+        assert abs(log_abs - float(mp.log(abs(expected)))) < 1e-12
+    
+    def test_zero_factor(self):
+        """A vanishing factor should give sign 0 and log -inf."""
+        assert log_calculate_3nj([0.5, 1], [-2.0, 0.5]) == (0.0, float("-inf"))
+    
+    def test_no_underflow_for_long_chains(self):
+        """Values far below float64 range should stay representable as logs."""
+        sign, log_abs = log_calculate_3nj([200] * 40, [0.5] * 40)
+        assert sign == 1.0
+        assert log_abs < -7e4
+        single = log_calculate_3nj([200], [0.5])[1]
+        assert abs(log_abs - 40 * single) < 1e-9 * abs(log_abs)
+    
+    def test_length_mismatch_raises(self):
+        with pytest.raises(ValueError, match="Length mismatch"):
+            log_calculate_3nj([1, 2, 3], [0.5, 0.3])
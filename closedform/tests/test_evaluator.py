@@ -0,0 +1,64 @@
+"""
+Test suite for incremental chain evaluation.
+"""
+
+import math
+import random
+
+import pytest
+from su2_3nj_closedform import ChainEvaluator, build_rhos, log_calculate_3nj
+
+
+class TestChainEvaluator:
+    """Incremental updates must track a full recomputation."""
+
+    def test_initial_value(self):
+        j = [2, 3, 1, 4, 2, 1, 3]
+        evaluator = ChainEvaluator(j)
+        assert evaluator.log_value() == pytest.approx(log_calculate_3nj(j), rel=1e-14)
+
+    def test_random_walk_matches_recompute(self):
+        rng = random.Random(7)
+        j = [1] * 25
+        rhos = build_rhos(25)
+        evaluator = ChainEvaluator(j, rhos)
+        for _ in range(2000):
+            edge = rng.randrange(25)
+            j[edge] = rng.randrange(0, 21) / 2
+            evaluator.set_spin(edge, j[edge])
+        sign, log_abs = evaluator.log_value()
+        expected_sign, expected_log = log_calculate_3nj(j, rhos)
+        assert sign == expected_sign
+        assert abs(log_abs - expected_log) < 1e-11 * abs(expected_log)
+        assert evaluator.spins == j
+
+    def test_zero_factor_round_trip(self):
+        """Passing through a vanishing factor must not poison the state."""
+        rhos = [-2.0, 0.5, 0.25]
+        evaluator = ChainEvaluator([0, 1, 1], rhos)
+        before = evaluator.log_value()
+        evaluator.set_spin(0, 0.5)  # 1 + rho/2 == 0
+        assert evaluator.log_value() == (0.0, float("-inf"))
+        assert evaluator.value() == 0.0
+        evaluator.set_spin(0, 0)
+        assert evaluator.log_value() == pytest.approx(before, rel=1e-15)
+
+    def test_negative_factor_sign(self):
+        evaluator = ChainEvaluator([0, 1], [-4.0, 0.5])
+        evaluator.set_spin(0, 0.5)  # 1 + rho/2 == -1
+        assert evaluator.log_value()[0] == -1.0
+        assert evaluator.value() < 0
+
+    def test_value_underflow_is_safe(self):
+        evaluator = ChainEvaluator([200] * 10, [0.5] * 10)
+        assert evaluator.value() == 0.0
+        assert math.isfinite(evaluator.log_value()[1])
+
+    def test_invalid_spin(self):
+        evaluator = ChainEvaluator([1, 1, 1])
+        with pytest.raises(ValueError, match="half-integer"):
+            evaluator.set_spin(1, 0.3)
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError, match="Length mismatch"):
+            ChainEvaluator([1, 2, 3], [0.5])
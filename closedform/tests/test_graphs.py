@@ -0,0 +1,105 @@
+"""
+Test suite for graph-aware rho construction.
+"""
+
+from fractions import Fraction
+import pytest
+from su2_3nj_closedform import build_rhos, calculate_3nj, relabel_graph_key, graph_rhos, matching_count
+import random
+
+from su2_3nj_closedform.graphs import _adjacency, _graph_counts, _graph_rhos, _matching_counter
+
+
+def _chain(n):
+    return [(e, e + 1) for e in range(n)]
+
+
+class TestMatchingCount:
+    """Matching counts of small graphs."""
+
+    @pytest.mark.parametrize("n,expected", [(1, 2), (2, 3), (3, 5), (6, 21)])
+    def test_paths_are_fibonacci(self, n, expected):
+        assert matching_count(_chain(n)) == expected
+
+    def test_triangle(self):
+        assert matching_count([(0, 1), (1, 2), (2, 0)]) == 4
+
+    def test_complete_graph_k4(self):
+        edges = [(a, b) for a in range(4) for b in range(a + 1, 4)]
+        assert matching_count(edges) == 10
+
+    def test_rejects_self_loop(self):
+        with pytest.raises(ValueError, match="Self-loop"):
+            matching_count([(0, 0)])
+
+
+class TestGraphRhos:
+    """Matching-ratio rhos."""
+
+    @pytest.mark.parametrize("n", [1, 3, 7, 20])
+    def test_chain_reproduces_build_rhos(self, n):
+        assert graph_rhos(_chain(n)) == build_rhos(n)
+        assert graph_rhos(_chain(n), exact=True) == build_rhos(n, exact=True)
+
+    def test_long_chain_matches_build_rhos_exactly(self):
+        """10^4 edges: far beyond any recursion limit, handled by the forest path."""
+        n = 10 ** 4
+        assert graph_rhos(_chain(n), exact=True) == build_rhos(n, exact=True)
+        assert graph_rhos(_chain(n)) == build_rhos(n)
+
+    @pytest.mark.parametrize("seed", range(6))
+    def test_split_path_matches_subset_recursion(self, seed):
+        """Random forests and graphs with a few cycles, random orientation."""
+        rng = random.Random(seed)
+        n = 14
+        edges = []
+        for v in range(1, n):
+            if rng.random() < 0.85:
+                u = rng.randrange(v)
+                edges.append((u, v) if rng.random() < 0.5 else (v, u))
+        present = {frozenset(e) for e in edges}
+        for _ in range(seed):
+            u, v = rng.sample(range(n), 2)
+            if frozenset((u, v)) not in present:
+                present.add(frozenset((u, v)))
+                edges.append((u, v))
+        key = relabel_graph_key(edges)
+        size = 1 + max(max(e) for e in key)
+        count = _matching_counter(_adjacency(size, key))
+        everything = (1 << size) - 1
+        expected = [(count(everything ^ (1 << u)), count(everything ^ (1 << u) ^ (1 << v))) for u, v in key]
+        assert _graph_counts(key) == (count(everything), expected)
+
+    def test_long_cycle_splits_into_paths(self):
+        """A cycle is a path plus one split edge: m(C_n) = F_{n+1} + F_{n-1}."""
+        n = 2000
+        rhos = graph_rhos([(e, (e + 1) % n) for e in range(n)], exact=True)
+        assert len(set(rhos)) == 1
+        assert matching_count([(e, (e + 1) % 10) for e in range(10)]) == 89 + 34
+
+    def test_dense_graph_uses_subset_recursion(self):
+        """K_8 has cyclomatic number 21 and 764 matchings."""
+        edges = [(a, b) for a in range(8) for b in range(a + 1, 8)]
+        assert matching_count(edges) == 764
+
+    def test_cycle_is_uniform(self):
+        """Every edge of a cycle is equivalent."""
+        rhos = graph_rhos([(0, 1), (1, 2), (2, 3), (3, 0)], exact=True)
+        # C4 minus a vertex is a 3-vertex path (3 matchings), minus both ends
+        # of an edge a 2-vertex path (2 matchings)
+        assert rhos == [Fraction(3, 5)] * 4
+
+    def test_relabelled_graph_shares_cache_entry(self):
+        _graph_rhos.cache_clear()
+        a = graph_rhos([(0, 1), (1, 2), (1, 3)])
+        b = graph_rhos([("x", "y"), ("y", "z"), ("y", "w")])
+        assert a == b
+        assert _graph_rhos.cache_info().hits == 1
+
+    def test_canonical_key(self):
+        assert relabel_graph_key([(5, 9), (9, 2)]) == ((0, 1), (1, 2))
+
+    def test_usable_with_calculate_3nj(self):
+        edges = [(0, 1), (1, 2), (2, 0), (2, 3)]
+        value = calculate_3nj([1, 1, 1, 1], graph_rhos(edges))
+        assert value > 0
@@ -0,0 +1,104 @@
+"""
+Test suite for process-pool grid evaluation.
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from su2_3nj_closedform import build_rhos, calculate_3nj, evaluate_grid, grid_point, grid_size
+from su2_3nj_closedform import grid
+from su2_3nj_closedform.grid import main
+
+
+class TestGridIndexing:
+    """Mixed-radix numbering of grid points."""
+
+    def test_last_edge_fastest(self):
+        values = [0, 0.5, 1]
+        assert grid_point(0, values, 3) == [0, 0, 0]
+        assert grid_point(1, values, 3) == [0, 0, 0.5]
+        assert grid_point(3, values, 3) == [0, 0.5, 0]
+        assert grid_point(grid_size(values, 3) - 1, values, 3) == [1, 1, 1]
+
+    def test_out_of_range(self):
+        with pytest.raises(IndexError):
+            grid_point(27, [0, 0.5, 1], 3)
+
+    def test_values_normalized_as_in_evaluate_grid(self):
+        values = [1, 0, 0.5, 0, 1]
+        assert grid_size(values, 3) == 27
+        rows = list(evaluate_grid(values, 3, precision=15, max_workers=1))
+        assert [j for _, j, _ in rows] == [grid_point(i, values, 3) for i in range(27)]
+        assert grid_point(1, values, 3) == [0, 0, 0.5]
+
+
+class TestEvaluateGrid:
+    """Ordered, chunked evaluation."""
+
+    def test_matches_direct_evaluation(self):
+        rhos = build_rhos(3)
+        rows = list(evaluate_grid([0, 0.5, 1], 3, precision=30, chunk_size=5, max_workers=1))
+        assert [r[0] for r in rows] == list(range(27))
+        for index, j, value in rows:
+            assert value == calculate_3nj(j, rhos, 30)
+
+    def test_pool_matches_serial_in_order(self):
+        serial = list(evaluate_grid([0, 1], 4, chunk_size=3, max_workers=1))
+        pooled = list(evaluate_grid([0, 1], 4, chunk_size=3, max_workers=2))
+        assert serial == pooled
+
+    def test_pool_keeps_few_chunks_in_flight(self, monkeypatch):
+        submitted = []
+
+        class CountingPool(ProcessPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                submitted.append(args[0][0])
+                return super().submit(fn, *args, **kwargs)
+
+        monkeypatch.setattr(grid, "ProcessPoolExecutor", CountingPool)
+        rows = evaluate_grid([0, 1], 20, precision=15, chunk_size=1, max_workers=2)
+        assert next(rows)[0] == 0
+        rows.close()
+        assert len(submitted) == grid._CHUNKS_IN_FLIGHT * 2
+
+    def test_index_range_shards_partition_grid(self):
+        full = list(evaluate_grid([0, 1], 4, max_workers=1))
+        parts = (list(evaluate_grid([0, 1], 4, start=0, stop=7, max_workers=1))
+                 + list(evaluate_grid([0, 1], 4, start=7, max_workers=1)))
+        assert parts == full
+
+    def test_constraints(self):
+        rows = list(evaluate_grid([0, 0.5, 1], 3, max_total=1, integer_total=True, max_workers=1))
+        for _, j, _ in rows:
+            assert sum(j) <= 1
+            assert sum(j) == int(sum(j))
+        assert [0, 0.5, 0.5] in [j for _, j, _ in rows]
+
+    def test_invalid_range(self):
+        with pytest.raises(ValueError, match="Invalid index range"):
+            list(evaluate_grid([0, 1], 3, start=5, stop=2))
+
+
+class TestCommandLine:
+    """The su2-3nj-grid entry point."""
+
+    def test_writes_json_lines(self, tmp_path, capsys):
+        out = tmp_path / "grid.jsonl"
+        assert main(["--edges", "3", "--max-spin", "1", "--workers", "1", "-o", str(out)]) == 0
+        rows = [json.loads(line) for line in out.read_text().splitlines()]
+        assert [r["index"] for r in rows] == list(range(27))
+        assert "configurations/s" in capsys.readouterr().err
+
+    def test_shards_cover_grid(self, tmp_path):
+        rows = []
+        for k in range(3):
+            out = tmp_path / f"part{k}.jsonl"
+            main(["--edges", "3", "--max-spin", "1", "--step", "1", "--workers", "1",
+                  "--shard", f"{k}/3", "-o", str(out)])
+            rows += [json.loads(line)["index"] for line in out.read_text().splitlines()]
+        assert rows == list(range(8))
+
+    def test_size(self, capsys):
+        main(["--edges", "4", "--max-spin", "1/2", "--size"])
+        assert capsys.readouterr().out.strip() == "16"
@@ -0,0 +1,90 @@
+"""
+Test suite for the streaming table writer.
+"""
+
+import json
+import pytest
+from su2_3nj_closedform import read_table, read_table_metadata, stream_table
+
+
+class _Crash(Exception):
+    pass
+
+
+def _square(x):
+    return {"x": x, "y": x * x}
+
+
+class TestStreamTable:
+    """Chunked writing and reading back."""
+
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "table.jsonl")
+        total = stream_table(path, range(10), _square, metadata={"kind": "squares"}, chunk_size=3)
+        assert total == 10
+        assert read_table_metadata(path) == {"kind": "squares"}
+        assert list(read_table(path)) == [_square(x) for x in range(10)]
+
+    def test_progress_reported_per_chunk(self, tmp_path):
+        seen = []
+        stream_table(str(tmp_path / "t.jsonl"), range(7), _square, chunk_size=3, progress=seen.append)
+        assert seen == [3, 6, 7]
+
+    def test_empty_table(self, tmp_path):
+        path = str(tmp_path / "t.jsonl")
+        assert stream_table(path, [], _square) == 0
+        assert list(read_table(path)) == []
+
+    def test_rejects_bad_chunk_size(self, tmp_path):
+        with pytest.raises(ValueError):
+            stream_table(str(tmp_path / "t.jsonl"), range(3), _square, chunk_size=0)
+
+
+class TestResume:
+    """Interrupted runs resume from the last checkpoint."""
+
+    def test_resume_after_crash(self, tmp_path):
+        path = str(tmp_path / "table.jsonl")
+        calls = []
+
+        def failing(x):
+            calls.append(x)
+            if x == 7:
+                raise _Crash
+            return _square(x)
+
+        with pytest.raises(_Crash):
+            stream_table(path, range(10), failing, chunk_size=3)
+        # Two full chunks were checkpointed before the crash.
+        assert list(read_table(path)) == [_square(x) for x in range(6)]
+
+        calls.clear()
+        total = stream_table(path, range(10), _counting(calls), chunk_size=3)
+        assert total == 10
+        assert calls == [6, 7, 8, 9]
+        assert list(read_table(path)) == [_square(x) for x in range(10)]
+
+    def test_partial_rows_after_checkpoint_discarded(self, tmp_path):
+        """Bytes written after the last checkpoint are truncated on resume."""
+        path = str(tmp_path / "table.jsonl")
+        stream_table(path, range(4), _square, chunk_size=2)
+        with open(path, "a") as f:
+            f.write('{"x": 99, "y"')
+        assert list(read_table(path)) == [_square(x) for x in range(4)]
+        stream_table(path, range(6), _square, chunk_size=2)
+        with open(path) as f:
+            lines = f.read().splitlines()
+        assert [json.loads(line) for line in lines[1:]] == [_square(x) for x in range(6)]
+
+    def test_metadata_mismatch_raises(self, tmp_path):
+        path = str(tmp_path / "table.jsonl")
+        stream_table(path, range(3), _square, metadata={"precision": 50})
+        with pytest.raises(ValueError, match="different metadata"):
+            stream_table(path, range(3), _square, metadata={"precision": 30})
+
+
+def _counting(calls):
+    def evaluate(x):
+        calls.append(x)
+        return _square(x)
+    return evaluate
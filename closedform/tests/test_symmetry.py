@@ -121,3 +121,80 @@ class TestSymmetryVsDirectCalculation:
         # Should agree
         assert abs(diff_sym - diff_direct) < 1e-15
         assert is_sym == (diff_direct < 1e-8)
+
+
+class TestGridScan:
+    """Symmetry-aware grid scanning."""
+
+    def test_classes_cover_grid(self):
+        """Each configuration belongs to exactly one yielded class."""
+        from itertools import product
+        from su2_3nj_closedform import iter_reflection_classes
+        values = [0, 0.5, 1]
+        classes = list(iter_reflection_classes(values, 4))
+        covered = set(classes) | {c[::-1] for c in classes}
+        assert covered == set(product(values, repeat=4))
+        # 3^4 = 81 configurations, 3^2 = 9 palindromes: (81 + 9) / 2 classes
+        assert len(classes) == 45
+
+    def test_scan_matches_pointwise_checks(self):
+        """The scan's largest difference matches per-configuration checks."""
+        from su2_3nj_closedform import iter_reflection_classes, scan_reflection_symmetry
+        rhos = [0.5, 0.4, 0.3, 0.2]
+        scan = scan_reflection_symmetry([0, 1, 2], 4, rhos, tolerance=1.0, stop_early=False)
+        assert scan.checked == 45
+        assert not scan.violations
+        expected = max(
+            check_reflection_symmetry(list(j), rhos)[1]
+            for j in iter_reflection_classes([0, 1, 2], 4)
+        )
+        assert abs(scan.max_difference - expected) < 1e-40
+
+    def test_stops_at_first_violation(self):
+        """With stop_early, only the first violating class is reported."""
+        from su2_3nj_closedform import scan_reflection_symmetry
+        rhos = [0.9, 0.5, 0.1]
+        scan = scan_reflection_symmetry([0, 1, 2], 3, rhos, tolerance=1e-30)
+        assert scan.stopped_early
+        assert scan.violations[0][0] == [0, 0, 1]
+        assert scan.checked < 18
+
+    def test_all_violations_without_early_stop(self):
+        """Without early stopping every non-palindromic class violates."""
+        from su2_3nj_closedform import scan_reflection_symmetry
+        rhos = [0.9, 0.5, 0.1]
+        scan = scan_reflection_symmetry([0, 1, 2], 3, rhos, tolerance=1e-30, stop_early=False)
+        assert scan.checked == 18
+        assert len(scan.violations) == 18 - 9
+        assert not scan.stopped_early
+
+    def test_sharded_matches_serial(self):
+        """Process-pool shards give the same result as a serial scan."""
+        from su2_3nj_closedform import scan_reflection_symmetry
+        rhos = [0.9, 0.5, 0.1]
+        serial = scan_reflection_symmetry([0, 0.5, 1], 3, rhos, tolerance=1e-30, stop_early=False)
+        sharded = scan_reflection_symmetry(
+            [0, 0.5, 1], 3, rhos, tolerance=1e-30, stop_early=False, shards=3, max_workers=2
+        )
+        assert sharded.checked == serial.checked
+        assert [j for j, _ in sharded.violations] == [j for j, _ in serial.violations]
+        assert sharded.max_difference == serial.max_difference
+
+    @pytest.mark.parametrize("shards", [2, 3, 4])
+    def test_sharded_early_stop_matches_serial(self, shards):
+        """The reported violation is the first in grid order, whichever shard finishes first."""
+        from su2_3nj_closedform import scan_reflection_symmetry
+        spins = [0, 0.5, 1, 1.5, 2]
+        rhos = [0.9, 0.7, 0.5, 0.3, 0.1]
+        serial = scan_reflection_symmetry(spins, 5, rhos, tolerance=1e-30)
+        sharded = scan_reflection_symmetry(spins, 5, rhos, tolerance=1e-30, shards=shards, max_workers=shards)
+        assert serial.violations[0][0] == [0, 0, 0, 0, 0.5]
+        assert [j for j, _ in sharded.violations] == [j for j, _ in serial.violations]
+        assert sharded.checked == serial.checked
+        assert sharded.max_difference == serial.max_difference
+        assert sharded.stopped_early and serial.stopped_early
+
+    def test_length_mismatch_raises(self):
+        from su2_3nj_closedform import scan_reflection_symmetry
+        with pytest.raises(ValueError, match="Length mismatch"):
+            scan_reflection_symmetry([0, 1], 3, rhos=[0.5, 0.4])
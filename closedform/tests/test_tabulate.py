@@ -0,0 +1,77 @@
+"""
+Test suite for recurrence-based factor tabulation.
+"""
+
+import numpy as np
+import pytest
+import mpmath as mp
+from fractions import Fraction
+from su2_3nj_closedform import edge_factor, edge_factor_exact, tabulate_factors
+from su2_3nj_closedform.coefficient_calculator import _log_edge_factors
+
+
+class TestFloatBackend:
+    """float64 sweep against direct evaluation."""
+
+    @pytest.mark.parametrize("rho", [0.5, 0.618, 0.05, -0.5, 2.0])
+    def test_matches_direct(self, rho):
+        table = tabulate_factors(rho, 60)
+        for n in range(61):
+            expected = float(edge_factor(n, rho))
+            assert abs(table[n] - expected) <= 1e-12 * abs(expected)
+
+    def test_vector_of_rhos(self):
+        rhos = [0.5, 0.25, 0.125]
+        table = tabulate_factors(rhos, 20)
+        assert table.shape == (3, 21)
+        for row, rho in zip(table, rhos):
+            assert np.allclose(row, tabulate_factors(rho, 20), rtol=0, atol=0)
+
+    def test_large_n_does_not_overflow(self):
+        """Intermediate F_n overflow is absorbed by rescaling."""
+        table = tabulate_factors(3.0, 1500, check=True)
+        assert np.all(np.isfinite(table))
+        expected = edge_factor(150, 3.0, precision=30)
+        assert abs(table[150] - float(expected)) <= 1e-12 * float(expected)
+
+    def test_zero_n_max(self):
+        assert list(tabulate_factors(0.5, 0)) == [1.0]
+
+    def test_shares_kernel_with_log_factors(self):
+        """Table rows and _log_edge_factors come from the same sweep."""
+        rhos = [0.618, -2.0, 5.0]
+        table = tabulate_factors(rhos, 150)
+        n = np.arange(151)
+        for row, rho in zip(table, rhos):
+            sign, log_abs = _log_edge_factors(n, np.full(n.shape, rho))
+            np.testing.assert_allclose(row, sign * np.exp(log_abs), rtol=1e-13, atol=0)
+
+
+class TestMpmathBackend:
+    """Arbitrary-precision sweep."""
+
+    def test_matches_direct(self):
+        table = tabulate_factors(0.618, 200, backend="mpmath", precision=40, check=True)
+        assert len(table) == 201
+        for n in (0, 1, 2, 50, 200):
+            expected = edge_factor(n, 0.618, precision=40)
+            assert abs(table[n] - expected) <= mp.mpf(10) ** -38 * abs(expected)
+
+    def test_fraction_rho_matches_exact(self):
+        rho = Fraction(13, 21)
+        table = tabulate_factors(rho, 30, backend="mpmath", precision=50)
+        exact = edge_factor_exact(30, rho)
+        ctx = table[30].context
+        assert abs(table[30] - ctx.mpf(exact.numerator) / exact.denominator) <= ctx.mpf(10) ** -48 * table[30]
+
+
+class TestStabilityCheck:
+    """The optional check should catch drift."""
+
+    def test_check_raises_on_tight_tolerance(self):
+        with pytest.raises(ArithmeticError, match="drifted"):
+            tabulate_factors(0.5, 100, check=True, rtol=1e-30)
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="backend"):
+            tabulate_factors(0.5, 10, backend="sympy")
@@ -0,0 +1,95 @@
+"""
+Test suite for the lazy factorized grid tensor.
+"""
+
+import itertools
+import math
+import numpy as np
+import pytest
+from su2_3nj_closedform import FactorizedGrid, build_rhos, calculate_3nj
+
+
+VALUES = [0, 0.5, 1, 1.5, 2]
+
+
+@pytest.fixture
+def grid():
+    return FactorizedGrid(VALUES, 4)
+
+
+def _dense(rhos):
+    """Materialize the 4-edge grid directly with calculate_3nj."""
+    shape = (len(VALUES),) * 4
+    dense = np.empty(shape)
+    for idx in itertools.product(range(len(VALUES)), repeat=4):
+        dense[idx] = float(calculate_3nj([VALUES[i] for i in idx], rhos))
+    return dense
+
+
+class TestFactorizedGrid:
+    """Reductions agree with the materialized tensor."""
+
+    def test_point_lookup(self, grid):
+        j = [0.5, 2, 1, 0]
+        expected = float(calculate_3nj(j, build_rhos(4)))
+        assert grid.value(j) == pytest.approx(expected, rel=1e-13)
+        assert grid.shape == (5, 5, 5, 5)
+        assert grid.size == 625
+
+    def test_reductions_match_dense(self, grid):
+        dense = _dense(build_rhos(4))
+        assert grid.sum() == pytest.approx(dense.sum(), rel=1e-12)
+        assert grid.norm() == pytest.approx(np.sqrt((dense ** 2).sum()), rel=1e-12)
+        assert grid.norm(1) == pytest.approx(np.abs(dense).sum(), rel=1e-12)
+        assert grid.norm(math.inf) == pytest.approx(np.abs(dense).max(), rel=1e-12)
+        np.testing.assert_allclose(grid.marginal([2, 0]), dense.sum(axis=(1, 3)).T, rtol=1e-12)
+
+    def test_top_k_matches_dense(self, grid):
+        dense = _dense(build_rhos(4))
+        top = grid.top_k(10)
+        expected = np.sort(np.abs(dense).ravel())[::-1][:10]
+        np.testing.assert_allclose([math.exp(l) for _, _, l in top], expected, rtol=1e-12)
+        j, sign, log_abs = top[3]
+        assert sign * math.exp(log_abs) == pytest.approx(grid.value(j), rel=1e-12)
+
+    def test_top_k_skips_zero_factors(self):
+        """rho = -2 zeroes the half-integer factors of an edge."""
+        values = [0, 0.5, 1, 1.5]
+        grid = FactorizedGrid(values, 3, [-2.0, 0.4, -2.0])
+        dense = np.array([grid.value(list(j)) for j in itertools.product(values, repeat=3)])
+        nonzero = np.sort(np.abs(dense[dense != 0]))[::-1]
+        top = grid.top_k(100)
+        assert len(top) == len(nonzero)
+        logs = [l for _, _, l in top]
+        assert all(math.isfinite(l) for l in logs)
+        np.testing.assert_allclose(np.exp(logs), nonzero, rtol=1e-12)
+        assert FactorizedGrid([0.5, 1.5], 2, [-2.0, 0.4]).top_k(3) == []
+
+    def test_negative_factors(self):
+        """Signed factors (rho < -2 makes F_1 negative) are summed correctly."""
+        rhos = [-3.0, 0.4, -2.5]
+        grid = FactorizedGrid([0, 0.5, 1, 1.5], 3, rhos)
+        dense = np.array([
+            float(calculate_3nj(list(j), rhos))
+            for j in itertools.product([0, 0.5, 1, 1.5], repeat=3)
+        ])
+        assert grid.sum() == pytest.approx(dense.sum(), rel=1e-12)
+        assert grid.norm() == pytest.approx(np.linalg.norm(dense), rel=1e-12)
+
+    def test_huge_grid_log_domain(self):
+        """A 40-edge grid with 101^40 points is summarised from its vectors."""
+        values = [n / 2 for n in range(101)]
+        grid = FactorizedGrid(values, 40, build_rhos(40))
+        sign, log_sum = grid.log_sum()
+        assert sign == 1.0
+        assert math.isfinite(log_sum)
+        assert grid.log_norm(math.inf) <= log_sum
+        assert len(grid.top_k(5)) == 5
+
+    def test_off_grid_spin(self, grid):
+        with pytest.raises(KeyError, match="not on the grid"):
+            grid.value([3, 0, 0, 0])
+
+    def test_length_mismatch_raises(self):
+        with pytest.raises(ValueError, match="Length mismatch"):
+            FactorizedGrid(VALUES, 3, rhos=[0.5, 0.2])
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark det(I - K) via np.linalg.det against the Cholesky slogdet backend.
+
+For antisymmetric K both give det(I - K); the Cholesky route works on
+I + KᵀK and returns a log-determinant, so it keeps working where det
+overflows. Timings are medians over repeated runs. In the recorded
+data/benchmark_slogdet.csv the Cholesky route is 1.06x-3.4x slower, the
+worst case being a single 16x16 matrix.
+"""
+import os
+import sys
+import csv
+import timeit
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "node-matrix-elements", "src")))
+
+from su2_3nj_gen.generating_functional import G_numeric, slogdet_I_minus_K
+from su2_node_matrix_elements import det_I_minus_K, slogdet_I_minus_K as node_slogdet
+
+
+def median_time(fn, repeat=7):
+    number, _ = timeit.Timer(fn).autorange()
+    return float(np.median(timeit.repeat(fn, number=number, repeat=repeat))) / number
+
+
+def main():
+    rng = np.random.default_rng(0)
+    rows = []
+
+    # Batched 6-j generating functional
+    for n_points in (10**3, 10**5):
+        xs = rng.uniform(-0.9, 0.9, size=(n_points, 2))
+        t_lu = median_time(lambda: G_numeric(xs, method="lu"))
+        t_ch = median_time(lambda: G_numeric(xs, method="cholesky"))
+        rows.append(("G_numeric 4x4", n_points, t_lu, t_ch))
+
+    # Single dense antisymmetric matrices of growing size
+    for n in (16, 64, 256, 512):
+        A = rng.normal(size=(n, n))
+        K = (A - A.T) / np.sqrt(n)
+        I = np.eye(n)
+        t_lu = median_time(lambda: np.linalg.det(I - K))
+        t_ch = median_time(lambda: slogdet_I_minus_K(K))
+        rows.append((f"dense {n}x{n}", 1, t_lu, t_ch))
+
+    # Node matrix element model
+    for n in (4, 16, 64):
+        spins = list(rng.integers(0, 6, size=n) / 2)
+        t_lu = median_time(lambda: det_I_minus_K(spins, backend="numpy"))
+        t_ch = median_time(lambda: node_slogdet(spins))
+        rows.append((f"node valence {n}", 1, t_lu, t_ch))
+
+    print(f"{'case':<18}{'batch':>8}{'det [s]':>12}{'cholesky [s]':>14}{'ratio':>8}")
+    for case, batch, t_lu, t_ch in rows:
+        print(f"{case:<18}{batch:>8}{t_lu:>12.3e}{t_ch:>14.3e}{t_ch / t_lu:>8.2f}")
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    data_path = os.path.join(script_dir, "..", "data", "benchmark_slogdet.csv")
+    os.makedirs(os.path.dirname(data_path), exist_ok=True)
+    with open(data_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["case", "batch", "det_seconds", "cholesky_seconds"])
+        writer.writerows(rows)
+    print("Results saved to:", os.path.relpath(data_path))
+
+
+if __name__ == "__main__":
+    main()
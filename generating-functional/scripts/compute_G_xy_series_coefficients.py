@@ -1,24 +1,28 @@
 import os
+import sys
 import sympy as sp
 import pandas as pd
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from su2_3nj_gen.series import TruncatedSeries
+
 # Define symbols
 x, y = sp.symbols('x y')
 
-# Define generating function
-G = 1/sp.sqrt(
+# Radicand of the generating function G = 1/sqrt(D)
+D = (
     (1 - x*y - x - y) *
     (1 + x*y - x + y) *
     (1 + x*y + x - y) *
     (1 - x*y + x + y)
 )
 
-# Series up to x^2,y^2
-expr_xy = sp.series(sp.series(G, x, 0, 3).removeO(), y, 0, 3).removeO()
+# Exact truncated series up to total degree 4 (covers x^2 y^2)
+G = TruncatedSeries.from_sympy(D, [x, y], 4).inv_sqrt()
 
 # Extract coefficients
 coeffs = {
-    (i, j): float(expr_xy.coeff(x, i).coeff(y, j))
+    (i, j): float(G.coeff((i, j)))
     for i in (0, 2) for j in (0, 2)
 }
 
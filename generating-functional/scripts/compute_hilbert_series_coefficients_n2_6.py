@@ -1,28 +1,24 @@
 # compute_hilbert_series_coefficients_n2_6.py
+import argparse
 import os
-import sympy as sp
-import pandas as pd
+import sys
 
-# Parameters
-t = sp.symbols('t')
-max_degree = 10
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from su2_3nj_gen.hilbert import write_hilbert_table
 
-# Compute Hilbert series coefficients for n=2..6
-data = {}
-for n in range(2, 7):
-    H = 1/(1 - t**2)**(n-1)
-    H_series = sp.series(H, t, 0, max_degree+1).removeO().expand()
-    coeffs = [int(H_series.coeff(t, k)) for k in range(max_degree+1)]
-    data[f'n={n}'] = coeffs
-
-# Build DataFrame
-df = pd.DataFrame(data, index=[f'deg {k}' for k in range(max_degree+1)])
-print(df)
+parser = argparse.ArgumentParser(description="Hilbert series coefficients of 1/(1 - t^2)^(n-1)")
+parser.add_argument('--max-n', type=int, default=6, help="largest n (columns n=2..max_n)")
+parser.add_argument('--max-degree', type=int, default=10)
+parser.add_argument('--even-only', action='store_true', help="skip the all-zero odd degrees")
+parser.add_argument('--output', default=None, help="CSV path (default: ../data/hilbert_series_coeffs_n2_6.csv)")
+args = parser.parse_args()
 
 # Ensure output directory exists and save CSV
 output_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data'))
 os.makedirs(output_dir, exist_ok=True)
-output_path = os.path.join(output_dir, 'hilbert_series_coeffs_n2_6.csv')
-df.to_csv(output_path, index_label='Degree')
+output_path = args.output or os.path.join(output_dir, 'hilbert_series_coeffs_n2_6.csv')
+
+# Coefficients come from the exact binomial recurrence and are streamed row by row
+rows = write_hilbert_table(output_path, range(2, args.max_n + 1), args.max_degree, even_only=args.even_only)
 
-print(f"Saved coefficients to {output_path}")
+print(f"Saved {rows} degrees for n=2..{args.max_n} to {output_path}")
@@ -1,21 +1,21 @@
 # scripts/test_15j_generating_function.py
 import os
+import sys
 import sympy as sp
 import pandas as pd
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from su2_3nj_gen.generating_functional import chain_det_I_minus_K
+
 # Define symbols for the 7 edge variables
 x1, x2, x3, x4, x5, x6, x7 = sp.symbols('x1 x2 x3 x4 x5 x6 x7')
 
-# Build the coupling matrix K for the 15-j tree (chain of 8 vertices)
-K = sp.zeros(8)
-edges = [(0,1,x1),(1,2,x2),(2,3,x3),(3,4,x4),(4,5,x5),(5,6,x6),(6,7,x7)]
-for i, j, x in edges:
-    K[i, j] = x
-    K[j, i] = -x
+# The 15-j tree is a chain of 8 vertices, so det(I - K) follows from the
+# continuant recurrence instead of a dense 8x8 symbolic determinant
+D = chain_det_I_minus_K([x1, x2, x3, x4, x5, x6, x7])
 
 # Define the generating function G(x1..x7)
-I = sp.eye(8)
-G = (I - K).det()**(-sp.Rational(1,2))
+G = D**(-sp.Rational(1,2))
 
 # Test 1: constant term (all j_e = 0)
 const_term = sp.simplify(G.subs({x1:0, x2:0, x3:0, x4:0, x5:0, x6:0, x7:0}))
@@ -0,0 +1,156 @@
+"""
+Numeric Taylor coefficients of the generating functional by Cauchy's formula.
+
+Sampling an analytic f on the polydisc torus |z_k| = r at M equispaced
+angles per variable and applying an n-dimensional FFT gives
+
+    c_alpha r^|alpha| + sum_{beta = alpha (mod M), beta != alpha} c_beta r^|beta|,
+
+so every coefficient with all exponents below M comes out of one vectorized
+grid evaluation. The aliased terms decay like (r / R)^M for a convergence
+radius R, while rounding errors grow like eps * max|f| / r^|alpha|; the
+radius trades one against the other. Evaluating a second torus at a
+slightly smaller radius s r changes each aliased term by s^M and leaves the
+true coefficient alone, which yields an aliasing estimate.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import sympy as sp
+
+
+@dataclass(frozen=True)
+class CauchyResult:
+    """
+    Taylor coefficients extracted on a torus.
+    coeffs: array of shape (degree + 1,) * nvars, coeffs[a1, ..., an] being
+        the coefficient of x1^a1 ... xn^an.
+    error: estimated absolute error of each coefficient (aliasing plus
+        rounding), same shape as coeffs.
+    radius: torus radius used.
+    n_points: samples per variable.
+    """
+
+    coeffs: np.ndarray
+    error: np.ndarray
+    radius: float
+    n_points: int
+
+
+def G_function(edges, symbols):
+    """
+    Vectorized G = det(I - K)^(-1/2) for a graph, at complex points.
+    edges: list of (i, j, x) as for su2_3nj_gen.graph, x a polynomial in
+        `symbols`.
+    Returns f(z) taking an (N, len(symbols)) complex array. The principal
+    square root is continued from det = 1 at the origin, which is only
+    trusted where Re det(I - K) > 0; other points give nan, so that radius
+    selection moves away from branch cuts.
+    """
+    n = 1 + max((max(i, j) for i, j, _ in edges), default=-1)
+    rows = np.array([i for i, _, _ in edges], dtype=np.int64)
+    cols = np.array([j for _, j, _ in edges], dtype=np.int64)
+    funcs = [sp.lambdify(symbols, x, "numpy") for _, _, x in edges]
+
+    def f(z):
+        z = np.asarray(z, dtype=complex)
+        A = np.broadcast_to(np.eye(n, dtype=complex), (len(z), n, n)).copy()
+        for e, func in enumerate(funcs):
+            x = np.broadcast_to(func(*z.T), (len(z),))
+            # I - K with K[i, j] = x, K[j, i] = -x
+            A[:, rows[e], cols[e]] -= x
+            A[:, cols[e], rows[e]] += x
+        det = np.linalg.det(A)
+        # Points with det == 0 or det not finite are masked to nan below.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = 1 / np.sqrt(det)
+        out[~(det.real > 0)] = np.nan
+        return out
+
+    return f
+
+
+def _torus_coefficients(f, nvars, degree, radius, n_points, chunk_size):
+    """One torus evaluation followed by an n-dimensional FFT."""
+    angles = np.exp(2j * np.pi * np.arange(n_points) / n_points)
+    grids = np.meshgrid(*([radius * angles] * nvars), indexing="ij")
+    z = np.stack([g.ravel() for g in grids], axis=-1)
+
+    values = np.empty(len(z), dtype=complex)
+    for lo in range(0, len(z), chunk_size):
+        values[lo:lo + chunk_size] = f(z[lo:lo + chunk_size])
+    if not np.all(np.isfinite(values)):
+        return None, None
+
+    spectrum = np.fft.fftn(values.reshape((n_points,) * nvars)) / n_points ** nvars
+    box = spectrum[(slice(0, degree + 1),) * nvars]
+    powers = np.indices((degree + 1,) * nvars).sum(axis=0)
+    scale = radius ** -powers.astype(float)
+    rounding = np.finfo(float).eps * np.abs(values).max() * scale * nvars * np.log2(n_points)
+    return box * scale, rounding
+
+
+def cauchy_coefficients(f, nvars, degree, radius=None, n_points=None, shrink=0.9, chunk_size=1 << 16):
+    """
+    Extract all Taylor coefficients with exponents <= degree from a torus grid.
+    f: vectorized function of an (N, nvars) complex array, analytic near 0;
+        nan or inf values mark points outside its domain.
+    radius: torus radius; chosen automatically if None, by shrinking from 1
+        until f is finite on the grid and then picking, among a few
+        candidate radii, the one with the smallest worst-case error estimate.
+    n_points: samples per variable (default 2 * (degree + 1)); must exceed
+        degree.
+    shrink: ratio of the second radius used for the aliasing estimate.
+    Returns a CauchyResult; for real-coefficient functions take .coeffs.real.
+    """
+    if n_points is None:
+        n_points = 2 * (degree + 1)
+    if n_points <= degree:
+        raise ValueError("n_points must exceed degree")
+    alias_damping = 1 - shrink ** n_points
+
+    def attempt(r):
+        c1, round1 = _torus_coefficients(f, nvars, degree, r, n_points, chunk_size)
+        if c1 is None:
+            return None
+        c2, round2 = _torus_coefficients(f, nvars, degree, r * shrink, n_points, chunk_size)
+        if c2 is None:
+            return None
+        # The difference isolates the leading aliased terms; the factor 2
+        # covers the ones further out.
+        error = 2 * np.abs(c1 - c2) / alias_damping + round1 + round2
+        return CauchyResult(c1, error, float(r), n_points)
+
+    if radius is not None:
+        result = attempt(radius)
+        if result is None:
+            raise ValueError(f"f is not finite on the torus of radius {radius}")
+        return result
+
+    r = 1.0
+    result = attempt(r)
+    while result is None:
+        r *= 0.75
+        if r < 1e-6:
+            raise ValueError("No radius down to 1e-6 keeps f finite on the torus")
+        result = attempt(r)
+
+    best = result
+    for _ in range(4):
+        r *= 0.75
+        candidate = attempt(r)
+        if candidate is not None and candidate.error.max() < best.error.max():
+            best = candidate
+    return best
+
+
+def G_coefficients_fft(edges, symbols, degree, **kwargs):
+    """
+    Taylor coefficients of G = det(I - K)^(-1/2) up to exponent `degree` in
+    each variable, from torus samples of G_function(edges, symbols).
+    Keyword arguments are passed to cauchy_coefficients. The coefficients
+    of G are real, so the real part is returned in .coeffs.
+    """
+    result = cauchy_coefficients(G_function(edges, symbols), len(symbols), degree, **kwargs)
+    return CauchyResult(result.coeffs.real, result.error, result.radius, result.n_points)
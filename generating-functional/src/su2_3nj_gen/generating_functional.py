@@ -16,13 +16,15 @@ def _build_K_symbolic(xs):
 def _build_K_numeric(xs):
     """
     Build numeric adjacency matrix K (4×4) for the 6-j example.
-    xs: sequence of two floats [x1, x2].
+    xs: sequence of two floats [x1, x2], or an (N, 2) array giving a
+        stack of N matrices of shape (N, 4, 4).
     """
-    x1, x2 = xs
-    K = np.zeros((4,4))
-    K[0,1] = x1; K[1,0] = -x1
-    K[1,2] = x2; K[2,1] = -x2
-    K[2,3] = x1; K[3,2] = -x1
+    xs = np.asarray(xs, dtype=float)
+    x1, x2 = xs[..., 0], xs[..., 1]
+    K = np.zeros(xs.shape[:-1] + (4,4))
+    K[...,0,1] = x1; K[...,1,0] = -x1
+    K[...,1,2] = x2; K[...,2,1] = -x2
+    K[...,2,3] = x1; K[...,3,2] = -x1
     return K
 
 def G_exact(xs):
@@ -34,11 +36,61 @@ def G_exact(xs):
     I = sp.eye(4)
     return 1/sp.sqrt((I - K).det())
 
-def G_numeric(xs):
+def chain_det_I_minus_K(xs):
+    """
+    det(I – K) for a chain of len(xs) + 1 vertices with edge variables xs,
+    K[k, k+1] = x_k, K[k+1, k] = -x_k, in O(n) by the continuant recurrence
+    D_k = D_{k-1} + x_k^2 D_{k-2}, D_{-1} = D_0 = 1.
+    xs: floats or a float array (the last axis runs over the edges, so an
+        (N, n) array gives N determinants); ints and Fractions (exact);
+        or sympy expressions (the result is an expanded polynomial).
+    """
+    if isinstance(xs, np.ndarray) and xs.dtype != object:
+        xs = xs.astype(float)
+        prev = np.ones(xs.shape[:-1])
+        cur = np.ones(xs.shape[:-1])
+        for k in range(xs.shape[-1]):
+            prev, cur = cur, cur + xs[..., k]**2 * prev
+        return cur
+    symbolic = any(isinstance(x, sp.Basic) for x in xs)
+    prev, cur = 1, 1
+    for x in xs:
+        prev, cur = cur, cur + x**2 * prev
+        if symbolic:
+            cur = sp.expand(cur)
+    return sp.sympify(cur) if symbolic else cur
+
+def slogdet_I_minus_K(K):
+    """
+    Sign and log|det(I – K)| for real antisymmetric K, by Cholesky.
+    K: (n, n) array or a stack of shape (..., n, n).
+    Uses det(I – K)^2 = det(I + KᵀK): I + KᵀK is symmetric positive
+    definite and det(I – K) > 0, so log det(I – K) is the sum of the logs
+    of the Cholesky diagonal and never overflows. Returns (sign, logabsdet)
+    like np.linalg.slogdet; sign is always 1.
+    """
+    K = np.asarray(K, dtype=float)
+    A = np.eye(K.shape[-1]) + np.swapaxes(K, -1, -2) @ K
+    L = np.linalg.cholesky(A)
+    logdet = np.sum(np.log(np.diagonal(L, axis1=-2, axis2=-1)), axis=-1)
+    return np.ones_like(logdet), logdet
+
+def G_numeric(xs, method="lu"):
     """
     Numeric evaluation of G({x_e}).
-    xs: list of two floats.
+    xs: list of two floats, or an (N, 2) array of edge variables.
+    method: "lu" for np.linalg.det, "cholesky" for slogdet_I_minus_K.
+    Returns a float for a single point and an array of N values for an
+    (N, 2) array; all determinants are taken in one stacked call.
     """
+    xs = np.asarray(xs, dtype=float)
+    if xs.shape[-1:] != (2,) or xs.ndim > 2:
+        raise ValueError(f"xs must have shape (2,) or (N, 2), got {xs.shape}")
     K = _build_K_numeric(xs)
+    if method == "cholesky":
+        _, logdet = slogdet_I_minus_K(K)
+        return np.exp(-0.5 * logdet)
+    if method != "lu":
+        raise ValueError(f"Unknown method: {method}")
     I = np.eye(4)
     return 1/np.sqrt(np.linalg.det(I - K))
@@ -0,0 +1,66 @@
+"""
+Hilbert-series coefficients of 1/(1 - t^2)^(n-1).
+
+The coefficient of t^(2k) is C(k + n - 2, n - 2) and every odd coefficient
+vanishes. Consecutive even coefficients satisfy the exact integer recurrence
+
+    c_{k+1} = c_k (k + n - 1) / (k + 1),
+
+so a column of the table costs one big-integer multiply and divide per
+degree, and tables for n up to ~10^3 and degree up to ~10^6 are written row
+by row without building the series symbolically.
+"""
+
+import csv
+from math import comb
+
+
+def hilbert_coefficient(n, degree):
+    """Coefficient of t^degree in 1/(1 - t^2)^(n-1), for n >= 1."""
+    if n < 1 or degree < 0:
+        raise ValueError("n must be >= 1 and degree non-negative")
+    if degree % 2:
+        return 0
+    if n == 1:
+        return int(degree == 0)
+    return comb(degree // 2 + n - 2, n - 2)
+
+
+def iter_hilbert_coefficients(n, max_degree):
+    """
+    Yield the coefficients of t^0, t^1, ..., t^max_degree in
+    1/(1 - t^2)^(n-1) as Python ints, for n >= 1.
+    """
+    if n < 1 or max_degree < 0:
+        raise ValueError("n must be >= 1 and max_degree non-negative")
+    c = 1
+    for k in range(max_degree // 2 + 1):
+        yield c
+        if 2 * k + 1 <= max_degree:
+            yield 0
+        # The division is exact: c_{k+1} = C(k + n - 1, n - 2).
+        c = c * (k + n - 1) // (k + 1)
+
+
+def write_hilbert_table(path, ns, max_degree, even_only=False):
+    """
+    Stream the coefficient table to a CSV file.
+    path: output file path.
+    ns: values of n, one column each ("n=<n>").
+    even_only: skip the odd degrees, whose coefficients are all zero.
+    The layout matches data/hilbert_series_coeffs_n2_6.csv: a "Degree"
+    column with "deg <k>" labels followed by one column per n.
+    Returns the number of rows written.
+    """
+    ns = list(ns)
+    columns = [iter_hilbert_coefficients(n, max_degree) for n in ns]
+    rows = 0
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["Degree"] + [f"n={n}" for n in ns])
+        for degree, values in enumerate(zip(*columns)):
+            if even_only and degree % 2:
+                continue
+            writer.writerow([f"deg {degree}", *values])
+            rows += 1
+    return rows
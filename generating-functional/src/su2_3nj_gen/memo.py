@@ -0,0 +1,170 @@
+"""
+Symmetry-canonical memoization of 6j and 9j symbols.
+
+The 6j symbol {j1 j2 j3; j4 j5 j6} enters Racah's formula only through its
+four triad sums alpha_i and three opposite-pair sums beta_k: the sum is
+symmetric in both sets and every triangle coefficient leg is some
+beta_k - alpha_i. The 144 tetrahedral and Regge symmetries permute the
+alphas and the betas, so the sorted pair (alphas, betas) is a canonical
+key with phase +1.
+
+The 9j symbol is invariant under transposition and changes by
+(-1)^(sum of all nine j) under an odd permutation of its rows or of its
+columns. Its canonical key is the lexicographically smallest of the 72
+images, together with the phase relating it to the input.
+
+SymbolCache is a bounded LRU map from canonical keys to values of the
+canonical representative, with hit and miss counters.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+from itertools import permutations
+
+import sympy as sp
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+def _twice_all(js):
+    """2j for every spin, or None if some spin is not a half-integer."""
+    twice = [2 * sp.Rational(j) for j in js]
+    if not all(t.is_integer for t in twice):
+        return None
+    return [int(t) for t in twice]
+
+
+def _parity(perm):
+    """+1 for an even permutation of range(len(perm)), -1 for an odd one."""
+    sign = 1
+    for i in range(len(perm)):
+        for k in range(i + 1, len(perm)):
+            if perm[i] > perm[k]:
+                sign = -sign
+    return sign
+
+
+_PERMS_3 = [(p, _parity(p)) for p in permutations(range(3))]
+
+
+def canonical_6j(*js):
+    """
+    Canonical key and phase of {j1 j2 j3; j4 j5 j6}.
+    Every one of the 144 symmetric images gets the same key; the phase is
+    always +1. Spins are stored as 2j, so the key is a tuple of ints. The
+    key is None when a spin is not a half-integer.
+    """
+    if len(js) != 6:
+        raise ValueError(f"Expected 6 spins, got {len(js)}")
+    t = _twice_all(js)
+    if t is None:
+        return None, 1
+    return canonical_6j_twice(*t)
+
+
+def canonical_6j_twice(t1, t2, t3, t4, t5, t6):
+    """canonical_6j for twice-spins given as ints."""
+    alphas = sorted((t1 + t2 + t3, t1 + t5 + t6, t4 + t2 + t6, t4 + t5 + t3))
+    betas = sorted((t1 + t2 + t4 + t5, t2 + t3 + t5 + t6, t1 + t3 + t4 + t6))
+    return ("6j",) + tuple(alphas) + tuple(betas), 1
+
+
+def canonical_9j(*js):
+    """
+    Canonical key and phase of the 9j symbol with rows (j1 j2 j3),
+    (j4 j5 j6), (j7 j8 j9).
+    Returns (key, phase) with symbol(js) = phase * symbol(canonical form);
+    the key holds the canonical form as 2j values in row-major order, and
+    is None when a spin is not a half-integer.
+    """
+    if len(js) != 9:
+        raise ValueError(f"Expected 9 spins, got {len(js)}")
+    t = _twice_all(js)
+    if t is None:
+        return None, 1
+    total = sum(t)
+    # A non-integer spin sum only occurs for symbols that vanish or are
+    # rejected; no phase is needed then.
+    odd_phase = -1 if total % 4 == 2 else 1
+
+    rows = [t[0:3], t[3:6], t[6:9]]
+    best = None
+    for grid in (rows, [list(c) for c in zip(*rows)]):
+        for rp, rs in _PERMS_3:
+            for cp, cs in _PERMS_3:
+                image = tuple(grid[r][c] for r in rp for c in cp)
+                if best is None or image < best[0]:
+                    best = (image, rs * cs)
+    image, sign = best
+    phase = odd_phase if sign < 0 else 1
+    return ("9j",) + image, phase
+
+
+class SymbolCache:
+    """
+    Bounded LRU cache of symbol values keyed on canonical keys.
+
+    The cache is safe to share between threads.
+
+    Parameters:
+        maxsize: Maximum number of values kept before the least recently
+            used entry is evicted
+    """
+
+    def __init__(self, maxsize=8192):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(self, key, phase, compute):
+        """
+        Return the symbol value for an input with canonical (key, phase).
+        compute: zero-argument callable giving the value of the input
+            itself; only called on a miss. Exceptions propagate and
+            nothing is stored. A key of None bypasses the cache.
+        """
+        if key is None:
+            return compute()
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                value = self._entries[key]
+                return value if phase > 0 else -value
+            self._misses += 1
+
+        value = compute()
+        canonical = value if phase > 0 else -value
+        with self._lock:
+            self._entries[key] = canonical
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def cache_info(self):
+        """Return CacheInfo(hits, misses, maxsize, currsize)."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def hit_rate(self):
+        """Fraction of lookups answered from the cache (0.0 before any lookup)."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return self._hits / lookups if lookups else 0.0
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
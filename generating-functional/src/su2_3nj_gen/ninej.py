@@ -0,0 +1,134 @@
+"""
+9j symbols as a single sum over products of three cached 6j symbols.
+
+    {j1 j2 j3; j4 j5 j6; j7 j8 j9}
+        = sum_x (-1)^(2x) (2x+1) {j1 j4 j7; j8 j9 x} {j2 j5 j8; j4 x j6} {j3 j6 j9; x j1 j2}
+
+with x running in integer steps over the intersection of the triangles
+(j1, j9, x), (j8, j4, x) and (j2, j6, x). In each product the triangle
+coefficients of the triads containing x appear squared, and the remaining
+six are the row and column triads of the 9j. Every term is therefore a
+rational multiple of the same square root sqrt(P), P the product of the
+six row/column Delta^2, and the exact sum is rational arithmetic.
+
+The 6j factors come from racah_6j_squared_twice through a SymbolCache on
+canonical 6j keys, shared by default across calls so that sweeps reuse
+the 6j symbols common to neighbouring 9j symbols.
+"""
+
+from fractions import Fraction
+from math import isqrt, sqrt
+
+import sympy as sp
+
+from .memo import SymbolCache, canonical_6j_twice
+from .racah import _twice, delta_squared, racah_6j_squared_twice
+
+
+# Exact (sign, square) pairs of 6j symbols used by the 9j sum.
+SIX_J_CACHE = SymbolCache(maxsize=1 << 16)
+
+
+def _six(cache, *t):
+    key, _ = canonical_6j_twice(*t)
+    return cache.lookup(key, 1, lambda: racah_6j_squared_twice(*t))
+
+
+def _terms(js, cache):
+    """Yield (x_twice, weight, six_j_pairs) for the 9j sum, or nothing if it vanishes."""
+    if len(js) != 9:
+        raise ValueError(f"Expected 9 spins, got {len(js)}")
+    t1, t2, t3, t4, t5, t6, t7, t8, t9 = t = [_twice(j) for j in js]
+    if any(x < 0 for x in t):
+        raise ValueError("Spins must be non-negative")
+    if cache is None:
+        cache = SIX_J_CACHE
+
+    pairs = ((t1 + t9, abs(t1 - t9)), (t4 + t8, abs(t4 - t8)), (t2 + t6, abs(t2 - t6)))
+    if len({hi % 2 for hi, _ in pairs}) > 1:
+        return
+    lo = max(low for _, low in pairs)
+    hi = min(high for high, _ in pairs)
+    for x in range(lo, hi + 1, 2):
+        six = (
+            _six(cache, t1, t4, t7, t8, t9, x),
+            _six(cache, t2, t5, t8, t4, x, t6),
+            _six(cache, t3, t6, t9, x, t1, t2),
+        )
+        if all(s for s, _ in six):
+            yield x, (-1 if x % 2 else 1) * (x + 1), six
+
+
+def _outer_triads(js):
+    """The row and column triads of a 9j symbol, in twice-spin units."""
+    t1, t2, t3, t4, t5, t6, t7, t8, t9 = [_twice(j) for j in js]
+    return ((t1, t2, t3), (t4, t5, t6), (t7, t8, t9),
+            (t1, t4, t7), (t2, t5, t8), (t3, t6, t9))
+
+
+def _outer_deltas(js):
+    """Product of the squared triangle coefficients of the rows and columns."""
+    product = Fraction(1)
+    for triad in _outer_triads(js):
+        product *= delta_squared(*triad)
+    return product
+
+
+def ninej_parity_ok(*js):
+    """
+    True if every row and column triad has an integer spin sum. This is
+    the condition under which sympy's wigner_9j evaluates rather than
+    raising; triangle violations alone give 0 there, as here.
+    """
+    if len(js) != 9:
+        raise ValueError(f"Expected 9 spins, got {len(js)}")
+    return all(sum(triad) % 2 == 0 for triad in _outer_triads(js))
+
+
+def ninej_squared(*js, cache=None):
+    """
+    The 9j symbol with rows (j1 j2 j3), (j4 j5 j6), (j7 j8 j9) as an exact
+    (sign, square) pair, the symbol being sign * sqrt(square).
+    Triangle or parity violations give (0, Fraction(0)).
+    cache: SymbolCache for the 6j factors (default SIX_J_CACHE).
+    """
+    terms = list(_terms(js, cache))
+    outer = _outer_deltas(js) if terms else Fraction(0)
+    if outer == 0:
+        return 0, Fraction(0)
+
+    total = Fraction(0)
+    for x, weight, six in terms:
+        sign = six[0][0] * six[1][0] * six[2][0]
+        ratio = six[0][1] * six[1][1] * six[2][1] / outer
+        num, den = isqrt(ratio.numerator), isqrt(ratio.denominator)
+        # The Delta^2 of triads containing x pair up, so ratio is a square.
+        if num * num != ratio.numerator or den * den != ratio.denominator:
+            raise ArithmeticError(f"6j product over the 9j Deltas is not a rational square at 2x = {x}")
+        total += weight * sign * Fraction(num, den)
+
+    if total == 0:
+        return 0, Fraction(0)
+    return (1 if total > 0 else -1), total * total * outer
+
+
+def ninej(*js, exact=True, cache=None):
+    """
+    The 9j symbol with rows (j1 j2 j3), (j4 j5 j6), (j7 j8 j9).
+    exact: return an exact sympy value if True, else a float summed in
+        floating point from the cached exact 6j factors.
+    cache: SymbolCache for the 6j factors (default SIX_J_CACHE).
+    """
+    if exact:
+        sign, square = ninej_squared(*js, cache=cache)
+        if sign == 0:
+            return sp.Rational(0)
+        return sign * sp.sqrt(sp.Rational(square.numerator, square.denominator))
+
+    total = 0.0
+    for _, weight, six in _terms(js, cache):
+        term = float(weight)
+        for s, square in six:
+            term *= s * sqrt(square)
+        total += term
+    return total
@@ -0,0 +1,117 @@
+"""
+Exact Racah sum for the 6j symbol in Python integers.
+
+Racah's formula writes {j1 j2 j3; j4 j5 j6} as a product of four triangle
+coefficients Delta(a, b, c) times
+
+    sum_z (-1)^z (z+1)! / prod_i (z - a_i)! prod_k (b_k - z)!,
+
+with a_i the four triad sums and b_k the three sums over pairs of opposite
+edges. Consecutive terms differ by the rational factor
+
+    t_{z+1} / t_z = -(z+2) prod_k (b_k - z) / prod_i (z+1 - a_i),
+
+so after the first term, which needs factorials, the sum is nested Horner
+style in integer numerators and denominators and reduced once at the end.
+The symbol is returned as (sign, square): value = sign * sqrt(square), with
+square a Fraction, because the triangle coefficients are square roots of
+rationals while the sum is rational.
+"""
+
+from fractions import Fraction
+from math import factorial
+
+import sympy as sp
+
+
+def _twice(j):
+    """2j as an int, for ints, Fractions and sympy Rationals."""
+    two_j = 2 * sp.Rational(j)
+    if not two_j.is_integer:
+        raise ValueError(f"Invalid spin {j}: must be integer or half-integer")
+    return int(two_j)
+
+
+def _triads(t1, t2, t3, t4, t5, t6):
+    """The four coupled triads of a 6j symbol, in twice-spin units."""
+    return ((t1, t2, t3), (t1, t5, t6), (t4, t2, t6), (t4, t5, t3))
+
+
+def triads_integral(*js):
+    """True if every triad of the 6j symbol has an integer spin sum."""
+    return all(sum(t) % 2 == 0 for t in _triads(*map(_twice, js)))
+
+
+def delta_squared(a, b, c):
+    """
+    Squared triangle coefficient Delta(a, b, c)^2 for twice-spins a, b, c,
+    as a Fraction; zero if the triad violates the triangle or parity rule.
+    """
+    legs = (a + b - c, a - b + c, -a + b + c)
+    if min(legs) < 0 or (a + b + c) % 2:
+        return Fraction(0)
+    num = factorial(legs[0] // 2) * factorial(legs[1] // 2) * factorial(legs[2] // 2)
+    return Fraction(num, factorial((a + b + c) // 2 + 1))
+
+
+def racah_6j_squared(*js):
+    """
+    The 6j symbol {j1 j2 j3; j4 j5 j6} as an exact (sign, square) pair.
+
+    Returns (sign, square) with sign in {-1, 0, 1} and square a Fraction,
+    the symbol being sign * sqrt(square). Triangle violations, and triads
+    whose spins do not sum to an integer, give (0, Fraction(0)).
+    """
+    if len(js) != 6:
+        raise ValueError(f"Expected 6 spins, got {len(js)}")
+    t = [_twice(j) for j in js]
+    if any(x < 0 for x in t):
+        raise ValueError("Spins must be non-negative")
+    return racah_6j_squared_twice(*t)
+
+
+def racah_6j_squared_twice(t1, t2, t3, t4, t5, t6):
+    """racah_6j_squared for non-negative twice-spins given as ints."""
+    t = (t1, t2, t3, t4, t5, t6)
+    delta_sq = Fraction(1)
+    for triad in _triads(*t):
+        d = delta_squared(*triad)
+        if d == 0:
+            return 0, Fraction(0)
+        delta_sq *= d
+
+    lows = [sum(tri) // 2 for tri in _triads(*t)]
+    highs = [(t1 + t2 + t4 + t5) // 2, (t2 + t3 + t5 + t6) // 2, (t1 + t3 + t4 + t6) // 2]
+    zmin, zmax = max(lows), min(highs)
+    if zmin > zmax:
+        return 0, Fraction(0)
+
+    # Nested sum t_zmin * (1 + r_zmin (1 + r_{zmin+1} (1 + ...))) as p / q.
+    p, q = 1, 1
+    for z in range(zmax - 1, zmin - 1, -1):
+        n = -(z + 2)
+        d = 1
+        for b in highs:
+            n *= b - z
+        for a in lows:
+            d *= z + 1 - a
+        p, q = d * q + n * p, d * q
+
+    first_den = 1
+    for a in lows:
+        first_den *= factorial(zmin - a)
+    for b in highs:
+        first_den *= factorial(b - zmin)
+    total = Fraction((-1) ** zmin * factorial(zmin + 1) * p, first_den * q)
+
+    if total == 0:
+        return 0, Fraction(0)
+    return (1 if total > 0 else -1), delta_sq * total * total
+
+
+def racah_6j(*js):
+    """The 6j symbol as an exact sympy value, sign * sqrt(square)."""
+    sign, square = racah_6j_squared(*js)
+    if sign == 0:
+        return sp.Rational(0)
+    return sign * sp.sqrt(sp.Rational(square.numerator, square.denominator))
@@ -0,0 +1,315 @@
+"""
+Truncated multivariate power series for generating-functional coefficients.
+
+A TruncatedSeries holds every coefficient of total degree <= degree in a
+dense 1-D NumPy array indexed by the monomials in graded order. Exact
+series use object arrays of Python ints and Fractions, so no precision is
+lost; float series use float64. Products go through a cached table of
+monomial pairs whose degrees add up to at most the truncation degree, the
+determinant is taken by Gaussian elimination over the series ring, and the
+inverse square root by Newton iteration, which doubles the number of
+correct degrees per step. Together these give the coefficients of
+G = det(I - K)^(-1/2) to high total degree for any graph.
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from math import comb, isqrt
+
+import numpy as np
+import sympy as sp
+
+
+@lru_cache(maxsize=32)
+def _monomials(nvars, degree):
+    """Exponent tuples of total degree <= degree (graded order) and their index."""
+    monomials = []
+    for d in range(degree + 1):
+        block = []
+        for combo in combinations_with_replacement(range(nvars), d):
+            exps = [0] * nvars
+            for v in combo:
+                exps[v] += 1
+            block.append(tuple(exps))
+        monomials.extend(sorted(block, reverse=True))
+    return tuple(monomials), {m: i for i, m in enumerate(monomials)}
+
+
+@lru_cache(maxsize=32)
+def _product_table(nvars, degree):
+    """Index arrays (i, j, k) with monomial_i * monomial_j = monomial_k, degree <= degree."""
+    monomials, index = _monomials(nvars, degree)
+    rows_i, rows_j, rows_k = [], [], []
+    for i, a in enumerate(monomials):
+        room = degree - sum(a)
+        # In graded order the monomials of degree <= room come first.
+        for j in range(comb(room + nvars, nvars)):
+            b = monomials[j]
+            rows_i.append(i)
+            rows_j.append(j)
+            rows_k.append(index[tuple(x + y for x, y in zip(a, b))])
+    return (
+        np.array(rows_i, dtype=np.int64),
+        np.array(rows_j, dtype=np.int64),
+        np.array(rows_k, dtype=np.int64),
+    )
+
+
+def _exact_scalar(c):
+    """Convert a number to int/Fraction (exact) or leave floats alone."""
+    if isinstance(c, (int, Fraction, float)):
+        return c
+    if isinstance(c, sp.Integer):
+        return int(c)
+    if isinstance(c, sp.Rational):
+        return Fraction(int(c.p), int(c.q))
+    if isinstance(c, sp.Float):
+        return float(c)
+    if isinstance(c, np.integer):
+        return int(c)
+    if isinstance(c, np.floating):
+        return float(c)
+    raise TypeError(f"Unsupported coefficient type {type(c).__name__}")
+
+
+class TruncatedSeries:
+    """
+    Multivariate power series truncated at a total degree.
+
+    nvars: number of variables.
+    degree: largest total degree kept.
+    coeffs: optional 1-D array of coefficients in graded monomial order;
+        object dtype for exact arithmetic, float64 for floating point.
+    """
+
+    def __init__(self, nvars, degree, coeffs=None, exact=True):
+        if nvars < 1 or degree < 0:
+            raise ValueError("nvars must be positive and degree non-negative")
+        self.nvars = nvars
+        self.degree = degree
+        size = comb(degree + nvars, nvars)
+        if coeffs is None:
+            coeffs = np.zeros(size, dtype=object) if exact else np.zeros(size)
+            if exact:
+                coeffs[:] = 0
+        elif len(coeffs) != size:
+            raise ValueError(f"Expected {size} coefficients, got {len(coeffs)}")
+        self.coeffs = coeffs
+
+    # -- construction -----------------------------------------------------
+
+    @property
+    def exact(self):
+        return self.coeffs.dtype == object
+
+    def _empty(self):
+        return TruncatedSeries(self.nvars, self.degree, exact=self.exact)
+
+    @classmethod
+    def constant(cls, c, nvars, degree, exact=True):
+        """The constant series c."""
+        s = cls(nvars, degree, exact=exact)
+        s.coeffs[0] = _exact_scalar(c) if exact else float(c)
+        return s
+
+    @classmethod
+    def variable(cls, i, nvars, degree, exact=True):
+        """The series of the i-th variable."""
+        s = cls(nvars, degree, exact=exact)
+        if degree >= 1:
+            exps = [0] * nvars
+            exps[i] = 1
+            s.coeffs[_monomials(nvars, degree)[1][tuple(exps)]] = 1
+        return s
+
+    @classmethod
+    def from_sympy(cls, expr, symbols, degree, exact=True):
+        """Truncate a polynomial sympy expression in `symbols`."""
+        s = cls(len(symbols), degree, exact=exact)
+        index = _monomials(len(symbols), degree)[1]
+        poly = sp.Poly(sp.expand(expr), *symbols)
+        for exps, c in poly.terms():
+            if sum(exps) <= degree:
+                s.coeffs[index[exps]] = _exact_scalar(c) if exact else float(c)
+        return s
+
+    def _coerce(self, other):
+        if isinstance(other, TruncatedSeries):
+            if (other.nvars, other.degree, other.exact) != (self.nvars, self.degree, self.exact):
+                raise ValueError("Series must share nvars, degree and exactness")
+            return other
+        return TruncatedSeries.constant(other, self.nvars, self.degree, exact=self.exact)
+
+    # -- access -----------------------------------------------------------
+
+    def coeff(self, exponents):
+        """Coefficient of the monomial with the given exponent tuple."""
+        exponents = tuple(exponents)
+        if sum(exponents) > self.degree:
+            raise ValueError(f"Total degree {sum(exponents)} exceeds truncation degree {self.degree}")
+        return self.coeffs[_monomials(self.nvars, self.degree)[1][exponents]]
+
+    def items(self):
+        """Yield (exponents, coefficient) for the non-zero coefficients."""
+        monomials = _monomials(self.nvars, self.degree)[0]
+        for m, c in zip(monomials, self.coeffs):
+            if c != 0:
+                yield m, c
+
+    def to_sympy(self, symbols):
+        """Return the truncated polynomial as a sympy expression."""
+        terms = []
+        for exps, c in self.items():
+            c = sp.Rational(c.numerator, c.denominator) if isinstance(c, Fraction) else c
+            terms.append(c * sp.Mul(*(s ** e for s, e in zip(symbols, exps))))
+        return sp.Add(*terms)
+
+    # -- arithmetic -------------------------------------------------------
+
+    def __add__(self, other):
+        other = self._coerce(other)
+        return TruncatedSeries(self.nvars, self.degree, self.coeffs + other.coeffs)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return TruncatedSeries(self.nvars, self.degree, -self.coeffs)
+
+    def __sub__(self, other):
+        return self + (-self._coerce(other))
+
+    def __rsub__(self, other):
+        return self._coerce(other) - self
+
+    def __mul__(self, other):
+        if not isinstance(other, TruncatedSeries):
+            c = _exact_scalar(other) if self.exact else float(other)
+            return TruncatedSeries(self.nvars, self.degree, self.coeffs * c)
+        other = self._coerce(other)
+        i, j, k = _product_table(self.nvars, self.degree)
+        a = self.coeffs[i]
+        b = other.coeffs[j]
+        keep = (a != 0) & (b != 0)
+        if self.exact:
+            out = self._empty()
+            np.add.at(out.coeffs, k[keep], a[keep] * b[keep])
+            return out
+        coeffs = np.bincount(k[keep], weights=a[keep] * b[keep], minlength=len(self.coeffs))
+        return TruncatedSeries(self.nvars, self.degree, coeffs)
+
+    __rmul__ = __mul__
+
+    def __pow__(self, n):
+        if not isinstance(n, int) or n < 0:
+            raise ValueError("Only non-negative integer powers are supported")
+        result = TruncatedSeries.constant(1, self.nvars, self.degree, exact=self.exact)
+        base = self
+        while n:
+            if n & 1:
+                result = result * base
+            base = base * base
+            n >>= 1
+        return result
+
+    def _newton_steps(self):
+        # Each step doubles the number of correct total degrees.
+        steps, correct = 0, 1
+        while correct <= self.degree:
+            correct *= 2
+            steps += 1
+        return steps
+
+    def inverse(self):
+        """Multiplicative inverse, by Newton iteration y <- y (2 - a y)."""
+        a0 = self.coeffs[0]
+        if a0 == 0:
+            raise ZeroDivisionError("Series with zero constant term is not invertible")
+        y = TruncatedSeries.constant(Fraction(1) / a0 if self.exact else 1.0 / a0,
+                                     self.nvars, self.degree, exact=self.exact)
+        for _ in range(self._newton_steps()):
+            y = y * (2 - self * y)
+        return y
+
+    def inv_sqrt(self):
+        """
+        Series of a^(-1/2), by Newton iteration y <- y (3 - a y^2) / 2.
+        The constant term must be positive; for exact series it must be
+        the square of a rational.
+        """
+        a0 = self.coeffs[0]
+        if not a0 > 0:
+            raise ValueError("inv_sqrt needs a positive constant term")
+        if self.exact:
+            a0 = Fraction(a0)
+            num, den = isqrt(a0.numerator), isqrt(a0.denominator)
+            if num * num != a0.numerator or den * den != a0.denominator:
+                raise ValueError(f"Constant term {a0} is not a rational square")
+            y0 = Fraction(den, num)
+            half = Fraction(1, 2)
+        else:
+            y0 = a0 ** -0.5
+            half = 0.5
+        y = TruncatedSeries.constant(y0, self.nvars, self.degree, exact=self.exact)
+        for _ in range(self._newton_steps()):
+            y = y * (3 - self * (y * y)) * half
+        return y
+
+    def __repr__(self):
+        return f"TruncatedSeries(nvars={self.nvars}, degree={self.degree}, terms={sum(1 for _ in self.items())})"
+
+
+def series_det(matrix):
+    """
+    Determinant of a square matrix (list of lists) of TruncatedSeries.
+    Gaussian elimination over the series ring, pivoting on entries whose
+    constant term is non-zero.
+    """
+    n = len(matrix)
+    A = [list(row) for row in matrix]
+    if any(len(row) != n for row in A):
+        raise ValueError("Matrix must be square")
+    if n == 0:
+        raise ValueError("Matrix must not be empty")
+    sign = 1
+    det = None
+    for col in range(n):
+        pivot = next((r for r in range(col, n) if A[r][col].coeffs[0] != 0), None)
+        if pivot is None:
+            raise ZeroDivisionError("No pivot with non-zero constant term; matrix is singular at 0")
+        if pivot != col:
+            A[col], A[pivot] = A[pivot], A[col]
+            sign = -sign
+        p = A[col][col]
+        det = p if det is None else det * p
+        inv = p.inverse()
+        for r in range(col + 1, n):
+            if not np.any(A[r][col].coeffs != 0):
+                continue
+            factor = A[r][col] * inv
+            for c in range(col + 1, n):
+                A[r][c] = A[r][c] - factor * A[col][c]
+    return det if sign > 0 else -det
+
+
+def G_series(edges, symbols, degree, exact=True):
+    """
+    Truncated series of G = det(I - K)^(-1/2) for a graph.
+    edges: list of (i, j, x) as for su2_3nj_gen.graph, with each x a
+        polynomial in `symbols`.
+    Coefficients are read with .coeff(exponents), exponents in the order
+    of `symbols`.
+    """
+    n = 1 + max((max(i, j) for i, j, _ in edges), default=-1)
+    nvars = len(symbols)
+    zero = TruncatedSeries(nvars, degree, exact=exact)
+    one = TruncatedSeries.constant(1, nvars, degree, exact=exact)
+    M = [[one if r == c else zero for c in range(n)] for r in range(n)]
+    for i, j, x in edges:
+        if i == j:
+            raise ValueError(f"Self-loop on vertex {i} is not allowed")
+        xs = TruncatedSeries.from_sympy(x, symbols, degree, exact=exact)
+        # I - K: K[i, j] = x, K[j, i] = -x
+        M[i][j] = M[i][j] - xs
+        M[j][i] = M[j][i] + xs
+    return series_det(M).inv_sqrt()
@@ -1,39 +1,57 @@
 import sympy as sp
 from sympy.physics.wigner import wigner_6j
+from .memo import SymbolCache, canonical_6j, canonical_9j
+from .ninej import ninej, ninej_parity_ok
+from .racah import racah_6j, triads_integral
 from .validation import validate_6j_spins, validate_9j_spins
 
-def generate_3nj(*js):
+# Shared by generate_3nj calls that do not pass their own cache.
+SYMBOL_CACHE = SymbolCache()
+
+def generate_3nj(*js, cache=None):
     """
     Compute the Wigner 3nj symbol for the list of spins in js.
     Supports:
       - 6-j (len(js)==6) via sympy.physics.wigner.wigner_6j
-      - 9-j (len(js)==9) via sympy.physics.wigner.wigner_9j (if available)
+      - 9-j (len(js)==9) via su2_3nj_gen.ninej, a single sum over cached
+        6-j symbols; like sympy's wigner_9j it raises ValueError when a
+        row or column has a non-integer spin sum
+    Values are memoized on a symmetry-canonical key (su2_3nj_gen.memo),
+    so any of the 144 (6-j) or 72 (9-j) symmetric images of a computed
+    symbol is a cache hit.
+    cache: SymbolCache to use (default SYMBOL_CACHE).
     """
     js_rat = [sp.Rational(j) for j in js]
+    if cache is None:
+        cache = SYMBOL_CACHE
 
     if len(js_rat) == 6:
         j1,j2,j3,j4,j5,j6 = js_rat
-        return wigner_6j(j1, j2, j3, j4, j5, j6)
+        key, phase = canonical_6j(*js_rat)
+        return cache.lookup(key, phase, lambda: wigner_6j(j1, j2, j3, j4, j5, j6))
     elif len(js_rat) == 9:
-        try:
-            from sympy.physics.wigner import wigner_9j
-        except ImportError:
-            raise NotImplementedError("9-j not implemented in this Sympy build.")
-        j1,j2,j3,j4,j5,j6,j7,j8,j9 = js_rat
-        return wigner_9j(j1,j2,j3, j4,j5,j6, j7,j8,j9)
+        key, phase = canonical_9j(*js_rat)
+        return cache.lookup(key, phase, lambda: _admissible_ninej(js_rat))
     else:
         raise NotImplementedError(f"generate_3nj only supports 6-j and 9-j, not {len(js)}-j.")
 
+def _admissible_ninej(js_rat):
+    if not ninej_parity_ok(*js_rat):
+        raise ValueError("j values must be integer or half integer and fulfill the triangle relation")
+    return ninej(*js_rat)
+
 def recursion_3nj(*js):
     """
     Compute the Wigner 3nj symbol via explicit Racah summation
     (independent of sympy.physics.wigner).
     Supports:
-      - 6-j: using Racah's formula with exact summation bounds
-      - 9-j: delegated to sympy.physics.wigner.wigner_9j if available
+      - 6-j: using Racah's formula with exact summation bounds, summed in
+        Python integers by su2_3nj_gen.racah
+      - 9-j: single sum over 6-j symbols by su2_3nj_gen.ninej
     
     Returns 0 for triangle inequality violations (mathematical convention).
-    Raises ValueError for invalid spins (non-half-integers).
+    Raises ValueError for invalid spins (non-half-integers), and for 9-j
+    symbols with a row or column of non-integer spin sum.
     """
     js_rat = [sp.Rational(j) for j in js]
     if len(js_rat) == 6:
@@ -54,6 +72,11 @@ def recursion_3nj(*js):
         ]):
             return sp.Rational(0)
 
+        # Integer-arithmetic engine for every admissible symbol; the sympy
+        # sum below only sees triads with half-integer spin sums.
+        if triads_integral(*js_rat):
+            return racah_6j(*js_rat)
+
         # Δ coefficient
         def delta(a, b, c):
             return sp.sqrt(
@@ -105,12 +128,7 @@ def recursion_3nj(*js):
         return prefactor * total
 
     elif len(js_rat) == 9:
-        try:
-            from sympy.physics.wigner import wigner_9j
-        except ImportError:
-            raise NotImplementedError("9-j not implemented in this Sympy build.")
-        j1,j2,j3,j4,j5,j6,j7,j8,j9 = js_rat
-        return wigner_9j(j1,j2,j3, j4,j5,j6, j7,j8,j9)
+        return _admissible_ninej(js_rat)
 
     else:
         raise NotImplementedError(f"recursion_3nj only supports 6-j and 9-j, not {len(js)}-j.")
@@ -0,0 +1,74 @@
+import warnings
+from math import factorial
+
+import numpy as np
+import pytest
+import sympy as sp
+from su2_3nj_gen.cauchy import G_coefficients_fft, G_function, cauchy_coefficients
+from su2_3nj_gen.generating_functional import G_numeric
+from su2_3nj_gen.series import G_series
+
+
+x, y = sp.symbols("x y")
+SIX_J = [(0, 1, x), (1, 2, y), (2, 3, x)]
+
+
+def _series_box(edges, symbols, degree):
+    g = G_series(edges, symbols, len(symbols) * degree)
+    box = np.empty((degree + 1,) * len(symbols))
+    for idx in np.ndindex(box.shape):
+        box[idx] = float(g.coeff(idx))
+    return box
+
+
+def test_G_function_matches_G_numeric_on_reals():
+    f = G_function(SIX_J, [x, y])
+    pts = np.array([[0.1, 0.2], [-0.3, 0.25]])
+    np.testing.assert_allclose(f(pts).real, G_numeric(pts), rtol=1e-14)
+
+
+def test_G_function_masks_singular_points_without_warnings():
+    # det(I - K) = 1 + x^2 vanishes at x = i and is negative at x = 2i
+    f = G_function([(0, 1, x)], [x])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        out = f(np.array([[1j], [2j], [0.5]]))
+    assert np.isnan(out[:2]).all()
+    assert out[2] == pytest.approx(1 / np.sqrt(1.25))
+
+
+@pytest.mark.parametrize("degree", [4, 8])
+def test_6j_coefficients_within_error_estimate(degree):
+    result = G_coefficients_fft(SIX_J, [x, y], degree)
+    exact = _series_box(SIX_J, [x, y], degree)
+    assert result.coeffs.shape == (degree + 1, degree + 1)
+    assert np.all(np.abs(result.coeffs - exact) <= result.error)
+    assert result.error.max() < 1e-3
+
+
+def test_chain_with_four_variables():
+    xs = sp.symbols("x1:5")
+    edges = [(e, e + 1, xs[e]) for e in range(4)]
+    result = G_coefficients_fft(edges, list(xs), 3, n_points=12)
+    exact = _series_box(edges, list(xs), 3)
+    assert np.all(np.abs(result.coeffs - exact) <= result.error)
+
+
+def test_explicit_radius_and_generic_function():
+    # exp(x + 2y) has coefficients 2^b / (a! b!)
+    f = lambda z: np.exp(z[:, 0] + 2 * z[:, 1])
+    result = cauchy_coefficients(f, 2, 5, radius=0.5, n_points=24)
+    expected = np.array([[2.0 ** b / (factorial(a) * factorial(b)) for b in range(6)] for a in range(6)])
+    np.testing.assert_allclose(result.coeffs.real, expected, atol=1e-12)
+    assert result.radius == 0.5
+
+
+def test_radius_where_f_is_singular_raises():
+    f = lambda z: 1 / (1 - 4 * z[:, 0])
+    with pytest.raises(ValueError, match="not finite"):
+        cauchy_coefficients(f, 1, 4, radius=0.25, n_points=8)
+
+
+def test_n_points_must_exceed_degree():
+    with pytest.raises(ValueError):
+        cauchy_coefficients(lambda z: z[:, 0], 1, 5, n_points=5)
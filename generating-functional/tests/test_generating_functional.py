@@ -0,0 +1,85 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+import sympy as sp
+from su2_3nj_gen.generating_functional import G_exact, G_numeric, chain_det_I_minus_K, slogdet_I_minus_K
+from su2_3nj_gen.graph import build_K_symbolic
+
+
+def test_G_numeric_matches_exact():
+    x, y = sp.Rational(1, 3), sp.Rational(-1, 4)
+    assert G_numeric([float(x), float(y)]) == pytest.approx(float(G_exact([x, y])), rel=1e-13)
+
+
+def test_G_numeric_batched_matches_pointwise():
+    rng = np.random.default_rng(0)
+    xs = rng.uniform(-0.9, 0.9, size=(500, 2))
+    values = G_numeric(xs)
+    assert values.shape == (500,)
+    np.testing.assert_allclose(values, [G_numeric(list(x)) for x in xs], rtol=1e-14)
+
+
+def test_G_numeric_empty_batch():
+    assert G_numeric(np.zeros((0, 2))).shape == (0,)
+
+
+def test_G_numeric_rejects_bad_shape():
+    with pytest.raises(ValueError, match="shape"):
+        G_numeric(np.zeros((3, 3)))
+
+
+def test_cholesky_method_matches_lu():
+    rng = np.random.default_rng(1)
+    xs = rng.uniform(-0.9, 0.9, size=(200, 2))
+    np.testing.assert_allclose(G_numeric(xs, method="cholesky"), G_numeric(xs), rtol=1e-13)
+
+
+def test_slogdet_matches_numpy_for_random_antisymmetric():
+    rng = np.random.default_rng(2)
+    A = rng.normal(size=(10, 30, 30))
+    K = A - np.swapaxes(A, -1, -2)
+    sign, logdet = slogdet_I_minus_K(K)
+    ref_sign, ref_logdet = np.linalg.slogdet(np.eye(30) - K)
+    np.testing.assert_array_equal(sign, ref_sign)
+    np.testing.assert_allclose(logdet, ref_logdet, rtol=1e-10)
+
+
+def test_G_numeric_rejects_unknown_method():
+    with pytest.raises(ValueError, match="Unknown method"):
+        G_numeric([0.1, 0.2], method="qr")
+
+
+def test_chain_det_symbolic_matches_dense_det():
+    xs = sp.symbols("x1:8")
+    K = build_K_symbolic([(k, k + 1, x) for k, x in enumerate(xs)])
+    dense = sp.expand((sp.eye(8) - K).det())
+    assert sp.expand(chain_det_I_minus_K(xs) - dense) == 0
+
+
+def test_chain_det_exact_rationals():
+    xs = [Fraction(1, 2), Fraction(-2, 3), 3]
+    K = build_K_symbolic([(k, k + 1, sp.Rational(x.numerator, x.denominator)) for k, x in enumerate(map(Fraction, xs))])
+    result = chain_det_I_minus_K(xs)
+    assert isinstance(result, Fraction)
+    assert result == Fraction(str((sp.eye(4) - K).det()))
+
+
+def test_chain_det_numeric_batched():
+    rng = np.random.default_rng(2)
+    xs = rng.uniform(-1, 1, size=(50, 6))
+    dense = np.eye(7) - np.array([_chain_K(x) for x in xs])
+    np.testing.assert_allclose(chain_det_I_minus_K(xs), np.linalg.det(dense), rtol=1e-12)
+    assert chain_det_I_minus_K(list(xs[0])) == pytest.approx(np.linalg.det(dense[0]), rel=1e-12)
+
+
+def test_chain_det_matches_6j_example():
+    x, y = 0.3, -0.7
+    assert chain_det_I_minus_K([x, y, x]) ** -0.5 == pytest.approx(G_numeric([x, y]), rel=1e-14)
+
+
+def _chain_K(xs):
+    K = np.zeros((len(xs) + 1, len(xs) + 1))
+    for k, x in enumerate(xs):
+        K[k, k + 1], K[k + 1, k] = x, -x
+    return K
@@ -0,0 +1,70 @@
+import math
+import numpy as np
+import pytest
+import sympy as sp
+from su2_3nj_gen.generating_functional import G_numeric, _build_K_symbolic
+from su2_3nj_gen.graph import build_K_symbolic
+
+scipy = pytest.importorskip("scipy")
+
+from su2_3nj_gen.graph import (  # noqa: E402
+    G_graph_numeric,
+    build_K_sparse,
+    det_I_minus_K_sparse,
+    sparse_slogdet_I_minus_K,
+)
+
+
+def _six_j_edges(x1, x2):
+    return [(0, 1, x1), (1, 2, x2), (2, 3, x1)]
+
+
+def test_symbolic_matches_hand_built_6j():
+    x, y = sp.symbols("x y")
+    assert sp.Matrix(build_K_symbolic(_six_j_edges(x, y))) == _build_K_symbolic([x, y])
+
+
+def test_sparse_matches_dense_6j():
+    K = build_K_sparse(_six_j_edges(0.3, -0.2))
+    assert K.format == "csr"
+    np.testing.assert_allclose(K.toarray(), -K.toarray().T)
+    assert G_graph_numeric(_six_j_edges(0.3, -0.2)) == pytest.approx(G_numeric([0.3, -0.2]), rel=1e-13)
+
+
+def test_values_override_symbolic_edges():
+    x, y = sp.symbols("x y")
+    det = det_I_minus_K_sparse(_six_j_edges(x, y), values=[0.3, -0.2, 0.3])
+    assert det == pytest.approx(G_numeric([0.3, -0.2]) ** -2, rel=1e-13)
+
+
+def test_det_overflow_gives_inf():
+    # The chain determinant grows like x^n.
+    edges = [(v, v + 1, 10.0) for v in range(1000)]
+    assert det_I_minus_K_sparse(edges) == math.inf
+    assert sparse_slogdet_I_minus_K(build_K_sparse(edges))[1] > 2000
+    assert G_graph_numeric(edges) == 0.0
+
+
+def test_random_graph_matches_dense_slogdet():
+    rng = np.random.default_rng(3)
+    n = 300
+    # A spanning tree plus random chords
+    edges = [(int(rng.integers(0, v)), v, float(rng.normal())) for v in range(1, n)]
+    edges += [(int(a), int(b), float(rng.normal())) for a, b in rng.integers(0, n, size=(200, 2)) if a != b]
+    K = build_K_sparse(edges)
+    sign, logdet = sparse_slogdet_I_minus_K(K)
+    ref_sign, ref_logdet = np.linalg.slogdet(np.eye(n) - K.toarray())
+    assert sign == ref_sign
+    assert logdet == pytest.approx(ref_logdet, rel=1e-10)
+    assert math.isfinite(logdet)
+
+
+def test_singular_matrix():
+    # det(I - K) > 0 for every real antisymmetric K, so use K = I directly.
+    K = scipy.sparse.csr_matrix(np.eye(3))
+    assert sparse_slogdet_I_minus_K(K) == (0.0, -math.inf)
+
+
+def test_rejects_self_loop():
+    with pytest.raises(ValueError, match="Self-loop"):
+        build_K_sparse([(1, 1, 0.5)])
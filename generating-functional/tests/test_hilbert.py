@@ -0,0 +1,48 @@
+import csv
+
+import pytest
+import sympy as sp
+from su2_3nj_gen.hilbert import hilbert_coefficient, iter_hilbert_coefficients, write_hilbert_table
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 6])
+def test_matches_sympy_series(n):
+    t = sp.symbols("t")
+    series = sp.series(1 / (1 - t**2) ** (n - 1), t, 0, 13).removeO()
+    expected = [int(series.coeff(t, k)) for k in range(13)]
+    assert list(iter_hilbert_coefficients(n, 12)) == expected
+    assert [hilbert_coefficient(n, k) for k in range(13)] == expected
+
+
+def test_large_n_and_degree_use_exact_integers():
+    coeffs = list(iter_hilbert_coefficients(1000, 20001))
+    assert len(coeffs) == 20002
+    assert coeffs[-1] == 0
+    assert coeffs[20000] == hilbert_coefficient(1000, 20000)
+
+
+def test_odd_max_degree_and_bad_arguments():
+    assert list(iter_hilbert_coefficients(3, 3)) == [1, 0, 2, 0]
+    with pytest.raises(ValueError):
+        list(iter_hilbert_coefficients(0, 4))
+    with pytest.raises(ValueError):
+        hilbert_coefficient(2, -1)
+
+
+def test_write_table_layout(tmp_path):
+    path = tmp_path / "h.csv"
+    assert write_hilbert_table(path, range(2, 5), 4) == 5
+    with open(path, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["Degree", "n=2", "n=3", "n=4"]
+    assert rows[3] == ["deg 2", "1", "2", "3"]
+    assert rows[5] == ["deg 4", "1", "3", "6"]
+
+
+def test_write_table_even_only(tmp_path):
+    path = tmp_path / "h.csv"
+    assert write_hilbert_table(path, [4], 6, even_only=True) == 4
+    with open(path, newline="") as f:
+        rows = list(csv.reader(f))
+    assert [r[0] for r in rows[1:]] == ["deg 0", "deg 2", "deg 4", "deg 6"]
+    assert [r[1] for r in rows[1:]] == ["1", "3", "6", "10"]
@@ -0,0 +1,100 @@
+import itertools
+import random
+
+import pytest
+import sympy as sp
+from sympy.physics.wigner import wigner_6j, wigner_9j
+from su2_3nj_gen.memo import SymbolCache, canonical_6j, canonical_9j
+from su2_3nj_gen.su2_3nj import generate_3nj
+
+
+def _tetrahedral_images(j1, j2, j3, j4, j5, j6):
+    """The 24 column permutations and upper/lower swaps of a 6j symbol."""
+    cols = [(j1, j4), (j2, j5), (j3, j6)]
+    for perm in itertools.permutations(cols):
+        for flip in itertools.product([False, True], repeat=3):
+            if sum(flip) % 2:
+                continue
+            top = [b if f else a for (a, b), f in zip(perm, flip)]
+            bottom = [a if f else b for (a, b), f in zip(perm, flip)]
+            yield tuple(top + bottom)
+
+
+def _regge(j1, j2, j3, j4, j5, j6):
+    s = (j2 + j3 + j5 + j6) / 2
+    return (j1, s - j2, s - j3, j4, s - j5, s - j6)
+
+
+def test_6j_symmetries_share_key_and_value():
+    js = (3, 2, 2, 2, 3, 1)
+    key, phase = canonical_6j(*js)
+    value = wigner_6j(*js)
+    images = list(_tetrahedral_images(*js)) + list(_tetrahedral_images(*_regge(*js)))
+    for image in images:
+        assert canonical_6j(*image) == (key, 1)
+        assert wigner_6j(*image) == value
+
+
+def test_6j_distinct_values_get_distinct_keys():
+    seen = {}
+    vals = [sp.Rational(k, 2) for k in range(4)]
+    for js in itertools.product(vals, repeat=6):
+        try:
+            value = wigner_6j(*js)
+        except ValueError:
+            continue
+        key, _ = canonical_6j(*js)
+        assert seen.setdefault(key, value) == value
+
+
+def test_9j_symmetries_and_phase():
+    js = [1, 2, 1, sp.Rational(1, 2), sp.Rational(3, 2), 1, sp.Rational(3, 2), sp.Rational(3, 2), 1]
+    key, phase = canonical_9j(*js)
+    value = wigner_9j(*js)
+    rows = [js[0:3], js[3:6], js[6:9]]
+    rng = random.Random(0)
+    for _ in range(8):
+        rp, cp = rng.sample(range(3), 3), rng.sample(range(3), 3)
+        grid = [[rows[r][c] for c in cp] for r in rp]
+        if rng.random() < 0.5:
+            grid = [list(c) for c in zip(*grid)]
+        image = [x for row in grid for x in row]
+        k, p = canonical_9j(*image)
+        assert k == key
+        assert p * wigner_9j(*image) == phase * value
+
+
+def test_generate_3nj_hits_on_symmetric_requests():
+    cache = SymbolCache()
+    js = (2, 2, 1, 1, 2, 2)
+    first = generate_3nj(*js, cache=cache)
+    for image in _tetrahedral_images(*js):
+        assert generate_3nj(*image, cache=cache) == first
+    info = cache.cache_info()
+    assert info.misses == 1 and info.hits == 24 and info.currsize == 1
+    assert cache.hit_rate() == pytest.approx(24 / 25)
+
+
+def test_generate_3nj_9j_odd_permutation_through_cache():
+    cache = SymbolCache()
+    h = sp.Rational(1, 2)
+    # The spins sum to 3, so swapping two rows flips the sign.
+    js = [0, h, h, h, 0, h, h, h, 0]
+    swapped = js[3:6] + js[0:3] + js[6:9]
+    assert generate_3nj(*js, cache=cache) == sp.Rational(-1, 4)
+    assert generate_3nj(*swapped, cache=cache) == sp.Rational(1, 4)
+    assert cache.cache_info().hits == 1
+
+
+def test_cache_is_bounded_and_invalid_spins_bypass():
+    cache = SymbolCache(maxsize=2)
+    for j in (1, 2, 3):
+        generate_3nj(j, j, 0, j, j, 0, cache=cache)
+    assert len(cache) == 2
+    with pytest.raises(ValueError):
+        generate_3nj(0.3, 1, 1, 1, 1, 1, cache=cache)
+    assert len(cache) == 2
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 2, 0)
+    with pytest.raises(ValueError):
+        SymbolCache(maxsize=0)
@@ -0,0 +1,72 @@
+import random
+
+import pytest
+import sympy as sp
+from sympy.physics.wigner import wigner_9j
+from su2_3nj_gen.memo import SymbolCache
+from su2_3nj_gen.ninej import ninej, ninej_parity_ok, ninej_squared
+from su2_3nj_gen.su2_3nj import generate_3nj, recursion_3nj
+
+
+def _random_9js(count, seed, top=4):
+    rng = random.Random(seed)
+    vals = [sp.Rational(k, 2) for k in range(top)]
+    while count:
+        js = [rng.choice(vals) for _ in range(9)]
+        if ninej_parity_ok(*js):
+            count -= 1
+            yield js
+
+
+@pytest.mark.parametrize("js", list(_random_9js(25, seed=0)))
+def test_exact_matches_sympy(js):
+    assert sp.srepr(ninej(*js)) == sp.srepr(wigner_9j(*js))
+
+
+@pytest.mark.parametrize("js", list(_random_9js(10, seed=1)))
+def test_float_mode(js):
+    assert ninej(*js, exact=False) == pytest.approx(float(wigner_9j(*js)), abs=1e-14)
+
+
+def test_squared_pair_and_known_value():
+    assert ninej_squared(1, 1, 1, 1, 1, 1, 1, 1, 1) == (0, 0)
+    sign, square = ninej_squared(1, 2, 1, 1, 1, 1, 1, 1, 1)
+    assert sign * sp.sqrt(sp.Rational(square.numerator, square.denominator)) == wigner_9j(1, 2, 1, 1, 1, 1, 1, 1, 1)
+
+
+def test_larger_spins():
+    js = [5, 6, 7, 4, 6, 5, 3, 4, 5]
+    assert ninej(*js) == wigner_9j(*js)
+    assert ninej(*js, exact=False) == pytest.approx(float(wigner_9j(*js)), rel=1e-12)
+
+
+def test_triangle_violation_is_zero():
+    assert ninej(3, 1, 1, 1, 1, 1, 1, 1, 1) == 0
+    assert ninej(3, 1, 1, 1, 1, 1, 1, 1, 1, exact=False) == 0.0
+    assert recursion_3nj(3, 1, 1, 1, 1, 1, 1, 1, 1) == 0
+
+
+def test_parity_violation_raises_like_sympy():
+    h = sp.Rational(1, 2)
+    assert not ninej_parity_ok(h, h, h, 1, 1, 1, 1, 1, 1)
+    with pytest.raises(ValueError, match="triangle relation"):
+        generate_3nj(h, h, h, 1, 1, 1, 1, 1, 1, cache=SymbolCache())
+    with pytest.raises(ValueError, match="triangle relation"):
+        recursion_3nj(h, h, h, 1, 1, 1, 1, 1, 1)
+
+
+def test_six_j_cache_is_shared_between_calls():
+    cache = SymbolCache()
+    ninej(2, 2, 2, 2, 2, 2, 2, 2, 2, cache=cache)
+    misses = cache.cache_info().misses
+    ninej(2, 2, 2, 2, 2, 2, 2, 2, 2, exact=False, cache=cache)
+    info = cache.cache_info()
+    assert info.misses == misses
+    assert info.hits > 0
+
+
+def test_routes_through_engine():
+    js = [1, 2, 1, sp.Rational(1, 2), sp.Rational(3, 2), 1, sp.Rational(3, 2), sp.Rational(3, 2), 1]
+    expected = wigner_9j(*js)
+    assert generate_3nj(*js, cache=SymbolCache()) == expected
+    assert recursion_3nj(*js) == expected
@@ -0,0 +1,47 @@
+import itertools
+from fractions import Fraction
+
+import pytest
+import sympy as sp
+from sympy.physics.wigner import wigner_6j
+from su2_3nj_gen.racah import racah_6j, racah_6j_squared, triads_integral
+from su2_3nj_gen.su2_3nj import recursion_3nj
+
+
+HALF = [sp.Rational(k, 2) for k in range(4)]
+
+
+@pytest.mark.parametrize("js", [
+    js for js in itertools.product(HALF, repeat=6)
+    if triads_integral(*js) and wigner_6j(*js) != 0
+][::37])
+def test_racah_6j_matches_sympy(js):
+    assert sp.simplify(racah_6j(*js) - wigner_6j(*js)) == 0
+
+
+def test_squared_pair():
+    sign, square = racah_6j_squared(1, 1, 1, 1, 1, 1)
+    assert (sign, square) == (1, Fraction(1, 36))
+    sign, square = racah_6j_squared(sp.Rational(1, 2), sp.Rational(1, 2), 1, sp.Rational(1, 2), sp.Rational(1, 2), 1)
+    assert (sign, square) == (1, Fraction(1, 36))
+    assert racah_6j_squared(1, 1, 3, 0, 0, 0) == (0, Fraction(0))
+
+
+def test_large_spins_against_sympy():
+    js = (10, 12, 14, 11, 13, 9)
+    assert sp.simplify(racah_6j(*js) - wigner_6j(*js)) == 0
+    sign, square = racah_6j_squared(*js)
+    assert sign * float(square) ** 0.5 == pytest.approx(float(wigner_6j(*js)), rel=1e-13)
+
+
+def test_recursion_3nj_unchanged_for_half_integer_triads():
+    # Such triads have no integral summation bounds; the old error stays.
+    with pytest.raises(ValueError, match="not integral"):
+        recursion_3nj(*[sp.Rational(1, 2)] * 6)
+
+
+def test_invalid_spin():
+    with pytest.raises(ValueError, match="Invalid spin"):
+        racah_6j_squared(sp.Rational(1, 3), 1, 1, 1, 1, 1)
+    with pytest.raises(ValueError):
+        racah_6j_squared(1, 1, 1)
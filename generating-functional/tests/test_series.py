@@ -0,0 +1,81 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+import sympy as sp
+from su2_3nj_gen.generating_functional import G_exact
+from su2_3nj_gen.series import G_series, TruncatedSeries, series_det
+
+
+x, y = sp.symbols("x y")
+
+
+def _sympy_coeffs(expr, degree):
+    """Coefficients of a two-variable expression up to total degree, via sympy."""
+    ser = sp.expand(sp.series(sp.series(expr, x, 0, degree + 1).removeO(), y, 0, degree + 1).removeO())
+    return {(a, b): ser.coeff(x, a).coeff(y, b) for a in range(degree + 1) for b in range(degree + 1 - a)}
+
+
+def test_multiplication_truncates_total_degree():
+    s = TruncatedSeries.from_sympy(1 + x + y, [x, y], 3)
+    cube = s ** 3
+    assert cube.to_sympy([x, y]) == sp.expand((1 + x + y) ** 3)
+    fourth = sp.Poly(sp.expand((1 + x + y) ** 4), x, y)
+    kept = sum(c * x ** a * y ** b for (a, b), c in fourth.terms() if a + b <= 3)
+    assert (s ** 4).to_sympy([x, y]) == kept
+    with pytest.raises(ValueError, match="exceeds truncation degree"):
+        s.coeff((2, 2))
+
+
+def test_inverse_and_inv_sqrt_exact():
+    a = TruncatedSeries.from_sympy(1 - x - 2 * x * y + 3 * y ** 2, [x, y], 6)
+    one = TruncatedSeries.constant(1, 2, 6)
+    assert np.all((a * a.inverse() - one).coeffs == 0)
+    r = a.inv_sqrt()
+    assert np.all((r * r * a - one).coeffs == 0)
+    assert isinstance(r.coeff((1, 1)), Fraction)
+
+
+def test_inv_sqrt_rational_square_constant():
+    a = TruncatedSeries.from_sympy(sp.Rational(9, 4) + x, [x, y], 4)
+    assert a.inv_sqrt().coeff((0, 0)) == Fraction(2, 3)
+    with pytest.raises(ValueError, match="rational square"):
+        TruncatedSeries.from_sympy(2 + x, [x, y], 4).inv_sqrt()
+
+
+def test_series_det_matches_sympy():
+    M = sp.Matrix([[1 + x, y, 0], [x * y, 1, -x], [2, y, 1 - y]])
+    S = [[TruncatedSeries.from_sympy(e, [x, y], 5) for e in row] for row in M.tolist()]
+    assert series_det(S).to_sympy([x, y]) == sp.expand(M.det())
+
+
+def test_series_det_pivots_on_zero_constant():
+    M = sp.Matrix([[x, 1], [1, y]])
+    S = [[TruncatedSeries.from_sympy(e, [x, y], 3) for e in row] for row in M.tolist()]
+    assert series_det(S).to_sympy([x, y]) == sp.expand(M.det())
+
+
+def test_G_series_6j_matches_sympy_series():
+    g = G_series([(0, 1, x), (1, 2, y), (2, 3, x)], [x, y], 6)
+    for exps, expected in _sympy_coeffs(G_exact([x, y]), 6).items():
+        c = g.coeff(exps)
+        assert sp.Rational(c.numerator, c.denominator) == expected
+
+
+def test_G_series_float_mode():
+    g_exact = G_series([(0, 1, x), (1, 2, y), (2, 3, x)], [x, y], 6)
+    g_float = G_series([(0, 1, x), (1, 2, y), (2, 3, x)], [x, y], 6, exact=False)
+    assert g_float.coeffs.dtype == np.float64
+    np.testing.assert_allclose(g_float.coeffs, g_exact.coeffs.astype(float))
+
+
+def test_G_series_15j_chain_coefficient():
+    xs = sp.symbols("x1:8")
+    g = G_series([(e, e + 1, xs[e]) for e in range(7)], list(xs), 4)
+    assert g.coeff((0,) * 7) == 1
+    assert g.coeff((2, 0, 0, 0, 0, 0, 0)) == Fraction(-1, 2)
+
+
+def test_mixed_exactness_rejected():
+    with pytest.raises(ValueError, match="exactness"):
+        TruncatedSeries.constant(1, 2, 3) + TruncatedSeries.constant(1.0, 2, 3, exact=False)
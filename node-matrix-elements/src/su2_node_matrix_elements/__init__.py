@@ -12,6 +12,7 @@ from .model import (
     validate_spins,
     build_K,
     det_I_minus_K,
+    slogdet_I_minus_K,
     node_matrix_element,
 )
 
@@ -29,6 +30,7 @@ __all__ = [
     "validate_spins",
     "build_K",
     "det_I_minus_K",
+    "slogdet_I_minus_K",
     "node_matrix_element",
     "stability_metrics",
     "DerivativeConfig",
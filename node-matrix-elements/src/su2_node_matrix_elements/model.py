@@ -8,6 +8,7 @@ import sympy as sp
 
 
 Backend = Literal["numpy", "sympy"]
+DetBackend = Literal["numpy", "sympy", "cholesky"]
 
 
 class SpinDomainError(ValueError):
@@ -81,17 +82,47 @@ def build_K(spins: Sequence, *, backend: Backend = "numpy"):
     raise ValueError(f"Unknown backend: {backend}")
 
 
+def slogdet_I_minus_K(spins: Sequence, *, epsilon: float = 1e-10) -> tuple[float, float]:
+    """Compute sign and log|det(I - K + eps I)| by Cholesky.
+
+    For antisymmetric K and a = 1 + eps > 0,
+
+        det(a I - K)^2 = det(a^2 I + K^T K),
+
+    the right-hand matrix is symmetric positive definite and det(a I - K)
+    is positive. The log-determinant is therefore the sum of the logs of
+    the Cholesky diagonal, which does not overflow or underflow for large
+    spins. The return value follows np.linalg.slogdet; the sign is always 1.
+    """
+
+    if epsilon < 0:
+        raise ValueError("epsilon must be non-negative")
+
+    K = build_K(spins, backend="numpy")
+    a = 1.0 + epsilon
+    A = (a * a) * np.eye(len(spins)) + K.T @ K
+    L = np.linalg.cholesky(A)
+    return 1.0, float(np.sum(np.log(np.diag(L))))
+
+
 def det_I_minus_K(
     spins: Sequence,
     *,
     epsilon: float = 1e-10,
-    backend: Backend = "numpy",
+    backend: DetBackend = "numpy",
 ) -> float | sp.Expr:
-    """Compute det(I - K + eps I)."""
+    """Compute det(I - K + eps I).
+
+    backend="cholesky" evaluates it as exp of slogdet_I_minus_K.
+    """
 
     if epsilon < 0:
         raise ValueError("epsilon must be non-negative")
 
+    if backend == "cholesky":
+        sign, logdet = slogdet_I_minus_K(spins, epsilon=epsilon)
+        return sign * float(np.exp(logdet))
+
     K = build_K(spins, backend=backend)
     n = len(spins)
 
@@ -108,7 +139,7 @@ def node_matrix_element(
     *,
     spins: Sequence,
     epsilon: float = 1e-10,
-    backend: Backend = "numpy",
+    backend: DetBackend = "numpy",
     det_power: int = 1,
 ) -> float:
     """Compute a simplified determinant-based node matrix element.
@@ -126,6 +157,11 @@ def node_matrix_element(
     if det_power <= 0:
         raise ValueError("det_power must be positive")
 
+    if backend == "cholesky":
+        # Stay in log form so large determinants do not overflow first.
+        _, logdet = slogdet_I_minus_K(spins, epsilon=epsilon)
+        return float(np.exp(-det_power * logdet))
+
     det_val = det_I_minus_K(spins, epsilon=epsilon, backend=backend)
     if backend == "sympy":
         det_val = float(sp.N(det_val, 50))
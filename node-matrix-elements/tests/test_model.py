@@ -9,6 +9,7 @@ from su2_node_matrix_elements.model import (
     validate_spins,
     build_K,
     det_I_minus_K,
+    slogdet_I_minus_K,
     node_matrix_element,
 )
 
@@ -88,3 +89,29 @@ def test_epsilon_regularization_changes_smoothly():
 def test_det_power_validation():
     with pytest.raises(ValueError):
         node_matrix_element(spins=[1, 1, 1], det_power=0)
+
+
+def test_cholesky_slogdet_matches_numpy_det():
+    for spins in ([1, 1, 0], [0.5, 1, 1.5, 2], [0, 1, 2, 3], [3, 2.5, 1, 0.5, 2]):
+        sign, logdet = slogdet_I_minus_K(spins, epsilon=1e-10)
+        assert sign == 1.0
+        det_np = det_I_minus_K(spins, epsilon=1e-10, backend="numpy")
+        assert np.isclose(np.exp(logdet), det_np, rtol=1e-12)
+        assert np.isclose(det_I_minus_K(spins, epsilon=1e-10, backend="cholesky"), det_np, rtol=1e-12)
+
+
+def test_cholesky_node_matrix_element_matches_numpy():
+    spins = [1, 2, 0.5, 1.5]
+    for det_power in (1, 2):
+        val_np = node_matrix_element(spins=spins, det_power=det_power, backend="numpy")
+        val_ch = node_matrix_element(spins=spins, det_power=det_power, backend="cholesky")
+        assert np.isclose(val_ch, val_np, rtol=1e-12)
+
+
+def test_cholesky_large_spins_do_not_overflow():
+    spins = [10000] * 40
+    with np.errstate(over="ignore"):
+        assert not np.isfinite(det_I_minus_K(spins, backend="numpy"))
+    _, logdet = slogdet_I_minus_K(spins)
+    assert np.isfinite(logdet)
+    assert 0.0 <= node_matrix_element(spins=spins, backend="cholesky") < 1e-300
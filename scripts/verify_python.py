@@ -25,6 +25,7 @@ import math
 import sys
 from dataclasses import dataclass
 from fractions import Fraction
+from pathlib import Path
 from typing import Iterable, Tuple
 
 try:
@@ -34,6 +35,15 @@ except Exception as exc:  # pragma: no cover
     print("Install with: pip install mpmath")
     sys.exit(1)
 
+# Exact Fibonacci ratios are shared with the closedform package.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "closedform" / "src"))
+try:
+    from su2_3nj_closedform.coefficient_calculator import fib_ratio
+except Exception as exc:  # pragma: no cover
+    print("[FAIL] su2_3nj_closedform import failed:", exc)
+    print("Install with: pip install -e closedform")
+    sys.exit(1)
+
 
 @dataclass(frozen=True)
 class Spin:
@@ -408,19 +418,12 @@ def run() -> int:
     # 2F1(-2, 1/2; 1; z) = 1 - z + z^2/4 (truncated at a=-2).
     # Verified to 50 dps in verify_wolfram.wls.
 
-    phi = mp.mpf("1.6180339887498948482045868343656381177203091798058")
-
-    def fib_mp(n: int) -> mp.mpf:
-        """Golden-ratio Fibonacci (exact for integer n >= 0)."""
-        if n == 0:
-            return mp.mpf(0)
-        return (phi ** n - (-phi) ** (-n)) / mp.sqrt(5)
-
     def hyper15j(js: list) -> mp.mpf:
         """Hypergeometric product formula for the 15j chain (Eq. (app:15j-chain))."""
         prod = mp.mpf(1)
         for idx, j in enumerate(js, start=1):  # e = 1..len(js)
-            rho = fib_mp(idx - 1) / fib_mp(idx)
+            ratio = fib_ratio(idx - 1, exact=True)  # F_{e-1} / F_e
+            rho = mp.mpf(ratio.numerator) / ratio.denominator
             twoj = int(round(2 * j))
             factor = mp.mpf(1) / mp.factorial(twoj) * mp.hyper(
                 [-mp.mpf(twoj), mp.mpf("0.5")], [mp.mpf(1)], -rho